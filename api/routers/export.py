@@ -0,0 +1,108 @@
+"""
+데이터 내보내기 API 라우터 (NDJSON / CSV 스트리밍)
+"""
+
+from datetime import date
+from typing import Optional
+
+import anyio
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from core.database import DatabaseManager
+from services.export import ExportService, ExportStream, MEDIA_TYPES, export_filename
+
+router = APIRouter(
+    prefix="/export",
+    tags=["Data Export"],
+)
+
+FORMAT_PATTERN = "^(ndjson|csv)$"
+
+
+async def get_db_manager() -> DatabaseManager:
+    """프로세스 전역 DatabaseManager(커넥션 풀 포함) 인스턴스를 제공합니다."""
+    return DatabaseManager()
+
+
+async def get_export_service(
+    db_manager: DatabaseManager = Depends(get_db_manager),
+) -> ExportService:
+    """ExportService 인스턴스를 생성하고 제공합니다."""
+    return ExportService(db_manager)
+
+
+class _ExportResponse(StreamingResponse):
+    """본문을 다 보내지 못하고 끝나도(본문 전송 전 연결 종료 포함) 내보내기 스트림을 닫는 응답"""
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self.body_iterator.aclose()
+
+
+def _streaming_response(stream: ExportStream, filename: str, fmt: str, compress: bool) -> StreamingResponse:
+    return _ExportResponse(
+        stream,
+        media_type="application/gzip" if compress else MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    "/vocabulary",
+    summary="Stream word_book Export (NDJSON/CSV, optional gzip)",
+)
+async def export_vocabulary(
+    start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD, 포함)"),
+    end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD, 포함)"),
+    format: str = Query("ndjson", pattern=FORMAT_PATTERN, description="ndjson 또는 csv"),
+    gzip: bool = Query(False, description="gzip 압축 파일로 받기"),
+    service: ExportService = Depends(get_export_service),
+):
+    """
+    단어장을 날짜순으로 스트리밍합니다. 날짜 범위를 생략하면 전체를 내보냅니다.
+    """
+    stream = await service.export_words(start_date, end_date, format, gzip)
+    filename = export_filename("word_book", format, gzip, start_date, end_date)
+    return _streaming_response(stream, filename, format, gzip)
+
+
+@router.get(
+    "/test-results",
+    summary="Stream test_result Export (NDJSON/CSV, optional gzip)",
+)
+async def export_test_results(
+    twi_id: Optional[int] = Query(None, description="시험 주차 ID"),
+    u_id: Optional[int] = Query(None, description="사용자 ID"),
+    format: str = Query("ndjson", pattern=FORMAT_PATTERN, description="ndjson 또는 csv"),
+    gzip: bool = Query(False, description="gzip 압축 파일로 받기"),
+    service: ExportService = Depends(get_export_service),
+):
+    """
+    시험 결과(점수)를 주차/사용자별로 스트리밍합니다. 필터를 생략하면 전체를 내보냅니다.
+    """
+    stream = await service.export_test_results(twi_id, u_id, format, gzip)
+    filename = export_filename("test_result", format, gzip, twi_id and f"w{twi_id}", u_id and f"u{u_id}")
+    return _streaming_response(stream, filename, format, gzip)
+
+
+@router.get(
+    "/test-answers",
+    summary="Stream test_answers Export (NDJSON/CSV, optional gzip)",
+)
+async def export_test_answers(
+    twi_id: Optional[int] = Query(None, description="시험 주차 ID"),
+    u_id: Optional[int] = Query(None, description="사용자 ID"),
+    format: str = Query("ndjson", pattern=FORMAT_PATTERN, description="ndjson 또는 csv"),
+    gzip: bool = Query(False, description="gzip 압축 파일로 받기"),
+    service: ExportService = Depends(get_export_service),
+):
+    """
+    문항별 답안을 주차/사용자별로 스트리밍합니다. 필터를 생략하면 전체를 내보냅니다.
+    """
+    stream = await service.export_test_answers(twi_id, u_id, format, gzip)
+    filename = export_filename("test_answers", format, gzip, twi_id and f"w{twi_id}", u_id and f"u{u_id}")
+    return _streaming_response(stream, filename, format, gzip)
@@ -0,0 +1,23 @@
+"""
+모니터링 API 라우터 (Prometheus 스크랩용)
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from core.metrics import REGISTRY
+
+router = APIRouter(tags=["Monitoring"])
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus Metrics",
+    description="SQL 문별 지연 시간/행 수 히스토그램과 커넥션 풀·캐시 게이지를 Prometheus 텍스트 포맷으로 반환합니다.",
+)
+def get_metrics():
+    """프로세스 내 메트릭을 Prometheus 텍스트 포맷으로 반환합니다."""
+    return PlainTextResponse(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, Query
+from functools import partial
+from fastapi import APIRouter, Depends, Query, Request
 from core.database import DatabaseManager
+from core.http_cache import accepts_gzip, conditional_json
 from services.test_weeks import TestWeekService
 from schemas.test_weeks import TestWeekListResponse, TestWeekWordsResponse
 
@@ -9,12 +11,13 @@ router = APIRouter(
 )
 
 
-def get_db_manager() -> DatabaseManager:
-    """DatabaseManager 인스턴스를 생성하고 제공합니다."""
+# 의존성도 async def로 선언하여 요청마다 스레드풀을 거치지 않도록 합니다.
+async def get_db_manager() -> DatabaseManager:
+    """프로세스 전역 DatabaseManager(커넥션 풀 포함) 인스턴스를 제공합니다."""
     return DatabaseManager()
 
 
-def get_test_week_service(
+async def get_test_week_service(
     db_manager: DatabaseManager = Depends(get_db_manager),
 ) -> TestWeekService:
     """TestWeekService 인스턴스를 생성하고 제공합니다."""
@@ -26,7 +29,8 @@ def get_test_week_service(
     response_model=TestWeekListResponse,
     summary="Get All Test Weeks",
 )
-def get_test_weeks(
+async def get_test_weeks(
+    request: Request,
     limit: int = Query(10, ge=1, le=50, description="Maximum number of weeks to return"),
     order: str = Query("desc", pattern="^(desc|asc)$", description="Sort order (desc=newest first, asc=oldest first)"),
     service: TestWeekService = Depends(get_test_week_service),
@@ -34,7 +38,12 @@ def get_test_weeks(
     """
     시험 주차 목록을 조회합니다.
     """
-    return service.get_all_test_weeks(limit, order)
+    return await conditional_json(
+        request,
+        service.db,
+        partial(service.get_all_test_weeks_validator, limit, order),
+        partial(service.get_all_test_weeks_json, limit, order),
+    )
 
 
 @router.get(
@@ -42,11 +51,18 @@ def get_test_weeks(
     response_model=TestWeekWordsResponse,
     summary="Get Words for a Specific Test Week",
 )
-def get_test_week_words(
+async def get_test_week_words(
+    request: Request,
     twi_id: int,
     service: TestWeekService = Depends(get_test_week_service),
 ):
     """
     특정 주차의 단어 목록을 조회합니다.
     """
-    return service.get_test_week_words(twi_id)
+    # ETag / Last-Modified가 같으면 304, 아니면 시험 단어 생성 때 저장된 스냅샷(JSON 또는 gzip)을 그대로 응답
+    return await conditional_json(
+        request,
+        service.db,
+        partial(service.get_test_week_words_validator, twi_id),
+        partial(service.get_test_week_words_json, twi_id, compress=accepts_gzip(request)),
+    )
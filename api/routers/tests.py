@@ -1,5 +1,10 @@
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import StreamingResponse
+from core.availability import get_availability_snapshot
 from core.database import DatabaseManager
+from core.serialization import ORJSONResponse
+from services.availability_stream import get_availability_broadcaster
 from services.tests import TestService
 from schemas.tests import (
     TestStartRequest,
@@ -17,12 +22,13 @@ router = APIRouter(
 )
 
 
-def get_db_manager() -> DatabaseManager:
-    """DatabaseManager 인스턴스를 생성하고 제공합니다."""
+# 의존성도 async def로 선언하여 요청마다 스레드풀을 거치지 않도록 합니다.
+async def get_db_manager() -> DatabaseManager:
+    """프로세스 전역 DatabaseManager(커넥션 풀 포함) 인스턴스를 제공합니다."""
     return DatabaseManager()
 
 
-def get_test_service(
+async def get_test_service(
     db_manager: DatabaseManager = Depends(get_db_manager),
 ) -> TestService:
     """TestService 인스턴스를 생성하고 제공합니다."""
@@ -35,14 +41,14 @@ def get_test_service(
     status_code=status.HTTP_201_CREATED,
     summary="Start a New Test",
 )
-def start_test(
+async def start_test(
     request: TestStartRequest,
     service: TestService = Depends(get_test_service),
 ):
     """
     시험을 시작합니다. 이미 시험 기록이 있으면 재시험으로 처리됩니다.
     """
-    return service.start_test(request)
+    return await service.db.run_sync(service.start_test, request)
 
 
 @router.post(
@@ -50,7 +56,7 @@ def start_test(
     response_model=TestSubmitResponse,
     summary="Submit Test Answers and Get Results",
 )
-def submit_test(
+async def submit_test(
     tr_id: int,
     request: TestSubmitRequest,
     service: TestService = Depends(get_test_service),
@@ -58,7 +64,7 @@ def submit_test(
     """
     답안을 제출하고 자동 채점 결과를 받습니다.
     """
-    return service.submit_test(tr_id, request)
+    return await service.db.run_sync(service.submit_test, tr_id, request)
 
 
 @router.get(
@@ -66,14 +72,45 @@ def submit_test(
     response_model=TestAvailabilityResponse,
     summary="Check Current Test Availability",
 )
-def get_current_availability(
+async def get_current_availability(
+    response: Response,
     service: TestService = Depends(get_test_service),
 ):
     """
     현재 시험 가능 여부를 확인합니다.
     시험 시간(토요일 10:10~10:25) 내라면 is_available=True를 반환합니다.
+    주차 정보는 메모리 스냅샷에서 읽고, 다음 전환 시점까지를 Cache-Control max-age로 알려줍니다.
     """
-    return service.get_current_availability()
+    snapshot = get_availability_snapshot()
+    if not snapshot.is_fresh():
+        # 만료된 경우에만 스레드풀에서 DB 조회
+        await service.db.run_sync(snapshot.refresh, service.db)
+
+    now = datetime.now()
+    # 갱신된 인덱스를 넘겨 이벤트 루프에서 DB를 조회하지 않도록 함
+    availability = service.get_current_availability(now, snapshot.index)
+    response.headers["Cache-Control"] = f"public, max-age={snapshot.max_age(now)}"
+    return availability
+
+
+@router.get(
+    "/availability/stream",
+    summary="Stream Test Availability Events (SSE)",
+)
+async def stream_availability():
+    """
+    시험 가능 여부를 Server-Sent Events로 받습니다. (폴링 대신 사용)
+    연결 직후 status 이벤트로 현재 상태를 보내고, 이후 시험 시작(open), 종료(close),
+    시험 중 분 단위 카운트다운(tick) 때마다 TestAvailabilityResponse JSON을 보냅니다.
+    """
+    broadcaster = get_availability_broadcaster()
+    await broadcaster.start()
+    return StreamingResponse(
+        broadcaster.events(),
+        media_type="text/event-stream",
+        # 프록시(nginx) 버퍼링 없이 바로 전달
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
@@ -81,7 +118,7 @@ def get_current_availability(
     response_model=TestHistoryResponse,
     summary="Get Test History for a User",
 )
-def get_test_history(
+async def get_test_history(
     u_id: int,
     service: TestService = Depends(get_test_service),
 ):
@@ -89,7 +126,8 @@ def get_test_history(
     사용자의 시험 기록 히스토리를 조회합니다.
     완료된 시험(test_score가 NULL이 아닌)만 반환됩니다.
     """
-    return service.get_test_history(u_id)
+    # DB 행을 검증 없이 직렬화 (response_model은 문서용)
+    return ORJSONResponse(await service.db.run_sync(service.get_test_history, u_id))
 
 
 @router.get(
@@ -97,7 +135,7 @@ def get_test_history(
     response_model=TestDetailResponse,
     summary="Get Detailed Test Results",
 )
-def get_test_detail(
+async def get_test_detail(
     tr_id: int,
     service: TestService = Depends(get_test_service),
 ):
@@ -105,7 +143,7 @@ def get_test_detail(
     특정 시험의 상세 결과를 조회합니다.
     시험 기본 정보와 각 문항별 답안을 포함합니다.
     """
-    return service.get_test_detail(tr_id)
+    return ORJSONResponse(await service.db.run_sync(service.get_test_detail, tr_id))
 
 
 @router.delete(
@@ -113,7 +151,7 @@ def get_test_detail(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete Test Record for Retake",
 )
-def delete_test(
+async def delete_test(
     tr_id: int,
     service: TestService = Depends(get_test_service),
 ):
@@ -121,5 +159,5 @@ def delete_test(
     시험 기록을 삭제합니다 (재시험을 위한).
     CASCADE 설정에 의해 test_answers도 함께 삭제됩니다.
     """
-    service.delete_test(tr_id)
+    await service.db.run_sync(service.delete_test, tr_id)
     return None
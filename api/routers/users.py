@@ -10,7 +10,7 @@ router = APIRouter(
 
 
 def get_db_manager() -> DatabaseManager:
-    """DatabaseManager 인스턴스를 생성하고 제공합니다."""
+    """프로세스 전역 DatabaseManager(커넥션 풀 포함) 인스턴스를 제공합니다."""
     return DatabaseManager()
 
 
@@ -1,8 +1,29 @@
-from fastapi import APIRouter, Depends, Query, status
-from typing import List, Dict
+from functools import partial
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from typing import List, Dict, Optional
 from core.database import DatabaseManager
-from services.vocabulary import VocabularyService
-from schemas.vocabulary import VocabularyCreate, VocabularyUpdate, VocabularyResponse, VocabularyListResponse
+from core.http_cache import conditional_json
+from core.serialization import ORJSONResponse
+from core.typo_index import MAX_DISTANCE
+from services.vocabulary import VocabularyService, MAX_BULK_ITEMS
+from services.vocabulary_import import (
+    DEFAULT_IMPORT_CHUNK_SIZE,
+    VocabularyImporter,
+    detect_format,
+)
+from schemas.vocabulary import (
+    VocabularyCreate,
+    VocabularyUpdate,
+    VocabularyResponse,
+    VocabularyListResponse,
+    VocabularyBulkResponse,
+    VocabularySearchResponse,
+    VocabularyLookupResponse,
+    VocabularyImportResponse,
+    VocabularyBatchRequest,
+    VocabularyBatchResponse,
+    VocabularyRangeResponse,
+)
 
 # FastAPI Router 인스턴스 생성
 router = APIRouter(
@@ -12,14 +33,15 @@ router = APIRouter(
 
 
 # Dependency: DatabaseManager 인스턴스를 제공합니다. (전역 스코프에서 초기화 방지)
-def get_db_manager() -> DatabaseManager:
-    """DatabaseManager 인스턴스를 생성하고 제공합니다."""
+# 의존성도 async def로 선언하여 요청마다 스레드풀을 거치지 않도록 합니다.
+async def get_db_manager() -> DatabaseManager:
+    """프로세스 전역 DatabaseManager(커넥션 풀 포함) 인스턴스를 제공합니다."""
     # 초기화는 의존성 시스템 내에서 이루어지므로, 멀티프로세싱 문제를 피할 수 있습니다.
     return DatabaseManager()
 
 
 # Dependency: VocabularyService 인스턴스를 각 요청에 제공합니다.
-def get_vocabulary_service(
+async def get_vocabulary_service(
     db_manager: DatabaseManager = Depends(get_db_manager),  # Manager 인스턴스에 의존
 ) -> VocabularyService:
     """VocabularyService 인스턴스를 생성하고 제공합니다."""
@@ -34,19 +56,86 @@ def get_vocabulary_service(
 @router.get(
     "/dates",
     response_model=List[str],
-    summary="Get Test Week Dates (This Saturday's Test Range)",
+    summary="Get Vocabulary Dates (Catalogue)",
 )
-def get_available_dates(
+async def get_available_dates(
+    request: Request,
+    twi_id: Optional[int] = Query(None, ge=1, description="시험 주차 ID (해당 주차 범위의 날짜만)"),
+    month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$", description="YYYY-MM (해당 월의 날짜만)"),
+    source: Optional[str] = Query(None, pattern="^(EBS|BBC)$", description="출처 (EBS / BBC)"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=500, description="최대 날짜 개수 (생략 시 전체, 호환용)"
+    ),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 X-Next-Cursor 헤더 값"
+    ),
     service: VocabularyService = Depends(get_vocabulary_service),
 ):
     """
-    이번주 토요일 시험 범위의 날짜 목록을 반환합니다.
-    test_week_info의 가장 최근 주차의 start_date ~ end_date 범위 내 날짜만 반환합니다.
+    단어가 있는 날짜 목록을 최신순으로 반환합니다.
+    시험 주차(twi_id), 월(month), 출처(source)로 거를 수 있고, limit을 주면
+    다음 페이지 커서를 X-Next-Cursor 응답 헤더로 돌려줍니다.
 
     Returns:
-        List[str]: 시험 범위 날짜 리스트 (YYYY-MM-DD 형식, 최신순)
+        List[str]: 날짜 리스트 (YYYY-MM-DD 형식, 최신순)
+    """
+    args = (twi_id, month, source, limit, cursor)
+    # ETag / Last-Modified가 같으면 304, 아니면 캐시된 JSON을 그대로 응답 (response_model 직렬화 생략)
+    return await conditional_json(
+        request,
+        service.db,
+        partial(service.get_distinct_dates_validator, *args),
+        partial(service.get_distinct_dates_json, *args),
+    )
+
+
+@router.get(
+    "/search",
+    response_model=VocabularySearchResponse,
+    summary="Search Vocabulary (English prefix / Korean meaning)",
+)
+async def search_vocabulary(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (영어 접두어 또는 한국어 뜻)"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of items to return"),
+    service: VocabularyService = Depends(get_vocabulary_service),
+):
+    """
+    인메모리 검색 인덱스로 단어를 검색합니다.
+    한글이 포함되면 뜻에서, 아니면 영어 표제어(구의 각 단어 포함) 접두어로 찾아 정확도 순으로 반환합니다.
     """
-    return service.get_distinct_dates()
+    return await service.db.run_sync(service.search_words, q, limit)
+
+
+@router.get(
+    "/autocomplete",
+    response_model=List[str],
+    summary="Autocomplete English Headwords",
+)
+async def autocomplete_vocabulary(
+    q: str = Query(..., min_length=1, max_length=100, description="영어 접두어"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
+    service: VocabularyService = Depends(get_vocabulary_service),
+):
+    """영어 접두어로 시작하는 표제어 후보를 짧은 순으로 반환합니다."""
+    return await service.db.run_sync(service.suggest_words, q, limit)
+
+
+@router.get(
+    "/lookup",
+    response_model=VocabularyLookupResponse,
+    summary="Typo-tolerant Headword Lookup (edit distance)",
+)
+async def lookup_vocabulary(
+    q: str = Query(..., min_length=1, max_length=100, description="찾을 영단어 (오타 허용)"),
+    max_distance: int = Query(2, ge=0, le=MAX_DISTANCE, description="허용할 최대 편집 거리"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of items to return"),
+    service: VocabularyService = Depends(get_vocabulary_service),
+):
+    """
+    편집 거리가 max_distance 이하인 표제어를 가까운 순으로 반환합니다.
+    비교 전 채점과 같은 규칙(대소문자 무시, 특수문자 제거)으로 정규화합니다.
+    """
+    return await service.db.run_sync(service.lookup_words, q, max_distance, limit)
 
 
 @router.post(
@@ -55,35 +144,157 @@ def get_available_dates(
     status_code=status.HTTP_201_CREATED,
     summary="Create or Update a Vocabulary Item (UPSERT)",
 )
-def create_vocabulary(
+async def create_vocabulary(
     word_data: VocabularyCreate,
     service: VocabularyService = Depends(get_vocabulary_service),
 ):
     """
     새로운 단어를 생성합니다. (date, english_word)가 중복될 경우 기존 레코드를 업데이트(UPSERT)합니다.
     """
-    return service.create_or_update_word(word_data)
+    return await service.db.run_sync(service.create_or_update_word, word_data)
+
+
+@router.post(
+    "/bulk",
+    response_model=VocabularyBulkResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Create or Update Multiple Vocabulary Items (Bulk UPSERT)",
+)
+async def bulk_create_vocabulary(
+    words: List[VocabularyCreate],
+    service: VocabularyService = Depends(get_vocabulary_service),
+):
+    """
+    여러 단어를 한 번에 생성합니다. (date, english_word)가 중복될 경우 기존 레코드를 업데이트(UPSERT)합니다.
+    응답의 items에는 요청 순서대로 항목별 상태("inserted" / "updated")와 저장된 단어가 담깁니다.
+    """
+    return await service.db.run_sync(service.bulk_create_or_update_words, words)
+
+
+@router.post(
+    "/import",
+    response_model=VocabularyImportResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Import Vocabulary from a CSV / NDJSON Upload (chunked upsert)",
+)
+async def import_vocabulary(
+    request: Request,
+    format: Optional[str] = Query(
+        None, pattern="^(csv|ndjson)$", description="csv 또는 ndjson (생략 시 Content-Type으로 판단)"
+    ),
+    chunk_size: int = Query(
+        DEFAULT_IMPORT_CHUNK_SIZE, ge=1, le=MAX_BULK_ITEMS, description="트랜잭션 하나에 저장할 행 수"
+    ),
+    service: VocabularyService = Depends(get_vocabulary_service),
+):
+    """
+    요청 본문(파일 그대로, 예: curl --data-binary @words.csv -H 'Content-Type: text/csv')을
+    받는 대로 검증해 chunk_size개씩 UPSERT합니다. 잘못된 행은 건너뛰고 사유를 요약에 담습니다.
+    gzip 파일은 Content-Encoding: gzip 헤더와 함께 보내면 됩니다.
+    """
+    fmt = format or detect_format(request.headers.get("content-type"))
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or pass ?format=csv|ndjson.",
+        )
+    gzipped = request.headers.get("content-encoding", "").lower() == "gzip"
+    importer = VocabularyImporter(service.db, fmt, chunk_size)
+    return await importer.import_stream(request.stream(), gzipped)
 
 
 @router.get(
     "/", response_model=VocabularyListResponse, summary="Get List of Vocabulary Items with Date and Source URL"
 )
-def get_vocabulary_list(
-    # target_date를 필수 쿼리 파라미터로 지정
-    target_date: str = Query(..., description="필수: 조회할 날짜 (YYYY-MM-DD)"),
+async def get_vocabulary_list(
+    request: Request,
+    # target_date 없이 start_date/end_date로 기간 조회도 가능
+    target_date: Optional[str] = Query(None, description="조회할 날짜 (YYYY-MM-DD)"),
+    start_date: Optional[str] = Query(None, description="기간 조회 시작일 (YYYY-MM-DD, 포함)"),
+    end_date: Optional[str] = Query(None, description="기간 조회 종료일 (YYYY-MM-DD, 포함)"),
     # 쿼리 파라미터 정의 (기본값이 있는 인자)
     limit: int = Query(
         100, ge=1, le=500, description="Maximum number of items to return"
     ),
-    offset: int = Query(0, ge=0, description="Number of items to skip"),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor (키셋 페이지네이션)"
+    ),
+    offset: int = Query(0, ge=0, description="Number of items to skip (호환용, cursor 권장)"),
     service: VocabularyService = Depends(get_vocabulary_service),
 ):
     """
-    단어 목록을 조회합니다. 날짜 필터링, 페이징(limit/offset)을 지원합니다.
-    응답에는 날짜, 대표 source_url, 단어 목록이 포함됩니다.
+    단어 목록을 조회합니다. 날짜/기간 필터링과 페이징(cursor 또는 limit/offset)을 지원합니다.
+    응답에는 날짜, 대표 source_url, 단어 목록, 다음 페이지 커서(next_cursor)가 포함됩니다.
     """
-    # Service layer: get_word_list(self, target_date: str, limit: int = 100, offset: int = 0) 순서에 맞춤
-    return service.get_word_list(target_date, limit, offset)
+    args = (target_date, limit, offset, cursor, start_date, end_date)
+    return await conditional_json(
+        request,
+        service.db,
+        partial(service.get_word_list_validator, *args),
+        partial(service.get_word_list_json, *args),
+    )
+
+
+@router.get(
+    "/range",
+    response_model=VocabularyRangeResponse,
+    summary="Get Vocabulary Grouped by Date (date range or date list)",
+)
+async def get_vocabulary_range(
+    request: Request,
+    start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD, 포함)"),
+    end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD, 포함)"),
+    dates: Optional[str] = Query(None, description="쉼표로 구분한 날짜 목록 (start_date/end_date 대신)"),
+    service: VocabularyService = Depends(get_vocabulary_service),
+):
+    """
+    기간(최대 31일) 또는 여러 날짜의 단어를 날짜별로 묶어, 날짜마다 대표 source_url과 함께 반환합니다.
+    주간 학습 화면에서 날짜마다 GET /?target_date= 를 호출하는 대신 한 번에 조회합니다.
+    """
+    args = (start_date, end_date, dates)
+    return await conditional_json(
+        request,
+        service.db,
+        partial(service.get_word_range_validator, *args),
+        partial(service.get_word_range_json, *args),
+    )
+
+
+@router.get(
+    "/batch",
+    response_model=VocabularyBatchResponse,
+    summary="Get Vocabulary Items by ID List",
+)
+async def get_vocabulary_batch(
+    ids: str = Query(..., description="쉼표로 구분한 단어 ID 목록 (예: 1,2,3)"),
+    service: VocabularyService = Depends(get_vocabulary_service),
+):
+    """
+    여러 단어를 한 번에 조회합니다. 요청한 순서대로 반환하고, 없는 ID는 missing_ids에 담습니다.
+    ID가 많으면 POST /batch를 사용하세요.
+    """
+    try:
+        word_ids = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integers.",
+        )
+    # DB 행을 검증 없이 직렬화 (response_model은 문서용)
+    return ORJSONResponse(await service.db.run_sync(service.get_words_by_ids, word_ids))
+
+
+@router.post(
+    "/batch",
+    response_model=VocabularyBatchResponse,
+    summary="Get Vocabulary Items by ID List (request body)",
+)
+async def post_vocabulary_batch(
+    request: VocabularyBatchRequest,
+    service: VocabularyService = Depends(get_vocabulary_service),
+):
+    """GET /batch와 같으며, URL 길이 제한을 넘는 긴 ID 목록을 본문으로 받습니다."""
+    return ORJSONResponse(await service.db.run_sync(service.get_words_by_ids, request.ids))
 
 
 @router.get(
@@ -91,12 +302,12 @@ def get_vocabulary_list(
     response_model=VocabularyResponse,
     summary="Get a Vocabulary Item by ID",
 )
-def get_vocabulary_by_id(
+async def get_vocabulary_by_id(
     word_id: int,
     service: VocabularyService = Depends(get_vocabulary_service),
 ):
     """특정 ID를 가진 단어 정보를 조회합니다."""
-    return service.get_word(word_id)
+    return await service.db.run_sync(service.get_word, word_id)
 
 
 @router.put(
@@ -104,13 +315,13 @@ def get_vocabulary_by_id(
     response_model=VocabularyResponse,
     summary="Update a Vocabulary Item by ID",
 )
-def update_vocabulary(
+async def update_vocabulary(
     word_id: int,
     word_data: VocabularyUpdate,
     service: VocabularyService = Depends(get_vocabulary_service),
 ):
     """특정 ID를 가진 단어의 정보(영단어, 한글 해석)를 업데이트합니다."""
-    return service.update_word(word_id, word_data)
+    return await service.db.run_sync(service.update_word, word_id, word_data)
 
 
 @router.delete(
@@ -119,9 +330,9 @@ def update_vocabulary(
     status_code=status.HTTP_200_OK,
     summary="Delete a Vocabulary Item by ID",
 )
-def delete_vocabulary(
+async def delete_vocabulary(
     word_id: int,
     service: VocabularyService = Depends(get_vocabulary_service),
 ):
     """특정 ID를 가진 단어를 삭제합니다."""
-    return service.delete_word(word_id)
+    return await service.db.run_sync(service.delete_word, word_id)
@@ -0,0 +1,151 @@
+"""
+동시성 한계 벤치마크: 동기 핸들러(def) vs 비동기 핸들러(async def + DatabaseManager.run_sync)
+
+실제 MySQL 없이 실행할 수 있도록, 쿼리 하나에 --latency초가 걸리는 가짜 커넥션으로
+커넥션 풀을 채우고 두 방식의 라우터를 같은 조건에서 비교합니다.
+
+- /db   : 커넥션을 빌려 느린 쿼리를 실행하는 엔드포인트 (부하)
+- /ping : DB를 쓰지 않는 동기 엔드포인트 (부하 중 응답성 측정용, main.read_root와 동일한 형태)
+
+사용법:
+    python benchmarks/bench_async_concurrency.py
+    python benchmarks/bench_async_concurrency.py --requests 1000 --pool-size 10 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+# 가짜 커넥션을 사용하므로 접속 정보는 형식만 맞춰 둠
+for key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_DATABASE"):
+    os.environ.setdefault(key, "benchmark")
+
+import httpx
+from fastapi import FastAPI
+
+from core.database import ConnectionPool, DatabaseManager
+
+
+class FakeConnection:
+    """쿼리 한 번에 latency초가 걸리는 가짜 커넥션"""
+
+    latency = 0.05
+
+    def run_query(self):
+        time.sleep(self.latency)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def build_apps(db: DatabaseManager):
+    def blocking_query():
+        with db.get_connection() as conn:
+            conn.run_query()
+
+    sync_app = FastAPI()
+
+    @sync_app.get("/db")
+    def sync_db():
+        blocking_query()
+        return {"ok": True}
+
+    @sync_app.get("/ping")
+    def sync_ping():
+        return {"ok": True}
+
+    async_app = FastAPI()
+
+    @async_app.get("/db")
+    async def async_db():
+        await db.run_sync(blocking_query)
+        return {"ok": True}
+
+    @async_app.get("/ping")
+    def async_ping():
+        return {"ok": True}
+
+    return sync_app, async_app
+
+
+async def run_load(app: FastAPI, total: int, pings: int):
+    peak_threads = threading.active_count()
+    stop = asyncio.Event()
+
+    async def sample_threads():
+        nonlocal peak_threads
+        while not stop.is_set():
+            peak_threads = max(peak_threads, threading.active_count())
+            await asyncio.sleep(0.01)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        sampler = asyncio.create_task(sample_threads())
+        started = time.perf_counter()
+        load = [asyncio.create_task(client.get("/db")) for _ in range(total)]
+
+        # 부하가 걸린 상태에서 DB를 쓰지 않는 엔드포인트의 응답 시간 측정
+        await asyncio.sleep(0.05)
+        ping_latencies = []
+        for _ in range(pings):
+            t0 = time.perf_counter()
+            await client.get("/ping")
+            ping_latencies.append(time.perf_counter() - t0)
+
+        responses = await asyncio.gather(*load)
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await sampler
+
+    failed = sum(1 for r in responses if r.status_code != 200)
+    return {
+        "elapsed": elapsed,
+        "throughput": total / elapsed,
+        "failed": failed,
+        "ping_p50_ms": statistics.median(ping_latencies) * 1000,
+        "ping_max_ms": max(ping_latencies) * 1000,
+        "peak_threads": peak_threads,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sync vs async 핸들러 동시성 벤치마크")
+    parser.add_argument("--requests", type=int, default=500, help="동시에 보낼 /db 요청 수")
+    parser.add_argument("--pool-size", type=int, default=10, help="커넥션 풀 크기")
+    parser.add_argument("--latency", type=float, default=0.05, help="쿼리 1회 소요 시간(초)")
+    parser.add_argument("--pings", type=int, default=5, help="부하 중 측정할 /ping 요청 수")
+    args = parser.parse_args()
+
+    FakeConnection.latency = args.latency
+    db = DatabaseManager()
+    sync_app, async_app = build_apps(db)
+
+    print("=" * 80)
+    print(f"요청 {args.requests}개, 풀 크기 {args.pool_size}, 쿼리 지연 {args.latency * 1000:.0f}ms")
+    print("=" * 80)
+    for name, app in (("sync def (before)", sync_app), ("async def + run_sync (after)", async_app)):
+        db.pool = ConnectionPool(FakeConnection, pool_size=args.pool_size, timeout=600, pre_ping=False)
+        db._limiter = None
+        result = asyncio.run(run_load(app, args.requests, args.pings))
+        print(f"[{name}]")
+        print(f"  총 소요: {result['elapsed']:.2f}s, 처리량: {result['throughput']:.1f} req/s, 실패: {result['failed']}")
+        print(f"  부하 중 /ping 응답: p50 {result['ping_p50_ms']:.1f}ms, max {result['ping_max_ms']:.1f}ms")
+        print(f"  최대 스레드 수: {result['peak_threads']}")
+        print(f"  풀 통계: {db.get_pool_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+시험 가능 여부 SSE 벤치마크: 유휴 연결 수천 개 유지 + open/close 브로드캐스트
+
+GET /tests/availability/stream에 가짜 ASGI 클라이언트 N개를 같은 이벤트 루프에서 연결해 둔 뒤
+(네트워크/소켓 없이 앱을 직접 호출), 몇 초 뒤 열렸다 닫히는 시험 시간을 가짜 커넥션(benchmarks/fake_db.py)으로
+흉내 내어 다음을 확인합니다.
+
+- 모든 클라이언트가 status / open / close 이벤트를 받는지
+- 전환 시각부터 마지막 클라이언트가 이벤트를 받기까지 걸린 시간 (브로드캐스트 fan-out)
+- 유휴 연결 하나당 메모리 (tracemalloc)
+- 전체 SQL 문 수 (클라이언트 수와 무관해야 함) vs 같은 시간 동안 폴링했을 때의 요청 수
+
+사용법:
+    python benchmarks/bench_availability_stream.py
+    python benchmarks/bench_availability_stream.py --clients 10000 --open-after 2 --open-for 2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+for key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_DATABASE"):
+    os.environ.setdefault(key, "benchmark")
+
+import services.availability_stream as availability_stream
+from core.availability import get_availability_snapshot
+from core.database import ConnectionPool, DatabaseManager
+from fake_db import FakeDatabase
+from main import app
+from services.availability_stream import get_availability_broadcaster
+
+PATH = "/api/v1/tests/availability/stream"
+EVENTS = (b"event: status", b"event: open", b"event: close")
+
+
+def build_fake_database(week: dict) -> FakeDatabase:
+    return FakeDatabase([("FROM test_week_info ORDER BY START_DATE", lambda args: [week])], rtt=0.0005, commit_cost=0)
+
+
+def make_week(test_start: datetime, test_end: datetime) -> dict:
+    return {
+        "TWI_ID": 1, "NAME": "1월 1주차",
+        "START_DATE": date(2025, 1, 2), "END_DATE": date(2025, 1, 8),
+        "TEST_START_DATETIME": test_start, "TEST_END_DATETIME": test_end,
+        "WORD_COUNT": 30, "CREATED_AT": test_start, "UPDATED_AT": test_start,
+    }
+
+
+class Client:
+    """응답 본문에서 이벤트별 첫 수신 시각만 기록하는 가짜 ASGI 클라이언트"""
+
+    def __init__(self, number: int, disconnect: asyncio.Event):
+        self.number = number
+        self.disconnect = disconnect
+        self.status = None
+        self.received = {}
+
+    async def receive(self):
+        await self.disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            for event in EVENTS:
+                if event in body and event not in self.received:
+                    self.received[event] = datetime.now()
+
+    async def run(self):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": PATH,
+            "raw_path": PATH.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"benchmark"), (b"accept", b"text/event-stream")],
+            "client": ("127.0.0.1", 10000 + self.number),
+            "server": ("benchmark", 80),
+        }
+        await app(scope, self.receive, self.send)
+
+
+def fan_out(clients, event: bytes, at: datetime):
+    """(받은 클라이언트 수, 전환 시각부터 마지막 수신까지 ms)"""
+    times = [client.received[event] for client in clients if event in client.received]
+    if not times:
+        return 0, float("nan")
+    return len(times), (max(times) - at).total_seconds() * 1000
+
+
+async def run(args):
+    # 연결하는 동안은 지난주 시험(닫힘) 상태, 연결이 끝나면 곧 열릴 시험으로 바꿈
+    started = datetime.now()
+    week = make_week(started - timedelta(days=7), started - timedelta(days=7, minutes=-15))
+    fake = build_fake_database(week)
+    # 주차 변경을 빨리 알아차리도록 타이머가 최소 keepalive 간격마다 깨어나게 함
+    availability_stream.KEEPALIVE_SECONDS = args.keepalive
+    db = DatabaseManager()
+    db.pool = ConnectionPool(fake.connect, pool_size=4, pre_ping=False)
+
+    disconnect = asyncio.Event()
+    clients = [Client(i, disconnect) for i in range(args.clients)]
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    connect_started = time.perf_counter()
+    tasks = [asyncio.create_task(client.run()) for client in clients]
+    while sum(1 for client in clients if EVENTS[0] in client.received) < args.clients:
+        await asyncio.sleep(0.05)
+    connect_seconds = time.perf_counter() - connect_started
+    per_client = (tracemalloc.get_traced_memory()[0] - baseline) / args.clients
+    tracemalloc.stop()
+
+    broadcaster = get_availability_broadcaster()
+    test_start = datetime.now() + timedelta(seconds=args.open_after)
+    test_end = test_start + timedelta(seconds=args.open_for)
+    week.update(TEST_START_DATETIME=test_start, TEST_END_DATETIME=test_end)
+    get_availability_snapshot().invalidate()
+    print(f"연결 {args.clients}개 완료: {connect_seconds:.2f}s, 유휴 연결당 메모리 ~{per_client / 1024:.1f} KiB, "
+          f"구독자 {broadcaster.subscribers}")
+
+    # close 이벤트까지 대기
+    deadline = test_end + timedelta(seconds=5)
+    while datetime.now() < deadline:
+        if sum(1 for client in clients if EVENTS[2] in client.received) == args.clients:
+            break
+        await asyncio.sleep(0.05)
+
+    disconnect.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await broadcaster.stop()
+
+    elapsed = (datetime.now() - started).total_seconds()
+    for name, event, at in (("open", EVENTS[1], test_start), ("close", EVENTS[2], test_end)):
+        count, latency = fan_out(clients, event, at)
+        print(f"  {name:5s} 이벤트: {count}/{args.clients} 수신, 전환 시각 → 마지막 클라이언트 {latency:.1f}ms")
+    statuses = {client.status for client in clients}
+    print(f"  응답 상태: {statuses}, 연결 해제 후 구독자 {broadcaster.subscribers}")
+    polls = args.clients * elapsed / args.poll_interval
+    print(f"  SQL 문: {fake.statements}개 ({elapsed:.1f}s 동안). "
+          f"{args.poll_interval:.0f}초 폴링이었다면 요청 ~{polls:.0f}회")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시험 가능 여부 SSE 유휴 연결 / 브로드캐스트 벤치마크")
+    parser.add_argument("--clients", type=int, default=5000, help="동시 연결 수")
+    parser.add_argument("--open-after", type=float, default=3.0, help="시험 시작까지 남은 시간(초)")
+    parser.add_argument("--open-for", type=float, default=2.0, help="시험 시간 길이(초)")
+    parser.add_argument("--keepalive", type=float, default=1.0, help="keepalive / 최대 타이머 간격(초)")
+    parser.add_argument("--poll-interval", type=float, default=5.0, help="비교용 폴링 간격(초)")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"GET {PATH} x {args.clients} 연결")
+    print("=" * 80)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+기간 백필 벤치마크: 한 주씩 생성 vs TestBackfill
+
+N주 분량의 주차 정보 + 시험 단어를 가짜 커넥션(benchmarks/fake_db.py) 위에서 만들며
+SQL 문 수, commit 수, 소요 시간을 비교합니다. 가짜 DB는 INSERT된 주차/시험 단어를 기억하므로
+두 방식이 주차별로 같은 단어를 선택했는지도 확인합니다.
+
+- before: 토요일마다 TestWeekCreator.create_week_info + TestWordsCreator.create_test_words
+          (manage_test.py --create-week-info / --create-test-words를 주마다 실행한 것과 같음)
+- after : TestBackfill.run (manage_test.py --from / --to)
+
+사용법:
+    python benchmarks/bench_backfill.py
+    python benchmarks/bench_backfill.py --weeks 104 --words-per-day 20 --batch-size 20
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+for key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_DATABASE"):
+    os.environ.setdefault(key, "benchmark")
+
+from core.database import ConnectionPool, DatabaseManager
+from core.test_backfill import TestBackfill
+from core.test_week_creator import TestWeekCreator
+from core.test_words_creator import TestWordsCreator
+from core.week_index import get_week_index
+from fake_db import FakeDatabase
+
+
+class FakeTables:
+    """가짜 DB가 기억하는 test_week_info / test_words / word_book"""
+
+    def __init__(self, first: date, days: int, words_per_day: int):
+        self.weeks = []
+        self.test_words = {}
+        self.word_book = []
+        wb_id = 0
+        for offset in range(days):
+            day = first + timedelta(days=offset)
+            for i in range(words_per_day):
+                wb_id += 1
+                self.word_book.append({
+                    "WB_ID": wb_id, "DATE": day, "WORD_ENGLISH": f"word{wb_id}", "WORD_MEANING": f"뜻{wb_id}",
+                    "SOURCE_URL": None, "CREATED_AT": None, "UPDATED_AT": None,
+                })
+
+    def insert_weeks(self, args):
+        for name, start, end, test_start, test_end in (args if isinstance(args, list) else [args]):
+            self.weeks.append({
+                "TWI_ID": len(self.weeks) + 1, "NAME": name,
+                "START_DATE": date.fromisoformat(start), "END_DATE": date.fromisoformat(end),
+                "TEST_START_DATETIME": datetime.fromisoformat(test_start),
+                "TEST_END_DATETIME": datetime.fromisoformat(test_end),
+                "WORD_COUNT": 0, "CREATED_AT": None, "UPDATED_AT": None,
+            })
+        return []
+
+    def insert_test_words(self, args):
+        for twi_id, wb_id in (args if isinstance(args, list) else [args]):
+            self.test_words.setdefault(twi_id, []).append(wb_id)
+        return []
+
+    def words_between(self, start, end):
+        start, end = date.fromisoformat(str(start)), date.fromisoformat(str(end))
+        return [row for row in self.word_book if start <= row["DATE"] <= end]
+
+    def week_by_id(self, twi_id):
+        return [week for week in self.weeks if week["TWI_ID"] == twi_id]
+
+    def by_week_name(self):
+        return {week["NAME"]: sorted(self.test_words.get(week["TWI_ID"], [])) for week in self.weeks}
+
+    def build_fake_database(self, rtt: float, commit_cost: float) -> FakeDatabase:
+        validator = {
+            "WEEK_UPDATED_AT": datetime(2025, 1, 1), "WORD_COUNT": 30, "MAX_TW_ID": 1,
+            "WORDS_UPDATED_AT": datetime(2025, 1, 1), "WORD_BOOK_UPDATED_AT": datetime(2025, 1, 1),
+            "DAILY_UPDATED_AT": datetime(2025, 1, 1), "DAILY_VERSION": 1,
+        }
+        return FakeDatabase(
+            [
+                ("FROM test_week_info WHERE NAME = %s",
+                 lambda args: [week for week in self.weeks if week["NAME"] == args[0]]),
+                ("INSERT INTO test_week_info", self.insert_weeks),
+                ("FROM test_week_info ORDER BY START_DATE",
+                 lambda args: sorted(self.weeks, key=lambda week: week["START_DATE"])),
+                ("INSERT INTO test_words (TWI_ID, WB_ID)", self.insert_test_words),
+                ("FROM word_book WHERE DATE BETWEEN", lambda args: self.words_between(*args)),
+                ("FROM word_book WHERE DATE >= %s AND DATE <= %s", lambda args: self.words_between(*args)),
+                ("LEFT JOIN test_words tw ON tw.TWI_ID = twi.TWI_ID", lambda args: [validator]),
+                ("FROM test_week_info WHERE TWI_ID = %s", lambda args: self.week_by_id(args[0])),
+            ],
+            rtt=rtt,
+            commit_cost=commit_cost,
+        )
+
+
+def measure(label, tables, args, run):
+    fake = tables.build_fake_database(args.rtt_ms / 1000, args.commit_ms / 1000)
+    db = DatabaseManager()
+    db.pool = ConnectionPool(fake.connect, pool_size=2, pre_ping=False)
+    get_week_index().invalidate()
+
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    words = sum(len(wb_ids) for wb_ids in tables.test_words.values())
+    print(f"{label:7s}: {elapsed * 1000:8.1f}ms, SQL 문 {fake.statements:5d}개, commit {fake.commits:4d}회, "
+          f"주차 {len(tables.weeks)}개 / 시험 단어 {words}개 ({words / elapsed:.0f}개/s)")
+    return tables.by_week_name()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주차 정보 / 시험 단어 기간 백필 벤치마크")
+    parser.add_argument("--weeks", type=int, default=52, help="생성할 주 수")
+    parser.add_argument("--words-per-day", type=int, default=10, help="word_book의 날짜별 단어 수")
+    parser.add_argument("--count", type=int, default=30, help="주차별 선택할 단어 수")
+    parser.add_argument("--batch-size", type=int, default=10, help="트랜잭션 하나로 묶는 주차 수")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="SQL 문당 왕복 지연 (ms)")
+    parser.add_argument("--commit-ms", type=float, default=2.0, help="commit 비용 (ms)")
+    args = parser.parse_args()
+
+    # 선택 과정 로그는 생략
+    logging.getLogger("core.test_words_creator").setLevel(logging.WARNING)
+    logging.getLogger("core.test_week_creator").setLevel(logging.WARNING)
+    logging.getLogger("core.test_backfill").setLevel(logging.WARNING)
+
+    date_from = datetime(2025, 1, 4)  # 토요일
+    saturdays = [date_from + timedelta(days=7 * i) for i in range(args.weeks)]
+    date_to = saturdays[-1]
+    days = args.weeks * 7 + 14
+
+    print("=" * 80)
+    print(f"{args.weeks}주 백필 (단어 {args.words_per_day}개/일, 주당 {args.count}개 선택, "
+          f"rtt {args.rtt_ms}ms, commit {args.commit_ms}ms)")
+    print("=" * 80)
+
+    before_tables = FakeTables(date_from.date() - timedelta(days=9), days, args.words_per_day)
+
+    def one_by_one():
+        week_creator, words_creator = TestWeekCreator(), TestWordsCreator()
+        for saturday in saturdays:
+            week_creator.create_week_info(saturday)
+            words_creator.create_test_words(saturday, args.count)
+
+    before = measure("before", before_tables, args, one_by_one)
+
+    after_tables = FakeTables(date_from.date() - timedelta(days=9), days, args.words_per_day)
+    after = measure(
+        "after", after_tables, args,
+        lambda: TestBackfill(args.batch_size).run(date_from, date_to, word_count=args.count),
+    )
+
+    print(f"주차별 선택 단어 일치: {before == after} ({len(after)}주)")
+
+
+if __name__ == "__main__":
+    main()
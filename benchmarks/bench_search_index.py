@@ -0,0 +1,160 @@
+"""
+검색 인덱스 벤치마크: 메모리 사용량과 질의 지연 시간
+
+합성 단어장(기본 100,000행)으로 core.search_index.SearchIndex를 빌드하고
+영어 접두어 / 한국어 뜻 검색 지연 시간을 LIKE '%...%'와 같은 선형 스캔과 비교합니다.
+오타 허용 조회는 전체 표제어와 편집 거리를 모두 계산하는 방식과 비교합니다.
+빌드 메모리는 tracemalloc으로 측정합니다. (DB 불필요)
+
+사용법:
+    python benchmarks/bench_search_index.py
+    python benchmarks/bench_search_index.py --rows 200000 --queries 500
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+for key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_DATABASE"):
+    os.environ.setdefault(key, "benchmark")
+
+from core.typo_index import levenshtein
+from core.search_index import SearchIndex, normalize_headword
+
+ENGLISH_SYLLABLES = ["ab", "ac", "al", "an", "ar", "be", "ca", "co", "de", "di", "en", "ex",
+                     "fi", "ga", "in", "la", "ma", "mo", "ne", "or", "pa", "pro", "re", "sa",
+                     "st", "te", "ti", "un", "ve", "wa"]
+KOREAN_SYLLABLES = list("가나다라마바사아자차카타파하기니디리미비시이지치키티피히고노도로모보소오조초")
+KOREAN_SUFFIXES = ["하다", "되다", "적인", "스러운", "", "함"]
+
+
+def make_rows(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    start = date(2020, 1, 1)
+    rows = []
+    for wb_id in range(1, count + 1):
+        english = "".join(rng.choice(ENGLISH_SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if rng.random() < 0.2:
+            english += " " + "".join(rng.choice(ENGLISH_SYLLABLES) for _ in range(2))
+        meanings = [
+            "".join(rng.choice(KOREAN_SYLLABLES) for _ in range(rng.randint(2, 3)))
+            + rng.choice(KOREAN_SUFFIXES)
+            for _ in range(rng.randint(1, 3))
+        ]
+        rows.append({
+            "WB_ID": wb_id,
+            "DATE": start + timedelta(days=wb_id // 40),
+            "WORD_ENGLISH": english,
+            "WORD_MEANING": ", ".join(meanings),
+        })
+    return rows
+
+
+def linear_scan(rows, query, limit):
+    """LIKE '%query%' 전체 스캔과 같은 방식의 기준선"""
+    q = query.lower()
+    hits = [row for row in rows if q in row["WORD_ENGLISH"].lower() or q in row["WORD_MEANING"]]
+    return hits[:limit]
+
+
+def typo(word: str, rng: random.Random) -> str:
+    """임의 위치의 글자 하나를 바꾼 오타"""
+    position = rng.randrange(len(word))
+    return word[:position] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[position + 1:]
+
+
+def linear_lookup(headwords, query, max_distance, limit):
+    """전체 표제어와 편집 거리를 계산하는 기준선"""
+    term = normalize_headword(query)
+    hits = [(distance, word) for word in headwords
+            if (distance := levenshtein(term, word)) <= max_distance]
+    hits.sort()
+    return hits[:limit]
+
+
+def measure(func, queries):
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        func(query)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 인덱스 메모리/지연 시간 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000, help="합성 단어 수")
+    parser.add_argument("--queries", type=int, default=300, help="질의 종류별 반복 수")
+    parser.add_argument("--limit", type=int, default=20, help="검색 결과 최대 개수")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    rng = random.Random(7)
+
+    tracemalloc.start()
+    index = SearchIndex()
+    started = time.perf_counter()
+    index.build(rows)
+    build_seconds = time.perf_counter() - started
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+
+    sample = rng.sample(rows, args.queries)
+    query_sets = {
+        "english prefix (2 chars)": [row["WORD_ENGLISH"][:2] for row in sample],
+        "english prefix (4 chars)": [row["WORD_ENGLISH"][:4] for row in sample],
+        "english full headword": [row["WORD_ENGLISH"] for row in sample],
+        "korean meaning (2 syllables)": [row["WORD_MEANING"][:2] for row in sample],
+        "korean meaning (full token)": [row["WORD_MEANING"].split(",")[0] for row in sample],
+    }
+
+    print("=" * 80)
+    print(f"단어 {args.rows:,}개, 질의 종류별 {args.queries}회, limit {args.limit}")
+    print("=" * 80)
+    print(f"빌드: {build_seconds:.2f}s, 인덱스 메모리: {memory_mb:.1f}MB "
+          f"(단어당 {memory_mb * 1024 * 1024 / args.rows:.0f} bytes)")
+
+    for name, queries in query_sets.items():
+        indexed = measure(lambda q: index.search(q, args.limit), queries)
+        scan = measure(lambda q: linear_scan(rows, q, args.limit), queries[: max(10, args.queries // 10)])
+        print(f"[{name}]")
+        print(f"  index : p50 {indexed['p50_ms']:.3f}ms, p99 {indexed['p99_ms']:.3f}ms")
+        print(f"  scan  : p50 {scan['p50_ms']:.3f}ms, p99 {scan['p99_ms']:.3f}ms")
+
+    autocomplete = measure(lambda q: index.suggest(q, 10), query_sets["english prefix (2 chars)"])
+    print(f"[autocomplete (2 chars)]  p50 {autocomplete['p50_ms']:.3f}ms, p99 {autocomplete['p99_ms']:.3f}ms")
+
+    headwords = sorted({normalize_headword(row["WORD_ENGLISH"]) for row in rows})
+    typos = [typo(row["WORD_ENGLISH"], rng) for row in sample]
+    for max_distance in (1, 2):
+        indexed = measure(lambda q: index.lookup(q, max_distance, 10), typos)
+        scan = measure(lambda q: linear_lookup(headwords, q, max_distance, 10), typos[:10])
+        print(f"[typo lookup (max_distance={max_distance}, {len(headwords):,} headwords)]")
+        print(f"  index  : p50 {indexed['p50_ms']:.3f}ms, p99 {indexed['p99_ms']:.3f}ms")
+        print(f"  scan   : p50 {scan['p50_ms']:.3f}ms, p99 {scan['p99_ms']:.3f}ms")
+
+    # 점진 갱신 비용 (쓰기 경로에서 호출되는 upsert / remove)
+    updates = []
+    for i, row in enumerate(rng.sample(rows, args.queries)):
+        changed = dict(row, WORD_MEANING=row["WORD_MEANING"] + ", 새뜻")
+        started = time.perf_counter()
+        index.upsert(changed)
+        updates.append(time.perf_counter() - started)
+    print(f"[incremental upsert]  p50 {statistics.median(updates) * 1000:.3f}ms, "
+          f"max {max(updates) * 1000:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+응답 직렬화 벤치마크: 단어 목록 한 페이지(기본 500행)의 행당 직렬화 비용
+
+비교 대상:
+1. 행마다 from_db_dict(Pydantic 검증) → model_dump_json               (기존 캐시 경로)
+2. 행마다 from_db_dict → FastAPI response_model 재검증 + JSONResponse  (기존 비캐시 경로)
+3. 행마다 model_construct(검증 생략) → model_dump_json                (참고)
+4. RowMapper.to_dicts(검증 생략) → orjson                             (fast path)
+
+fast path 출력이 기존 Pydantic 출력과 바이트 단위로 같은지도 확인합니다. (DB 불필요)
+
+사용법:
+    python benchmarks/bench_serialization.py
+    python benchmarks/bench_serialization.py --rows 1000 --repeat 200
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+for key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_DATABASE"):
+    os.environ.setdefault(key, "benchmark")
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from core.serialization import dumps
+from schemas.vocabulary import VOCABULARY_ROW, VocabularyListResponse, VocabularyResponse
+
+
+def make_rows(count: int):
+    created = datetime(2025, 1, 6, 9, 30, 15)
+    return [
+        {
+            "WB_ID": i,
+            "DATE": date(2025, 1, 6) - timedelta(days=i // 10),
+            "WORD_ENGLISH": f"headword {i}",
+            "WORD_MEANING": "표제어, 뜻풀이",
+            "SOURCE_URL": "https://home.ebs.co.kr/easyenglish/board/1",
+            "CREATED_AT": created,
+            "UPDATED_AT": created,
+        }
+        for i in range(count)
+    ]
+
+
+def validated_json(rows) -> bytes:
+    words = [VocabularyResponse.from_db_dict(row) for row in rows]
+    return VocabularyListResponse(date=None, source_url=None, words=words).model_dump_json().encode("utf-8")
+
+
+def make_fastapi_path():
+    field = create_model_field(name="response", type_=VocabularyListResponse, mode="serialization")
+
+    def fastapi_json(rows) -> bytes:
+        words = [VocabularyResponse.from_db_dict(row) for row in rows]
+        model = VocabularyListResponse(date=None, source_url=None, words=words)
+        content = asyncio.run(serialize_response(field=field, response_content=model, is_coroutine=True))
+        return JSONResponse(content).body
+
+    return fastapi_json
+
+
+def constructed_json(rows) -> bytes:
+    words = [VocabularyResponse.model_construct(**VOCABULARY_ROW.to_dict(row)) for row in rows]
+    model = VocabularyListResponse.model_construct(date=None, source_url=None, words=words, next_cursor=None)
+    return model.model_dump_json().encode("utf-8")
+
+
+def fast_path_json(rows) -> bytes:
+    return dumps({"date": None, "source_url": None, "words": VOCABULARY_ROW.to_dicts(rows), "next_cursor": None})
+
+
+def measure(func, rows, repeat: int) -> float:
+    func(rows)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(rows)
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 행당 비용 벤치마크")
+    parser.add_argument("--rows", type=int, default=500, help="한 페이지의 행 수")
+    parser.add_argument("--repeat", type=int, default=100, help="반복 횟수")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    assert fast_path_json(rows) == validated_json(rows), "fast path 출력이 Pydantic 출력과 다릅니다."
+
+    cases = [
+        ("from_db_dict + model_dump_json", validated_json, args.repeat),
+        ("from_db_dict + response_model", make_fastapi_path(), max(1, args.repeat // 4)),
+        ("model_construct + model_dump_json", constructed_json, args.repeat),
+        ("RowMapper + orjson (fast path)", fast_path_json, args.repeat),
+    ]
+
+    print("=" * 80)
+    print(f"단어 목록 {args.rows}행 페이지 직렬화 (반복 {args.repeat}회, 출력 동일성 확인 완료)")
+    print("=" * 80)
+    baseline = None
+    for name, func, repeat in cases:
+        seconds = measure(func, rows, repeat)
+        baseline = baseline or seconds
+        print(f"  {name:36s} {seconds * 1000:7.3f} ms/page  "
+              f"{seconds / args.rows * 1e6:6.2f} us/row  x{baseline / seconds:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+답안 제출 폭주 벤치마크: 토요일 10:25 시험 종료 직전 동시 제출
+
+사용자 N명이 POST /api/v1/tests/{tr_id}/submit(30문항)을 동시에 보내는 상황을
+가짜 커넥션(benchmarks/fake_db.py)과 크기가 제한된 커넥션 풀 위에서 재현해
+요청당 SQL 문 수, commit 수, 응답 지연(p50/p95/최대), 전체 처리 시간을 비교합니다.
+
+- per-answer + commit : 답안마다 UPSERT + commit + SELECT TA_ID (작업 단위 도입 전)
+- per-answer          : 답안마다 UPSERT + SELECT TA_ID, commit 1회 (작업 단위만 적용)
+- bulk                : 다건 UPSERT 1문 + TA_ID 조회 1문 + 점수 UPDATE, commit 1회 (현재)
+
+사용법:
+    python benchmarks/bench_submit_burst.py
+    python benchmarks/bench_submit_burst.py --users 1000 --pool-size 10 --rtt-ms 1
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+for key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_DATABASE"):
+    os.environ.setdefault(key, "benchmark")
+
+import httpx
+
+from core.database import ConnectionPool, DatabaseManager
+from crud import tests as crud_tests
+from fake_db import FakeDatabase
+from main import app
+
+save_answers_bulk = crud_tests.save_answers_bulk
+
+
+def save_answers_one_by_one(conn, tr_id, answers):
+    """변경 전 submit_test의 답안 저장 루프"""
+    return {
+        tw_id: crud_tests.save_answer(conn, tr_id, tw_id, user_answer, is_correct)
+        for tw_id, user_answer, is_correct in answers
+    }
+
+
+def build_fake_database(questions: int, rtt: float, commit_cost: float) -> FakeDatabase:
+    correct = [
+        {"TW_ID": tw_id, "WORD_ENGLISH": f"word{tw_id}", "WORD_MEANING": f"뜻{tw_id}"}
+        for tw_id in range(1, questions + 1)
+    ]
+    return FakeDatabase(
+        [
+            ("SELECT tw.TW_ID, wb.WORD_ENGLISH, wb.WORD_MEANING", lambda args: correct),
+            ("SELECT TW_ID, TA_ID FROM test_answers",
+             lambda args: [{"TW_ID": tw_id, "TA_ID": args[0] * 1000 + tw_id} for tw_id in args[1:]]),
+            ("SELECT TA_ID FROM test_answers", lambda args: [{"TA_ID": args[0] * 1000 + args[1]}]),
+        ],
+        rtt=rtt,
+        commit_cost=commit_cost,
+    )
+
+
+async def burst(users: int, questions: int):
+    body = {
+        "answers": [
+            {"tw_id": tw_id, "user_answer": f"word{tw_id}" if tw_id % 3 else "wrong"}
+            for tw_id in range(1, questions + 1)
+        ]
+    }
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def submit(tr_id: int):
+            started = time.perf_counter()
+            response = await client.post(f"/api/v1/tests/{tr_id}/submit", json=body)
+            return response.status_code, time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(submit(tr_id) for tr_id in range(1, users + 1)))
+        return results, time.perf_counter() - started
+
+
+def run(label: str, db: DatabaseManager, fake: FakeDatabase, args) -> None:
+    fake.reset()
+    results, elapsed = asyncio.run(burst(args.users, args.questions))
+    statuses = {code for code, _ in results}
+    latencies = sorted(latency * 1000 for _, latency in results)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"[{label}]")
+    print(f"  요청당 SQL 문: {fake.statements / args.users:.1f}, commit: {fake.commits / args.users:.1f}, 응답 {statuses}")
+    print(f"  지연 p50 {statistics.median(latencies):.1f}ms / p95 {p95:.1f}ms / 최대 {latencies[-1]:.1f}ms, "
+          f"전체 {elapsed:.2f}s ({args.users / elapsed:.0f}건/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="답안 제출 동시 폭주 벤치마크")
+    parser.add_argument("--users", type=int, default=300, help="동시에 제출하는 사용자 수")
+    parser.add_argument("--questions", type=int, default=30, help="문항 수")
+    parser.add_argument("--pool-size", type=int, default=10, help="커넥션 풀 크기")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="SQL 1회 왕복 지연(ms)")
+    parser.add_argument("--commit-ms", type=float, default=2.0, help="commit 1회 비용(ms, fsync)")
+    args = parser.parse_args()
+
+    fake = build_fake_database(args.questions, args.rtt_ms / 1000, args.commit_ms / 1000)
+    db = DatabaseManager()
+    db.pool = ConnectionPool(fake.connect, pool_size=args.pool_size, pre_ping=False)
+
+    print("=" * 80)
+    print(f"submit_test({args.questions}문항) x {args.users}명 동시 제출, 풀 {args.pool_size}개, "
+          f"rtt {args.rtt_ms}ms, commit {args.commit_ms}ms")
+    print("=" * 80)
+
+    crud_tests.save_answers_bulk = save_answers_one_by_one
+    db.transaction = db.get_connection
+    run("per-answer + commit", db, fake, args)
+    del db.transaction
+    run("per-answer", db, fake, args)
+    crud_tests.save_answers_bulk = save_answers_bulk
+    run("bulk", db, fake, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+작업 단위(Unit of Work) 벤치마크: 요청당 commit 수 비교
+
+TestService.start_test + submit_test(30문항)를 가짜 커넥션(benchmarks/fake_db.py) 위에서 실행하여
+요청당 SQL 문 수, commit 수, 소요 시간을 비교합니다.
+
+- before: 작업 단위 도입 전의 start_test / submit_test를 그대로 옮겨 둔 LegacyTestService
+          (crud 함수마다 commit, 답안마다 UPSERT + commit + SELECT TA_ID). 이후 crud/서비스가 바뀌어도
+          기준선이 달라지지 않도록 현재 crud 함수를 호출하지 않습니다.
+- after : 현재 TestService (DatabaseManager.transaction()으로 서비스 연산당 commit 1회,
+          답안은 다건 UPSERT로 저장)
+
+사용법:
+    python benchmarks/bench_unit_of_work.py
+    python benchmarks/bench_unit_of_work.py --iterations 200 --questions 30 --commit-ms 2
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+for key in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_DATABASE"):
+    os.environ.setdefault(key, "benchmark")
+
+from core.database import ConnectionPool, DatabaseManager
+from crud.tests import normalize_answer
+from fake_db import FakeDatabase
+from schemas.tests import AnswerItem, TestStartRequest, TestSubmitRequest
+from services.tests import TestService
+
+
+def build_fake_database(questions: int, rtt: float, commit_cost: float) -> FakeDatabase:
+    now = datetime.now()
+    existing = {
+        "TR_ID": 1, "U_ID": 1, "TWI_ID": 1, "TEST_SCORE": 80,
+        "CREATED_AT": now, "UPDATED_AT": now,
+    }
+    correct = [
+        {"TW_ID": tw_id, "WORD_ENGLISH": f"word{tw_id}", "WORD_MEANING": f"뜻{tw_id}"}
+        for tw_id in range(1, questions + 1)
+    ]
+    return FakeDatabase(
+        [
+            ("FROM test_result WHERE U_ID = %s AND TWI_ID = %s", lambda args: [existing]),
+            ("SELECT tw.TW_ID, wb.WORD_ENGLISH, wb.WORD_MEANING", lambda args: correct),
+            ("SELECT TA_ID FROM test_answers", lambda args: [{"TA_ID": args[1]}]),
+            ("SELECT TW_ID, TA_ID FROM test_answers",
+             lambda args: [{"TW_ID": tw_id, "TA_ID": tw_id} for tw_id in args[1:]]),
+        ],
+        rtt=rtt,
+        commit_cost=commit_cost,
+    )
+
+
+class LegacyTestService:
+    """작업 단위 도입 전 TestService.start_test / submit_test의 DB 왕복과 commit (기준선 고정)"""
+
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+
+    def _existing(self, cursor, u_id, twi_id):
+        cursor.execute(
+            """
+            SELECT TR_ID, U_ID, TWI_ID, TEST_SCORE, CREATED_AT, UPDATED_AT
+            FROM test_result
+            WHERE U_ID = %s AND TWI_ID = %s;
+            """,
+            (u_id, twi_id),
+        )
+        return cursor.fetchone()
+
+    def start_test(self, request: TestStartRequest):
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cursor:
+                existing = self._existing(cursor, request.u_id, request.twi_id)
+                if existing:
+                    # reset_test_result: 답안 삭제 + 점수 초기화 후 commit
+                    cursor.execute("DELETE FROM test_answers WHERE TR_ID = %s;", (existing["TR_ID"],))
+                    cursor.execute(
+                        "UPDATE test_result SET TEST_SCORE = NULL, UPDATED_AT = CURRENT_TIMESTAMP WHERE TR_ID = %s;",
+                        (existing["TR_ID"],),
+                    )
+                    conn.commit()
+                    return existing
+                # create_test_result: INSERT 후 commit, 생성된 행 재조회
+                cursor.execute(
+                    "INSERT INTO test_result (U_ID, TWI_ID, TEST_SCORE) VALUES (%s, %s, NULL);",
+                    (request.u_id, request.twi_id),
+                )
+                conn.commit()
+                return self._existing(cursor, request.u_id, request.twi_id)
+
+    def submit_test(self, tr_id: int, request: TestSubmitRequest):
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT tw.TW_ID, wb.WORD_ENGLISH, wb.WORD_MEANING
+                    FROM test_result tr
+                    JOIN test_words tw ON tr.TWI_ID = tw.TWI_ID
+                    JOIN word_book wb ON tw.WB_ID = wb.WB_ID
+                    WHERE tr.TR_ID = %s;
+                    """,
+                    (tr_id,),
+                )
+                correct_answers = {row["TW_ID"]: row for row in cursor.fetchall()}
+
+                results = []
+                for answer in request.answers:
+                    correct = correct_answers[answer.tw_id]
+                    is_correct = normalize_answer(answer.user_answer) == normalize_answer(correct["WORD_ENGLISH"])
+                    # save_answer: 답안마다 UPSERT + commit + SELECT TA_ID
+                    cursor.execute(
+                        """
+                        INSERT INTO test_answers (TR_ID, TW_ID, USER_ANSWER, IS_CORRECT)
+                        VALUES (%s, %s, %s, %s)
+                        ON DUPLICATE KEY UPDATE
+                            USER_ANSWER = VALUES(USER_ANSWER),
+                            IS_CORRECT = VALUES(IS_CORRECT),
+                            UPDATED_AT = CURRENT_TIMESTAMP;
+                        """,
+                        (tr_id, answer.tw_id, answer.user_answer, is_correct),
+                    )
+                    conn.commit()
+                    cursor.execute(
+                        "SELECT TA_ID FROM test_answers WHERE TR_ID = %s AND TW_ID = %s;", (tr_id, answer.tw_id)
+                    )
+                    results.append((cursor.fetchone()["TA_ID"], is_correct))
+
+                score = round(sum(1 for _, ok in results if ok) * 100.0 / len(results))
+                # update_test_score: UPDATE 후 commit
+                cursor.execute(
+                    """
+                    UPDATE test_result
+                    SET TEST_SCORE = %s, UPDATED_AT = CURRENT_TIMESTAMP
+                    WHERE TR_ID = %s;
+                    """,
+                    (score, tr_id),
+                )
+                conn.commit()
+                return score
+
+
+def run(service, fake: FakeDatabase, iterations: int, questions: int):
+    start_request = TestStartRequest(u_id=1, twi_id=1)
+    submit_request = TestSubmitRequest(
+        answers=[
+            AnswerItem(tw_id=tw_id, user_answer=f"word{tw_id}" if tw_id % 3 else "wrong")
+            for tw_id in range(1, questions + 1)
+        ]
+    )
+
+    fake.reset()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        service.start_test(start_request)
+        service.submit_test(1, submit_request)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "statements": fake.statements / iterations,
+        "commits": fake.commits / iterations,
+        "latency_ms": elapsed / iterations * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요청당 commit 수 벤치마크")
+    parser.add_argument("--iterations", type=int, default=100, help="start+submit 반복 횟수")
+    parser.add_argument("--questions", type=int, default=30, help="문항 수")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="SQL 1회 왕복 지연(ms)")
+    parser.add_argument("--commit-ms", type=float, default=2.0, help="commit 1회 비용(ms, fsync)")
+    args = parser.parse_args()
+
+    fake = build_fake_database(args.questions, args.rtt_ms / 1000, args.commit_ms / 1000)
+    db = DatabaseManager()
+    db.pool = ConnectionPool(fake.connect, pool_size=1, pre_ping=False)
+    service = TestService(db)
+
+    print("=" * 80)
+    print(f"start_test + submit_test({args.questions}문항) x {args.iterations}회")
+    print("=" * 80)
+
+    before = run(LegacyTestService(db), fake, args.iterations, args.questions)
+    after = run(service, fake, args.iterations, args.questions)
+
+    for name, result in (("before (commit per crud call)", before), ("after (unit of work, current)", after)):
+        print(f"[{name}]")
+        print(f"  요청당 SQL 문: {result['statements']:.1f}, commit: {result['commits']:.1f}")
+        print(f"  요청당 소요: {result['latency_ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
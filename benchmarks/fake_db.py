@@ -0,0 +1,111 @@
+"""
+벤치마크용 가짜 MySQL 커넥션
+
+SQL을 실제로 실행하지 않고 왕복 지연(rtt)과 commit 비용만 흉내 내면서
+실행된 SQL 문 수와 commit 수를 셉니다. crud 함수가 기대하는 결과 행은
+(SQL 부분 문자열, 결과 생성 함수) 규칙 목록으로 돌려줍니다.
+
+MySQL 없이 실행 경로의 "왕복 횟수"를 비교하기 위한 도구이며, 실제 쿼리 성능을 재지는 않습니다.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Responder = Tuple[str, Callable[[Any], List[Dict[str, Any]]]]
+
+
+class FakeDatabase:
+    """가짜 커넥션을 만들고 전체 통계를 모읍니다."""
+
+    def __init__(self, responders: Sequence[Responder], rtt: float = 0.0005, commit_cost: float = 0.002):
+        self.responders = list(responders)
+        self.rtt = rtt
+        self.commit_cost = commit_cost
+        self.statements = 0
+        self.commits = 0
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def connect(self) -> "FakeConnection":
+        return FakeConnection(self)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.statements = 0
+            self.commits = 0
+
+    def _run(self, query: str, args) -> List[Dict[str, Any]]:
+        with self._lock:
+            self.statements += 1
+            self._next_id += 1
+        time.sleep(self.rtt)
+        normalized = " ".join(query.split())
+        for fragment, respond in self.responders:
+            if fragment in normalized:
+                return respond(args)
+        return []
+
+    def _commit(self) -> None:
+        with self._lock:
+            self.commits += 1
+        time.sleep(self.commit_cost)
+
+
+class FakeCursor:
+    def __init__(self, db: FakeDatabase):
+        self._db = db
+        self._rows: List[Dict[str, Any]] = []
+        self.rowcount = 0
+        self.lastrowid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, args=None):
+        self._rows = self._db._run(query, args)
+        self.rowcount = len(self._rows) or 1
+        self.lastrowid = self._db._next_id
+        return self.rowcount
+
+    def executemany(self, query, seq_of_args):
+        # pymysql은 INSERT ... VALUES 형태를 다건 INSERT 한 문장으로 재작성하므로 1회 왕복으로 계산
+        seq_of_args = list(seq_of_args)
+        self._rows = self._db._run(query, seq_of_args)
+        self.rowcount = len(seq_of_args)
+        return self.rowcount
+
+    def fetchone(self) -> Optional[Dict[str, Any]]:
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self) -> List[Dict[str, Any]]:
+        return list(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, db: FakeDatabase):
+        self._db = db
+
+    def cursor(self, cursorclass=None) -> FakeCursor:
+        return FakeCursor(self._db)
+
+    def commit(self):
+        self._db._commit()
+
+    def rollback(self):
+        pass
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        pass
@@ -80,6 +80,7 @@ BASE_URL: str = "https://home.ebs.co.kr"
 # 백엔드 API URL
 API_BASE_URL: str = os.getenv("API_BASE_URL", "http://localhost:8000")
 API_ENDPOINT: str = f"{API_BASE_URL}/api/v1/vocabulary/"
+API_BULK_ENDPOINT: str = f"{API_BASE_URL}/api/v1/vocabulary/bulk"
 
 
 # ============================================================
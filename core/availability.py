@@ -0,0 +1,71 @@
+"""
+현재 시험 주차 스냅샷 (인프로세스)
+
+/tests/current-availability는 클라이언트가 계속 폴링하는 엔드포인트이므로
+주차 구간 인덱스(core.week_index)의 현재 주차로 시험 가능 여부를 현재 시각으로만 계산합니다.
+DB는 인덱스가 만료(WEEK_INDEX_TTL)되었거나 주차가 새로 생성되어 무효화된 경우에만 다시 읽습니다.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from core.week_index import WeekIndex, get_week_index
+
+# 시험 중 remaining_minutes가 바뀌는 주기 (초)
+_MINUTE = 60
+
+
+class AvailabilitySnapshot:
+    """주차 인덱스 위에서 현재 주차와 다음 전환 시점을 계산합니다."""
+
+    def __init__(self, index: Optional[WeekIndex] = None):
+        self.index = index or get_week_index()
+
+    def is_fresh(self) -> bool:
+        return self.index.is_fresh()
+
+    def refresh(self, db) -> Optional[Dict[str, Any]]:
+        """주차 인덱스를 DB에서 다시 읽고 현재 주차를 반환합니다."""
+        return self.index.refresh(db).current()
+
+    def get(self, db) -> Optional[Dict[str, Any]]:
+        """현재 주차 행을 반환합니다. 인덱스가 만료되었으면 먼저 다시 읽습니다."""
+        return self.index.get(db).current()
+
+    def invalidate(self) -> None:
+        """주차가 생성/변경되었음을 알립니다. 다음 조회 때 DB에서 다시 읽습니다."""
+        self.index.invalidate()
+
+    def seconds_until_change(self, now: Optional[datetime] = None) -> float:
+        """
+        현재 응답이 그대로 유효한 시간(초)
+        다음 전환 시점(시험 시작/종료, 시험 중에는 remaining_minutes가 바뀌는 시점)과
+        인덱스 만료 시점 중 빠른 쪽까지입니다.
+        """
+        now = now or datetime.now()
+        limit = self.index.expires_in()
+        week = self.index.current()
+        if week is not None:
+            test_start = week["TEST_START_DATETIME"]
+            test_end = week["TEST_END_DATETIME"]
+            if now < test_start:
+                limit = min(limit, (test_start - now).total_seconds())
+            elif now <= test_end:
+                remaining = (test_end - now).total_seconds()
+                limit = min(limit, remaining, remaining % _MINUTE or _MINUTE)
+        return limit
+
+    def max_age(self, now: Optional[datetime] = None) -> int:
+        """응답을 클라이언트가 캐시해도 되는 시간(초, Cache-Control max-age)"""
+        return int(self.seconds_until_change(now))
+
+
+_snapshot: Optional[AvailabilitySnapshot] = None
+
+
+def get_availability_snapshot() -> AvailabilitySnapshot:
+    """프로세스 전역 AvailabilitySnapshot을 반환합니다."""
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = AvailabilitySnapshot()
+    return _snapshot
@@ -0,0 +1,155 @@
+"""
+버전 기반 인프로세스 읽기 캐시
+
+직렬화가 끝난 응답(JSON bytes, 또는 (bytes, 응답 헤더) 튜플)을 크기 제한 LRU + TTL로 보관합니다.
+단어/시험 단어가 바뀌면 bump_version()으로 전역 버전을 올려 모든 캐시 항목을 한 번에 무효화합니다.
+크롤러·스케줄러처럼 다른 프로세스에서 일어난 쓰기는 버전을 올릴 수 없으므로 TTL이 상한이 됩니다.
+
+환경 변수:
+    READ_CACHE_TTL           항목 유효 시간 (초, 기본 60, 0 이하면 캐시 비활성화)
+    READ_CACHE_MAX_ENTRIES   캐시 인스턴스당 최대 항목 수 (기본 512)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+from core.metrics import REGISTRY
+
+CACHE_REQUESTS = REGISTRY.counter(
+    "read_cache_requests_total",
+    "Read cache lookups by result (hit / miss)",
+    labelnames=("cache", "result"),
+)
+CACHE_EVICTIONS = REGISTRY.counter(
+    "read_cache_evictions_total",
+    "Read cache entries evicted by the LRU size bound",
+    labelnames=("cache",),
+)
+
+# 캐시 값: 직렬화된 응답 bytes 또는 (bytes, 응답 헤더) 튜플 (불변으로 취급)
+CachedValue = Any
+
+_version = 0
+_version_lock = threading.Lock()
+
+
+def current_version() -> int:
+    """현재 캐시 데이터 버전을 반환합니다."""
+    return _version
+
+
+def bump_version() -> int:
+    """데이터가 바뀌었음을 알립니다. 이전 버전으로 저장된 항목은 모두 무효가 됩니다."""
+    global _version
+    with _version_lock:
+        _version += 1
+        return _version
+
+
+def _get_env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        logging.error(f"{name} is not a valid number. Using {default}.")
+        return default
+
+
+class VersionedLRUCache:
+    """버전 + TTL로 무효화되는 크기 제한 LRU 캐시"""
+
+    def __init__(self, name: str, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        self.name = name
+        self.max_entries = int(max_entries or _get_env_number("READ_CACHE_MAX_ENTRIES", 512))
+        self.ttl = ttl if ttl is not None else _get_env_number("READ_CACHE_TTL", 60)
+        # key -> (버전, 만료 시각, 값)
+        self._entries: "OrderedDict[Hashable, Tuple[int, float, CachedValue]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        _CACHES.append(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, key: Hashable) -> Optional[CachedValue]:
+        """유효한 항목이 있으면 반환하고, 없으면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                version, expires_at, value = entry
+                if version == _version and expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    CACHE_REQUESTS.inc(cache=self.name, result="hit")
+                    return value
+                del self._entries[key]
+            self.misses += 1
+        CACHE_REQUESTS.inc(cache=self.name, result="miss")
+        return None
+
+    def set(self, key: Hashable, value: CachedValue, version: int) -> None:
+        """
+        값을 저장합니다. version은 값을 만들기 전에 읽어 둔 current_version()이어야 하며,
+        그 사이에 버전이 바뀌었으면 이미 낡은 값이므로 저장하지 않습니다.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if version != _version:
+                return
+            self._entries[key] = (version, time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                CACHE_EVICTIONS.inc(cache=self.name)
+
+    def get_or_set(self, key: Hashable, load: Callable[[], CachedValue]) -> CachedValue:
+        """캐시에 있으면 반환하고, 없으면 load()로 만들어 저장한 뒤 반환합니다."""
+        value = self.get(key)
+        if value is None:
+            version = current_version()
+            value = load()
+            self.set(key, value, version)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+# 생성된 캐시 인스턴스 목록 (메트릭 수집용)
+_CACHES: List[VersionedLRUCache] = []
+
+REGISTRY.gauge_callback(
+    "read_cache_entries",
+    "Entries currently held by each read cache",
+    lambda: [({"cache": cache.name}, len(cache)) for cache in _CACHES],
+)
+REGISTRY.gauge_callback(
+    "read_cache_version",
+    "Current read cache data version (bumped on vocabulary / test-word writes)",
+    lambda: [({}, current_version())],
+)
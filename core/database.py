@@ -1,21 +1,269 @@
+import anyio
+import functools
 import pymysql
 import pymysql.cursors
+from collections import deque
 from contextlib import contextmanager
+from contextvars import ContextVar
 import logging
 import os
+import threading
+import time
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar
 from dotenv import load_dotenv
 
 # 환경 변수를 .env.dev 파일에서 로드
 # be 디렉토리의 .env.dev 파일을 찾기 위해 절대 경로 사용
 # 환경 설정을 core/config.py를 통해 로드
 from .config import settings
+from .instrumentation import InstrumentedConnection, InstrumentedDictCursor
+from .metrics import REGISTRY
+
+T = TypeVar("T")
+
+# 현재 실행 컨텍스트에서 진행 중인 작업 단위(transaction())의 커넥션
+_current_transaction: ContextVar[Optional[pymysql.connections.Connection]] = ContextVar(
+    "db_current_transaction", default=None
+)
+
+
+def in_transaction(conn) -> bool:
+    """conn이 진행 중인 작업 단위(DatabaseManager.transaction())에 속해 있는지 확인합니다."""
+    return conn is not None and _current_transaction.get() is conn
+
+
+def commit(conn) -> None:
+    """
+    crud 쓰기 함수용 커밋.
+    작업 단위 안이면 커밋을 바깥 transaction()에 맡기고, 아니면 즉시 커밋합니다.
+    """
+    if not in_transaction(conn):
+        conn.commit()
+
+
+def rollback(conn) -> None:
+    """crud 쓰기 함수용 롤백. 작업 단위 안이면 롤백을 바깥 transaction()에 맡깁니다."""
+    if not in_transaction(conn):
+        conn.rollback()
+
+
+def _get_int_env(name: str, default: int) -> int:
+    """정수형 환경 변수를 읽습니다. 값이 올바르지 않으면 기본값을 사용합니다."""
+    value = os.getenv(name, str(default))
+    try:
+        return int(value)
+    except ValueError:
+        logging.error(
+            f"{name} environment variable ({value}) is not a valid number. Using {default}."
+        )
+        return default
+
+
+def _get_bool_env(name: str, default: bool) -> bool:
+    """불리언 환경 변수를 읽습니다. (1/true/yes/on → True)"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class PoolTimeoutError(Exception):
+    """커넥션 풀에서 제한 시간 내에 커넥션을 얻지 못했을 때 발생하는 예외입니다."""
+
+
+class ConnectionPool:
+    """
+    스레드 안전한 크기 제한 MySQL 커넥션 풀입니다.
+
+    - 최대 pool_size개의 커넥션만 동시에 열어둡니다.
+    - 모든 커넥션이 사용 중이면 timeout초 동안 반환을 기다립니다.
+    - 대여 시 recycle초가 지난 커넥션은 새로 만들고, pre_ping이면 ping으로 생존 여부를 확인합니다.
+    - 반환 시 rollback()으로 열린 트랜잭션(읽기 스냅샷)을 정리합니다.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], pymysql.connections.Connection],
+        pool_size: int = 10,
+        timeout: float = 30.0,
+        recycle: int = 3600,
+        pre_ping: bool = True,
+    ):
+        self._connect = connect
+        self.pool_size = max(1, pool_size)
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # 최근 반환된 커넥션부터 재사용 (LIFO)
+        self._opened = 0  # 열려있는 커넥션 수 (idle + in_use)
+        self._in_use = 0
+
+        # 통계
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._recycled = 0
+        self._ping_failures = 0
+
+    def _new_connection(self) -> pymysql.connections.Connection:
+        conn = self._connect()
+        conn._pool_created_at = time.monotonic()
+        return conn
+
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _validate(self, conn) -> pymysql.connections.Connection:
+        """대여할 커넥션의 수명과 생존 여부를 확인하고, 필요하면 새 커넥션으로 교체합니다."""
+        created_at = getattr(conn, "_pool_created_at", 0.0)
+        if self.recycle > 0 and time.monotonic() - created_at > self.recycle:
+            self._close_quietly(conn)
+            with self._cond:
+                self._recycled += 1
+            return self._new_connection()
+
+        if self.pre_ping:
+            try:
+                conn.ping(reconnect=False)
+            except Exception:
+                self._close_quietly(conn)
+                with self._cond:
+                    self._ping_failures += 1
+                return self._new_connection()
+
+        return conn
+
+    def acquire(self) -> pymysql.connections.Connection:
+        """풀에서 커넥션을 대여합니다. 제한 시간을 넘기면 PoolTimeoutError를 발생시킵니다."""
+        started = time.monotonic()
+        deadline = started + self.timeout
+        conn = None
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._opened < self.pool_size:
+                    # 자리만 먼저 예약하고 실제 연결은 락 밖에서 수행
+                    self._opened += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"Could not acquire a database connection within {self.timeout}s "
+                        f"(pool_size={self.pool_size})"
+                    )
+                self._cond.wait(remaining)
+
+            waited = time.monotonic() - started
+            self._in_use += 1
+            self._checkouts += 1
+            self._wait_time_total += waited
+            self._wait_time_max = max(self._wait_time_max, waited)
+
+        try:
+            if conn is None:
+                return self._new_connection()
+            return self._validate(conn)
+        except Exception:
+            # 연결 실패 시 예약한 자리를 돌려줌
+            with self._cond:
+                self._in_use -= 1
+                self._opened -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, conn, discard: bool = False) -> None:
+        """커넥션을 풀에 반환합니다. discard=True이면 닫고 버립니다."""
+        if not discard:
+            try:
+                # 반환 전에 트랜잭션을 정리해야 다음 사용자가 오래된 스냅샷을 읽지 않음
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        if discard:
+            self._close_quietly(conn)
+
+        with self._cond:
+            self._in_use -= 1
+            if discard:
+                self._opened -= 1
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    def dispose(self) -> None:
+        """유휴 커넥션을 모두 닫습니다. (사용 중인 커넥션은 반환 시점에 풀로 돌아옴)"""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._opened -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close_quietly(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 및 누적 통계를 반환합니다."""
+        with self._cond:
+            return {
+                "pool_size": self.pool_size,
+                "opened": self._opened,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "wait_time_total": self._wait_time_total,
+                "wait_time_max": self._wait_time_max,
+                "wait_time_avg": (
+                    self._wait_time_total / self._checkouts if self._checkouts else 0.0
+                ),
+                "recycled": self._recycled,
+                "ping_failures": self._ping_failures,
+            }
 
 
 class DatabaseManager:
-    """환경 변수를 통해 MySQL 연결 정보를 관리하고 커넥션을 제공하는 클래스입니다."""
+    """
+    환경 변수를 통해 MySQL 연결 정보를 관리하고 커넥션을 제공하는 클래스입니다.
+
+    프로세스 전체에서 하나의 인스턴스(싱글톤)와 하나의 커넥션 풀을 공유합니다.
+    풀 설정은 .env 파일의 DB_POOL_SIZE, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_POOL_PRE_PING으로 조정합니다.
+    """
+
+    _instance: Optional["DatabaseManager"] = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
+        return cls._instance
 
     def __init__(self):
+        if self._initialized:
+            return
+
+        with self._instance_lock:
+            if self._initialized:
+                return
+            self._configure()
+            self._initialized = True
+
+    def _configure(self):
         try:
             # 1. DB_HOST (필수)
             self.host = os.environ["DB_HOST"]
@@ -41,30 +289,134 @@ class DatabaseManager:
             )
             self.port = 3306
 
-        logging.info("DatabaseManager initialized successfully.")
+        # 6. 커넥션 풀 설정
+        self.pool = ConnectionPool(
+            self._create_connection,
+            pool_size=_get_int_env("DB_POOL_SIZE", 10),
+            timeout=_get_int_env("DB_POOL_TIMEOUT", 30),
+            recycle=_get_int_env("DB_POOL_RECYCLE", 3600),
+            pre_ping=_get_bool_env("DB_POOL_PRE_PING", True),
+        )
+
+        # 비동기 핸들러에서 블로킹 DB 작업을 실행할 때 사용하는 동시 실행 제한 (이벤트 루프 안에서 생성)
+        self._limiter: Optional[anyio.CapacityLimiter] = None
+
+        logging.info(
+            f"DatabaseManager initialized successfully. (pool_size={self.pool.pool_size})"
+        )
+
+    def _create_connection(self) -> pymysql.connections.Connection:
+        """풀에 채울 새 MySQL 커넥션을 생성합니다."""
+        return InstrumentedConnection(
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            charset="utf8mb4",
+            cursorclass=InstrumentedDictCursor,  # 결과를 딕셔너리로 반환 (쿼리 계측 포함)
+            autocommit=False,  # 트랜잭션 수동 관리
+            init_command="SET time_zone='+09:00'",
+        )
 
     @contextmanager
     def get_connection(self):
-        """Generates and manages a MySQL connection using context manager."""
-        connection = None
+        """
+        커넥션 풀에서 MySQL 커넥션을 대여하고, 사용이 끝나면 반환합니다.
+        진행 중인 작업 단위(transaction())가 있으면 그 커넥션을 그대로 사용합니다.
+        """
+        current = _current_transaction.get()
+        if current is not None:
+            yield current
+            return
+
+        connection = self.pool.acquire()
+        discard = False
         try:
-            connection = pymysql.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                charset="utf8mb4",
-                cursorclass=pymysql.cursors.DictCursor,  # 결과를 딕셔너리로 반환
-                autocommit=False,  # 트랜잭션 수동 관리
-                init_command="SET time_zone='+09:00'",
-            )
             yield connection
         except Exception as e:
-            if connection:
+            try:
                 connection.rollback()
+            except Exception:
+                # 롤백조차 실패하면 끊어진 커넥션이므로 풀에 돌려놓지 않음
+                discard = True
             logging.error(f"Database error during transaction: {e}")
             raise  # 예외를 호출자에게 다시 던짐
         finally:
-            if connection:
-                connection.close()
+            self.pool.release(connection, discard=discard)
+
+    @contextmanager
+    def transaction(self):
+        """
+        작업 단위(Unit of Work)를 시작합니다.
+
+        블록 안에서 호출된 crud 쓰기 함수는 개별 commit 없이 같은 커넥션/트랜잭션에 합류하고,
+        블록이 정상 종료될 때 한 번만 commit합니다. 예외가 발생하면 전체를 rollback합니다.
+        이미 작업 단위 안에서 호출되면 바깥 트랜잭션에 그대로 합류합니다.
+        """
+        current = _current_transaction.get()
+        if current is not None:
+            yield current
+            return
+
+        with self.get_connection() as conn:
+            token = _current_transaction.set(conn)
+            try:
+                yield conn
+            finally:
+                _current_transaction.reset(token)
+            conn.commit()
+
+    async def run_sync(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        블로킹 DB 작업(func)을 워커 스레드에서 실행하고 결과를 기다립니다.
+
+        동시에 실행되는 작업 수를 커넥션 풀 크기로 제한하므로, 나머지 요청은
+        AnyIO 기본 스레드풀(40개)을 점유하지 않고 이벤트 루프에서 대기합니다.
+        """
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.pool.pool_size)
+        return await anyio.to_thread.run_sync(
+            functools.partial(func, *args, **kwargs), limiter=self._limiter
+        )
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """커넥션 풀 통계(사용 중/유휴 커넥션 수, 대기 시간 등)를 반환합니다."""
+        return self.pool.stats()
+
+    def dispose(self) -> None:
+        """유휴 커넥션을 모두 닫습니다."""
+        self.pool.dispose()
+
+    @classmethod
+    def dispose_instance(cls) -> None:
+        """생성된 인스턴스가 있으면 풀을 정리합니다. (애플리케이션 종료 시 호출)"""
+        if cls._instance is not None and cls._instance._initialized:
+            cls._instance.dispose()
+
+
+def _pool_gauge(key: str):
+    """스크랩 시점에 커넥션 풀 통계 값 하나를 읽는 게이지 콜백을 만듭니다."""
+
+    def collect():
+        instance = DatabaseManager._instance
+        if instance is None or not instance._initialized:
+            return []
+        return [({}, instance.get_pool_stats()[key])]
+
+    return collect
+
+
+for _key, _doc in (
+    ("pool_size", "Maximum number of pooled connections"),
+    ("opened", "Open connections (idle + in use)"),
+    ("in_use", "Connections currently checked out"),
+    ("idle", "Idle connections waiting in the pool"),
+    ("checkouts", "Total connection checkouts"),
+    ("timeouts", "Checkouts that timed out waiting for a connection"),
+    ("wait_time_total", "Total seconds spent waiting for a connection"),
+    ("wait_time_max", "Longest wait for a connection in seconds"),
+    ("recycled", "Connections replaced because they exceeded DB_POOL_RECYCLE"),
+    ("ping_failures", "Stale connections detected by pre-ping"),
+):
+    REGISTRY.gauge_callback(f"db_pool_{_key}", _doc, _pool_gauge(_key))
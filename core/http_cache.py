@@ -0,0 +1,136 @@
+"""
+HTTP 조건부 GET(ETag / Last-Modified) 유틸리티
+
+서비스가 가벼운 인덱스 쿼리로 구한 검증자(validator: 행 수, MAX(UPDATED_AT) 등)로
+ETag와 Last-Modified를 만들고, 요청의 If-None-Match / If-Modified-Since와 비교해
+변경이 없으면 본문 조회·직렬화 없이 304 Not Modified를 반환합니다.
+"""
+
+import hashlib
+from functools import partial
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from fastapi import Request, Response, status
+
+# DB 세션 타임존 (DatabaseManager의 init_command "SET time_zone='+09:00'"과 동일)
+DB_TIMEZONE = timezone(timedelta(hours=9))
+
+# (ETag, Last-Modified)
+Validator = Tuple[str, Optional[datetime]]
+
+# render() 결과: JSON bytes 또는 (JSON bytes, 추가 응답 헤더)
+Rendered = Union[bytes, Tuple[bytes, Dict[str, str]]]
+
+
+def make_etag(*parts: Any) -> str:
+    """검증자 값들로 약한(weak) ETag를 만듭니다."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def _to_utc(value: datetime) -> datetime:
+    """DB의 naive datetime(KST)을 HTTP 날짜용 UTC로 변환합니다. (초 단위 절삭)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=DB_TIMEZONE)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """응답에 붙일 ETag / Last-Modified 헤더를 만듭니다."""
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_to_utc(last_modified), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    클라이언트가 가진 표현이 아직 유효한지 확인합니다.
+    If-None-Match가 있으면 그것만 보고(RFC 9110), 없을 때만 If-Modified-Since를 봅니다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # GET에서는 약한 비교: W/ 접두어를 무시하고 값만 비교
+        opaque = etag.removeprefix("W/")
+        candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+        return opaque in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return _to_utc(last_modified) <= since
+
+    return False
+
+
+def accepts_gzip(request: Request) -> bool:
+    """Accept-Encoding에 gzip이 있고 q=0으로 거부되지 않았는지 확인합니다."""
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, *params = part.split(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        return q > 0
+    return False
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime]) -> Response:
+    """본문 없는 304 응답을 만듭니다."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified),
+    )
+
+
+def json_response(
+    rendered: Rendered, etag: Optional[str] = None, last_modified: Optional[datetime] = None
+) -> Response:
+    """직렬화된 JSON 본문(과 추가 헤더)에 검증자 헤더를 붙인 응답을 만듭니다."""
+    content, headers = rendered if isinstance(rendered, tuple) else (rendered, {})
+    headers = dict(headers)
+    if etag is not None:
+        headers.update(validator_headers(etag, last_modified))
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+async def conditional_json(
+    request: Request,
+    db,
+    validate: Callable[[], Optional[Validator]],
+    render: Callable[..., Rendered],
+) -> Response:
+    """
+    조건부 GET 처리 흐름을 한 곳에 모은 헬퍼입니다.
+
+    1. validate()로 검증자를 구하고 (가벼운 인덱스 쿼리)
+    2. 클라이언트 표현이 유효하면 304를 반환하고
+    3. 아니면 render(etag=...)로 본문(과 추가 헤더)을 만들어 검증자 헤더와 함께 반환합니다.
+    validate()가 None을 반환하면(잘못된 파라미터, 없는 리소스) 검증 없이 render()로 넘겨
+    본 조회에서 400/404가 나도록 합니다. 두 함수 모두 db.run_sync로 스레드풀에서 실행됩니다.
+    """
+    validator = await db.run_sync(validate)
+    if validator is None:
+        return json_response(await db.run_sync(render))
+
+    etag, last_modified = validator
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+
+    rendered = await db.run_sync(partial(render, etag=etag))
+    return json_response(rendered, etag, last_modified)
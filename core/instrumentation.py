@@ -0,0 +1,110 @@
+"""
+쿼리 계측 커서
+
+DatabaseManager가 만드는 커넥션은 이 모듈의 커서를 기본 커서로 사용합니다.
+모든 SQL 문에 대해 지연 시간, 반환/영향 행 수, 호출한 crud 함수를 히스토그램으로 기록하고,
+임계값을 넘은 문장은 슬로우 쿼리 로그(core/slow_query.py)에 남깁니다.
+"""
+
+import sys
+import time
+
+import pymysql.connections
+import pymysql.cursors
+
+from core.metrics import REGISTRY
+from core.slow_query import get_slow_query_log
+
+QUERY_DURATION = REGISTRY.histogram(
+    "db_query_duration_seconds",
+    "SQL statement latency by calling function",
+    labelnames=("function", "statement"),
+)
+QUERY_ROWS = REGISTRY.histogram(
+    "db_query_rows",
+    "Rows returned or affected per SQL statement",
+    labelnames=("function", "statement"),
+    buckets=(0, 1, 5, 10, 30, 100, 500, 1000, 5000, 10000),
+)
+QUERY_ERRORS = REGISTRY.counter(
+    "db_query_errors_total",
+    "SQL statements that raised an error",
+    labelnames=("function", "statement"),
+)
+COMMITS = REGISTRY.counter(
+    "db_commits_total",
+    "Transactions committed",
+    labelnames=("function",),
+)
+
+# 호출자 탐색 시 건너뛸 모듈 (드라이버/계측 내부)
+_INTERNAL_MODULES = (
+    "pymysql", "core.instrumentation", "core.slow_query", "core.database", "contextlib",
+)
+_MAX_CALLER_DEPTH = 12
+
+
+def _statement_type(query) -> str:
+    """SQL 문의 첫 키워드(SELECT/INSERT/UPDATE/DELETE ...)를 반환합니다."""
+    # executemany가 재작성한 다건 INSERT는 bytearray로 전달됨
+    if isinstance(query, (bytes, bytearray)):
+        query = bytes(query[:64]).decode("utf-8", "replace")
+    keyword = query.lstrip(" \t\r\n(").split(None, 1)
+    return keyword[0].upper() if keyword else "UNKNOWN"
+
+
+def _caller_name(depth: int = 2) -> str:
+    """
+    쿼리를 실행한 함수 이름을 찾습니다.
+    crud 모듈 함수를 우선하고, 없으면 드라이버 밖의 첫 번째 호출자를 사용합니다.
+    """
+    frame = sys._getframe(depth)
+    fallback = None
+    depth = 0
+    while frame is not None and depth < _MAX_CALLER_DEPTH:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("crud."):
+            return f"{module}.{frame.f_code.co_name}"
+        if fallback is None and not module.startswith(_INTERNAL_MODULES):
+            fallback = f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+        depth += 1
+    return fallback or "unknown"
+
+
+class InstrumentedCursorMixin:
+    """execute()를 감싸 지연 시간/행 수/호출 함수를 기록하는 커서 믹스인"""
+
+    def execute(self, query, args=None):
+        function = _caller_name()
+        statement = _statement_type(query)
+        started = time.perf_counter()
+        try:
+            result = super().execute(query, args)
+        except Exception:
+            QUERY_ERRORS.inc(function=function, statement=statement)
+            raise
+        elapsed = time.perf_counter() - started
+
+        QUERY_DURATION.observe(elapsed, function=function, statement=statement)
+        # 비버퍼 커서는 실행 시점에 행 수를 알 수 없음
+        if not isinstance(self, pymysql.cursors.SSCursor):
+            QUERY_ROWS.observe(max(self.rowcount, 0), function=function, statement=statement)
+        get_slow_query_log().record(self, query, args, elapsed, function, statement)
+        return result
+
+
+class InstrumentedDictCursor(InstrumentedCursorMixin, pymysql.cursors.DictCursor):
+    """결과를 딕셔너리로 반환하는 계측 커서 (기본 커서)"""
+
+
+class InstrumentedSSDictCursor(InstrumentedCursorMixin, pymysql.cursors.SSDictCursor):
+    """결과를 스트리밍(비버퍼)으로 반환하는 계측 딕셔너리 커서"""
+
+
+class InstrumentedConnection(pymysql.connections.Connection):
+    """commit 횟수를 호출 함수별로 기록하는 커넥션"""
+
+    def commit(self):
+        super().commit()
+        COMMITS.inc(function=_caller_name())
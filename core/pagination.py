@@ -0,0 +1,39 @@
+"""
+키셋(커서) 페이지네이션 유틸리티
+
+마지막 행의 정렬 키 값(예: DATE, WB_ID)을 URL-safe base64 JSON 문자열로 감싸
+클라이언트에게 불투명한 커서로 돌려주고, 다음 요청에서 다시 풀어 씁니다.
+"""
+
+import base64
+import json
+from typing import Any, List
+
+
+def encode_cursor(*values: Any) -> str:
+    """정렬 키 값들을 불투명한 커서 문자열로 변환합니다."""
+    raw = json.dumps([str(value) if not isinstance(value, int) else value for value in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> List[Any]:
+    """
+    커서 문자열을 정렬 키 값 목록으로 되돌립니다.
+    types는 위치별 값 타입입니다. (예: decode_cursor(cursor, str, int) → [DATE, WB_ID])
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 값 개수/타입이 types와 다른 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except Exception:
+        raise ValueError("Invalid cursor.")
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid cursor.")
+    # JSON의 true/false는 int의 하위 타입(bool)으로 풀리므로 따로 거름
+    for value, expected in zip(values, types):
+        if isinstance(value, bool) or not isinstance(value, expected):
+            raise ValueError("Invalid cursor.")
+    return values
@@ -0,0 +1,419 @@
+"""
+단어장 인메모리 검색 인덱스
+
+word_book 전체를 프로세스 메모리에 올려 두고 LIKE '%...%' 전체 스캔 없이 검색합니다.
+
+- 영어: 정규화한 표제어와 그 안의 각 단어를 (키, WB_ID) 정렬 배열에 넣고 bisect로 접두어 범위를 찾습니다.
+  트라이와 같은 접두어 검색을 제공하면서, 노드마다 dict를 두는 트라이보다 메모리를 크게 덜 씁니다.
+- 한국어: 뜻을 토큰으로 나눈 뒤 음절 유니그램/바이그램 역색인(posting set)을 만들고,
+  질의의 n-gram posting을 교집합한 후보만 실제 부분 문자열로 검증합니다.
+- 오타 허용 조회: 정규화한 표제어의 삭제 변형 색인(core.typo_index)으로 편집 거리가 가까운 단어를 찾습니다.
+  정규화는 채점과 같은 crud.tests.normalize_answer를 사용하므로 조회와 채점 결과가 일치합니다.
+
+시작 시 word_book에서 한 번 만들고(build), 이후에는 단어 쓰기 경로(VocabularyService)에서
+upsert/remove로 점진 갱신합니다. 재생성이 DB를 읽는 동안 들어온 점진 갱신은 기록해 두었다가
+새 인덱스로 교체할 때 다시 적용하므로 사라지지 않습니다. 크롤러 직접 저장처럼 다른 프로세스의 쓰기는
+SEARCH_INDEX_REBUILD_INTERVAL(초, 기본 3600)마다 백그라운드 재생성으로 반영됩니다.
+"""
+
+import bisect
+import heapq
+import logging
+import os
+import re
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from core.metrics import REGISTRY
+from core.typo_index import TypoIndex
+from crud import vocabulary as crud_voca
+from crud.tests import normalize_answer
+
+SEARCH_LATENCY = REGISTRY.histogram(
+    "search_index_query_duration_seconds",
+    "In-memory vocabulary search latency",
+    labelnames=("kind",),
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+HANGUL_RE = re.compile(r"[가-힣]")
+MEANING_TOKEN_RE = re.compile(r"[0-9a-z가-힣]+")
+
+# (WB_ID, DATE, WORD_ENGLISH, WORD_MEANING, 정규화한 표제어, 뜻 토큰, 최신순 정렬 키(-날짜 서수))
+Doc = Tuple[int, str, str, str, str, Tuple[str, ...], int]
+
+# 이 길이 이하의 짧은 질의는 후보가 많으므로 결과를 기억해 두고 인덱스가 바뀔 때 비움
+SHORT_QUERY_LENGTH = 2
+
+
+def meaning_tokens(text: str) -> List[str]:
+    """한국어 뜻을 검색용 토큰(한글/영숫자 연속 구간)으로 나눕니다."""
+    return MEANING_TOKEN_RE.findall(text.lower())
+
+
+def meaning_ngrams(tokens: Iterable[str]) -> Set[str]:
+    """토큰별 음절 유니그램과 바이그램 집합을 만듭니다. (토큰 경계는 넘지 않음)"""
+    grams: Set[str] = set()
+    for token in tokens:
+        grams.update(token)
+        grams.update(token[i:i + 2] for i in range(len(token) - 1))
+    return grams
+
+
+def normalize_headword(english: str) -> str:
+    """채점(crud.tests.normalize_answer)과 같은 규칙으로 표제어를 정규화하고 공백을 하나로 합칩니다."""
+    return " ".join(normalize_answer(english).split())
+
+
+def english_keys(normalized: str) -> List[str]:
+    """표제어의 접두어 검색 키: 정규화한 전체 표제어 + 그 안의 각 단어"""
+    if not normalized:
+        return []
+    keys = [normalized]
+    tokens = normalized.split()
+    if len(tokens) > 1:
+        keys.extend(dict.fromkeys(tokens))
+    return keys
+
+
+class SearchIndex:
+    """영어 접두어 + 한국어 n-gram 역색인"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs: Dict[int, Doc] = {}
+        # 정렬된 (키, WB_ID) 배열: 접두어 범위를 bisect로 찾음
+        self._english: List[Tuple[str, int]] = []
+        # n-gram -> WB_ID 집합
+        self._postings: Dict[str, Set[int]] = {}
+        # 정규화한 표제어 오타 허용 인덱스
+        self._typos = TypoIndex()
+        # 짧은 질의 결과 메모: (종류, 질의, limit) -> 결과
+        self._short_results: Dict[Tuple[str, str, int], list] = {}
+        self.ready = False
+        self.built_at = 0.0
+        self._building = False
+        # 백그라운드 재생성 중에 다시 요청되면 끝난 뒤 한 번 더 재생성
+        self._rebuild_requested = False
+        # 진행 중인 빌드별 점진 갱신 기록: WB_ID -> 마지막 행 (삭제면 None)
+        self._recorders: List[Dict[int, Optional[Dict[str, Any]]]] = []
+        self._ready_event = threading.Event()
+
+    # --- 빌드 / 갱신 ---
+
+    def build(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        word_book 행들로 인덱스를 새로 만듭니다.
+        새 구조를 락 밖에서 만든 뒤 한 번에 교체하므로, 빌드 중에도 기존 인덱스로 검색할 수 있습니다.
+        빌드 중에 들어온 upsert/remove는 교체 직후 같은 락 안에서 새 인덱스에 다시 적용합니다.
+        """
+        recorded: Dict[int, Optional[Dict[str, Any]]] = {}
+        with self._lock:
+            self._recorders.append(recorded)
+        try:
+            docs: Dict[int, Doc] = {}
+            english: List[Tuple[str, int]] = []
+            postings: Dict[str, Set[int]] = {}
+            typos = TypoIndex()
+            for row in rows:
+                doc = self._make_doc(row)
+                docs[doc[0]] = doc
+                english.extend((key, doc[0]) for key in english_keys(doc[4]))
+                _add_postings(postings, doc)
+                typos.add(doc[4], doc[0])
+            english.sort()
+
+            with self._lock:
+                self._docs = docs
+                self._english = english
+                self._postings = postings
+                self._typos = typos
+                self._short_results = {}
+                for wb_id, row in recorded.items():
+                    if row is None:
+                        self._remove_locked(wb_id)
+                    else:
+                        self._upsert_locked(self._make_doc(row))
+                self.ready = True
+                self.built_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._recorders.remove(recorded)
+        self._ready_event.set()
+        return len(self._docs)
+
+    @staticmethod
+    def _make_doc(row: Dict[str, Any]) -> Doc:
+        return (
+            int(row["WB_ID"]),
+            str(row["DATE"]),
+            row["WORD_ENGLISH"],
+            row["WORD_MEANING"],
+            normalize_headword(row["WORD_ENGLISH"]),
+            tuple(meaning_tokens(row["WORD_MEANING"])),
+            -date.fromisoformat(str(row["DATE"])).toordinal(),
+        )
+
+    def _remove_locked(self, wb_id: int) -> None:
+        self._short_results.clear()
+        doc = self._docs.pop(wb_id, None)
+        if doc is None:
+            return
+        for key in english_keys(doc[4]):
+            i = bisect.bisect_left(self._english, (key, wb_id))
+            if i < len(self._english) and self._english[i] == (key, wb_id):
+                del self._english[i]
+        for gram in meaning_ngrams(doc[5]):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(wb_id)
+                if not posting:
+                    del self._postings[gram]
+        self._typos.discard(doc[4], wb_id)
+
+    def _upsert_locked(self, doc: Doc) -> None:
+        self._remove_locked(doc[0])
+        self._docs[doc[0]] = doc
+        for key in english_keys(doc[4]):
+            bisect.insort(self._english, (key, doc[0]))
+        _add_postings(self._postings, doc)
+        self._typos.add(doc[4], doc[0])
+
+    def upsert(self, row: Dict[str, Any]) -> None:
+        """단어 한 건을 추가하거나 갱신합니다. (VocabularyService 쓰기 후 호출)"""
+        doc = self._make_doc(row)
+        with self._lock:
+            self._upsert_locked(doc)
+            for recorded in self._recorders:
+                recorded[doc[0]] = row
+
+    def remove(self, wb_id: int) -> None:
+        """단어 한 건을 인덱스에서 제거합니다."""
+        with self._lock:
+            self._remove_locked(wb_id)
+            for recorded in self._recorders:
+                recorded[wb_id] = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # --- 검색 ---
+
+    def _english_candidates(self, prefix: str) -> Dict[int, int]:
+        """접두어에 걸리는 WB_ID -> 순위 점수 (작을수록 우선)"""
+        # 정규화한 키는 [a-z0-9 ]만 포함하므로 prefix + "\x7f"가 접두어 범위의 상한
+        lo = bisect.bisect_left(self._english, (prefix,))
+        hi = bisect.bisect_left(self._english, (prefix + "\x7f",), lo)
+        docs = self._docs
+        matches: Dict[int, int] = {}
+        for key, wb_id in self._english[lo:hi]:
+            if key == docs[wb_id][4]:
+                score = 0 if key == prefix else 1  # 표제어 일치 > 표제어 접두어
+            else:
+                score = 2 if key == prefix else 3  # 구 안의 단어 일치 > 단어 접두어
+            if score < matches.get(wb_id, 4):
+                matches[wb_id] = score
+        return matches
+
+    def _korean_candidates(self, query: str) -> Dict[int, int]:
+        """질의 n-gram posting의 교집합을 실제 부분 문자열로 검증한 WB_ID -> 순위 점수"""
+        tokens = meaning_tokens(query)
+        grams = {token[i:i + 2] for token in tokens for i in range(len(token) - 1)} or set(
+            "".join(tokens)
+        )
+        postings = [self._postings.get(gram) for gram in grams]
+        if not postings or any(p is None for p in postings):
+            return {}
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return {}
+
+        matches: Dict[int, int] = {}
+        for wb_id in candidates:
+            doc_tokens = self._docs[wb_id][5]
+            if not all(any(q in t for t in doc_tokens) for q in tokens):
+                continue
+            if any(t == q for q in tokens for t in doc_tokens):
+                matches[wb_id] = 0  # 뜻의 한 항목과 정확히 일치
+            elif any(t.startswith(q) for q in tokens for t in doc_tokens):
+                matches[wb_id] = 1  # 뜻의 한 항목이 질의로 시작
+            else:
+                matches[wb_id] = 2  # 부분 일치
+        return matches
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[Doc, str, int]]:
+        """
+        질의로 단어를 검색합니다. 한글이 있으면 뜻에서, 없으면 영어 표제어 접두어로 찾습니다.
+
+        Returns:
+            (문서, 매칭 종류("english" / "korean"), 점수) 목록
+            점수 → 짧은 표제어/뜻 → 최신 날짜 순으로 정렬, 최대 limit개
+        """
+        started = time.perf_counter()
+        kind = "korean" if HANGUL_RE.search(query) else "english"
+        if kind == "english":
+            query = normalize_headword(query)
+        memo_key = (kind, query, limit)
+
+        with self._lock:
+            results = self._short_results.get(memo_key)
+            if results is None:
+                if kind == "korean":
+                    matches = self._korean_candidates(query)
+                    field = 3
+                else:
+                    matches = self._english_candidates(query) if query else {}
+                    field = 2
+
+                # 전체 정렬 없이 상위 limit개만 선택
+                docs = self._docs
+                top = heapq.nsmallest(
+                    limit,
+                    (
+                        (score, len(doc[field]), doc[6], wb_id)
+                        for wb_id, score in matches.items()
+                        for doc in (docs[wb_id],)
+                    ),
+                )
+                results = [(docs[wb_id], kind, score) for score, _, _, wb_id in top]
+                if len(query) <= SHORT_QUERY_LENGTH:
+                    self._short_results[memo_key] = results
+
+        SEARCH_LATENCY.observe(time.perf_counter() - started, kind=kind)
+        return results
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """자동완성: 정규화한 접두어로 시작하는 표제어를 중복 없이 정확도·짧은 순으로 반환합니다."""
+        prefix = normalize_headword(prefix)
+        if not prefix:
+            return []
+        memo_key = ("suggest", prefix, limit)
+
+        with self._lock:
+            results = self._short_results.get(memo_key)
+            if results is None:
+                headwords: Dict[str, int] = {}
+                for wb_id, score in self._english_candidates(prefix).items():
+                    headword = self._docs[wb_id][2]
+                    if score < headwords.get(headword, 4):
+                        headwords[headword] = score
+                top = heapq.nsmallest(
+                    limit, ((score, len(word), word) for word, score in headwords.items())
+                )
+                results = [word for _, _, word in top]
+                if len(prefix) <= SHORT_QUERY_LENGTH:
+                    self._short_results[memo_key] = results
+        return results
+
+    def lookup(self, query: str, max_distance: int = 2, limit: int = 10) -> List[Tuple[Doc, int]]:
+        """
+        오타 허용 조회: 정규화한 질의어와 편집 거리가 max_distance 이하인 표제어의 단어를 찾습니다.
+
+        Returns:
+            (문서, 편집 거리) 목록. 거리 → 최신 날짜 순, 최대 limit개
+        """
+        started = time.perf_counter()
+        term = normalize_headword(query)
+        if not term:
+            return []
+
+        with self._lock:
+            matches = self._typos.search(term, max_distance)
+            docs = self._docs
+            top = heapq.nsmallest(
+                limit,
+                (
+                    (distance, docs[wb_id][6], wb_id)
+                    for distance, _, ids in matches
+                    for wb_id in ids
+                ),
+            )
+            results = [(docs[wb_id], distance) for distance, _, wb_id in top]
+
+        SEARCH_LATENCY.observe(time.perf_counter() - started, kind="lookup")
+        return results
+
+    # --- 재생성 ---
+
+    @property
+    def building(self) -> bool:
+        return self._building
+
+    def wait_ready(self, timeout: float) -> bool:
+        """진행 중인 첫 빌드가 끝날 때까지 최대 timeout초 기다립니다."""
+        return self._ready_event.wait(timeout)
+
+    def needs_rebuild(self, interval: float) -> bool:
+        return not self.ready or (interval > 0 and time.monotonic() - self.built_at > interval)
+
+    def rebuild_from_db(self, db) -> int:
+        """word_book 전체를 스트리밍으로 읽어 인덱스를 다시 만듭니다."""
+        started = time.perf_counter()
+        with db.get_connection() as conn:
+            count = self.build(crud_voca.iter_all_words(conn))
+        logging.info(
+            f"Search index built: {count} words in {time.perf_counter() - started:.2f}s"
+        )
+        return count
+
+    def rebuild_in_background(self, db) -> None:
+        """
+        백그라운드 스레드에서 재생성합니다.
+        이미 재생성 중이면 그 재생성이 시작 후의 쓰기를 못 읽었을 수 있으므로, 끝난 뒤 한 번 더 재생성합니다.
+        """
+        with self._lock:
+            if self._building:
+                self._rebuild_requested = True
+                return
+            self._building = True
+
+        def run():
+            while True:
+                try:
+                    self.rebuild_from_db(db)
+                except Exception as e:
+                    logging.error(f"Search index rebuild failed: {e}")
+                with self._lock:
+                    if not self._rebuild_requested:
+                        self._building = False
+                        return
+                    self._rebuild_requested = False
+
+        threading.Thread(target=run, name="search-index-rebuild", daemon=True).start()
+
+
+def _add_postings(postings: Dict[str, Set[int]], doc: Doc) -> None:
+    for gram in meaning_ngrams(doc[5]):
+        postings.setdefault(gram, set()).add(doc[0])
+
+
+def get_rebuild_interval() -> float:
+    try:
+        return float(os.getenv("SEARCH_INDEX_REBUILD_INTERVAL", "3600"))
+    except ValueError:
+        logging.error("SEARCH_INDEX_REBUILD_INTERVAL is not a valid number. Using 3600.")
+        return 3600.0
+
+
+_search_index: Optional[SearchIndex] = None
+
+
+def get_search_index() -> SearchIndex:
+    """프로세스 전역 SearchIndex를 반환합니다."""
+    global _search_index
+    if _search_index is None:
+        _search_index = SearchIndex()
+    return _search_index
+
+
+REGISTRY.gauge_callback(
+    "search_index_documents",
+    "Words held by the in-memory search index",
+    lambda: [({}, len(_search_index) if _search_index is not None else 0)],
+)
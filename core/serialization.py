@@ -0,0 +1,77 @@
+"""
+DB 행 응답 직렬화 fast path
+
+DB에서 읽은 행은 이미 컬럼 타입이 보장되므로 응답 모델로 행마다 검증하지 않고
+(RowMapper) 필드 dict로만 바꾼 뒤 orjson으로 바로 직렬화합니다.
+응답 모델(Pydantic)은 OpenAPI 문서와 요청 검증용으로 그대로 두고, 필드 매핑이 모델과
+어긋나면 모듈 import 시점에 TypeError로 알립니다.
+
+출력은 Pydantic model_dump_json()과 같은 JSON입니다. (date/datetime은 ISO 8601, Decimal은 숫자)
+"""
+
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Type, TypeVar, Union
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+# 필드 값: DB 컬럼명 또는 행을 받아 값을 만드는 함수 (집계 결과 형 변환 등)
+Column = Union[str, Callable[[Dict[str, Any]], Any]]
+
+
+def _default(value: Any) -> Any:
+    """orjson이 기본 지원하지 않는 DB 값 (SUM/AVG 결과 Decimal)"""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """응답 본문을 JSON bytes로 직렬화합니다."""
+    return orjson.dumps(content, default=_default)
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 본문을 만드는 JSON 응답 (앱 기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class RowMapper:
+    """DB 행(dict) → 응답 모델 필드 dict 변환 규칙"""
+
+    def __init__(self, model: Type[M], columns: Dict[str, Column]):
+        fields = list(model.model_fields)
+        missing = set(fields) - set(columns)
+        unknown = set(columns) - set(fields)
+        if missing or unknown:
+            raise TypeError(
+                f"{model.__name__} row mapping does not match the model "
+                f"(missing: {sorted(missing)}, unknown: {sorted(unknown)})"
+            )
+
+        self.model = model
+        # 모델 필드 순서대로 (model_dump_json과 같은 키 순서). 계산 필드는 자리만 잡아 두고 나중에 채움
+        self._columns = [
+            (field, None if callable(columns[field]) else columns[field]) for field in fields
+        ]
+        self._computed = [(field, columns[field]) for field in fields if callable(columns[field])]
+
+    def to_dict(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """검증 없이 필드 dict로 변환합니다. (DB에서 읽은 행 전용)"""
+        get = row.get
+        data = {field: get(column) for field, column in self._columns}
+        for field, compute in self._computed:
+            data[field] = compute(row)
+        return data
+
+    def to_dicts(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [self.to_dict(row) for row in rows]
+
+    def to_model(self, row: Dict[str, Any]) -> M:
+        """검증을 거친 응답 모델로 변환합니다. (모델 객체가 필요한 곳용)"""
+        return self.model.model_validate(self.to_dict(row))
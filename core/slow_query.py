@@ -0,0 +1,158 @@
+"""
+슬로우 쿼리 로그
+
+DatabaseManager 커서로 실행된 SQL 문이 임계값(DB_SLOW_QUERY_MS)을 넘으면
+바인딩 파라미터, 소요 시간, 같은 커넥션에서 얻은 EXPLAIN FORMAT=JSON 결과를
+회전 로그 파일(DB_SLOW_QUERY_LOG)에 JSON 한 줄로 기록합니다.
+
+환경 변수:
+    DB_SLOW_QUERY_MS              임계값 (ms, 기본 200, 0 이하면 비활성화)
+    DB_SLOW_QUERY_LOG             로그 파일 경로 (기본 be/logs/slow_query.log)
+    DB_SLOW_QUERY_LOG_MAX_BYTES   파일 하나의 최대 크기 (기본 10MB)
+    DB_SLOW_QUERY_LOG_BACKUPS     보관할 회전 파일 수 (기본 5)
+    DB_SLOW_QUERY_EXPLAIN         EXPLAIN 수집 여부 (기본 true)
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Optional
+
+import pymysql.cursors
+
+from core.metrics import REGISTRY
+
+SLOW_QUERIES = REGISTRY.counter(
+    "db_slow_queries_total",
+    "SQL statements slower than DB_SLOW_QUERY_MS",
+    labelnames=("function", "statement"),
+)
+
+# EXPLAIN을 지원하는 문장 종류
+EXPLAINABLE_STATEMENTS = {"SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE"}
+
+# 다건 INSERT처럼 매우 긴 SQL은 앞부분만 기록
+MAX_LOGGED_SQL_LENGTH = 4000
+
+# executemany가 재작성한 다건 VALUES(INSERT ... VALUES (...),(...)): 문장 전체를 다시 보내야 하고
+# 계획은 한 행짜리와 같으므로 EXPLAIN하지 않음
+_MULTI_ROW_VALUES = re.compile(r"\bVALUES\s*\(.*\)\s*,\s*\(", re.IGNORECASE | re.DOTALL)
+
+DEFAULT_LOG_PATH = Path(__file__).resolve().parent.parent / "logs" / "slow_query.log"
+
+
+def _get_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        logging.error(f"{name} is not a valid integer. Using {default}.")
+        return default
+
+
+class SlowQueryLog:
+    """임계값을 넘은 SQL 문을 EXPLAIN과 함께 회전 파일에 기록합니다."""
+
+    def __init__(self):
+        try:
+            self.threshold_ms = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+        except ValueError:
+            logging.error("DB_SLOW_QUERY_MS is not a valid number. Using 200.")
+            self.threshold_ms = 200.0
+        self.explain = os.getenv("DB_SLOW_QUERY_EXPLAIN", "true").strip().lower() in (
+            "1", "true", "yes", "on",
+        )
+        self.path = Path(os.getenv("DB_SLOW_QUERY_LOG", str(DEFAULT_LOG_PATH)))
+        self.max_bytes = _get_int("DB_SLOW_QUERY_LOG_MAX_BYTES", 10 * 1024 * 1024)
+        self.backups = _get_int("DB_SLOW_QUERY_LOG_BACKUPS", 5)
+        self._logger: Optional[logging.Logger] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    def _get_logger(self) -> logging.Logger:
+        """첫 슬로우 쿼리가 발생할 때 파일 핸들러를 준비합니다."""
+        if self._logger is None:
+            with self._lock:
+                if self._logger is None:
+                    logger = logging.getLogger("slow_query")
+                    logger.setLevel(logging.WARNING)
+                    logger.propagate = False  # 앱 로그와 섞이지 않도록 분리
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    handler = RotatingFileHandler(
+                        self.path, maxBytes=self.max_bytes, backupCount=self.backups, encoding="utf-8"
+                    )
+                    handler.setFormatter(logging.Formatter("%(message)s"))
+                    logger.addHandler(handler)
+                    self._logger = logger
+        return self._logger
+
+    @staticmethod
+    def _decode(cursor, query) -> str:
+        """
+        executemany는 다건 INSERT를 커넥션 인코딩의 bytes(bytearray)로 만든 뒤 execute(bytes, None)를
+        호출하므로 문자열로 되돌립니다.
+        """
+        if isinstance(query, (bytes, bytearray)):
+            encoding = getattr(cursor.connection, "encoding", None) or "utf-8"
+            return query.decode(encoding, "replace")
+        return query
+
+    def _explain(self, cursor, query: str, args) -> Optional[object]:
+        """같은 커넥션에서 EXPLAIN FORMAT=JSON을 실행해 실행 계획을 가져옵니다."""
+        if _MULTI_ROW_VALUES.search(query):
+            return {"skipped": "multi-row VALUES"}
+        try:
+            # args가 None이면 이미 값이 채워진 문장 (executemany가 재작성한 다건 INSERT 등)
+            statement = query if args is None else cursor.mogrify(query, args)
+            # 계측되지 않는 기본 커서를 사용해야 EXPLAIN 자체가 다시 기록되지 않음
+            with cursor.connection.cursor(pymysql.cursors.Cursor) as explain_cursor:
+                explain_cursor.execute(f"EXPLAIN FORMAT=JSON {statement}")
+                row = explain_cursor.fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            return {"error": str(e)}
+
+    def record(self, cursor, query, args, elapsed: float, function: str, statement: str) -> None:
+        """실행 시간이 임계값을 넘었으면 슬로우 쿼리로 기록합니다."""
+        elapsed_ms = elapsed * 1000
+        if not self.enabled or elapsed_ms < self.threshold_ms:
+            return
+
+        SLOW_QUERIES.inc(function=function, statement=statement)
+
+        query = self._decode(cursor, query)
+        unbuffered = isinstance(cursor, pymysql.cursors.SSCursor)
+        plan = None
+        # 비버퍼 커서는 결과를 다 읽기 전까지 커넥션을 쓸 수 없으므로 EXPLAIN 생략
+        if self.explain and statement in EXPLAINABLE_STATEMENTS and not unbuffered:
+            plan = self._explain(cursor, query, args)
+
+        entry = {
+            "logged_at": datetime.now().isoformat(timespec="milliseconds"),
+            "function": function,
+            "statement": statement,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "rows": None if unbuffered else cursor.rowcount,
+            "sql": " ".join(query.split())[:MAX_LOGGED_SQL_LENGTH],
+            "params": args,
+            "explain": plan,
+        }
+        self._get_logger().warning(json.dumps(entry, ensure_ascii=False, default=str))
+
+
+_slow_query_log: Optional[SlowQueryLog] = None
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """프로세스 전역 SlowQueryLog를 반환합니다. (환경 변수가 로드된 뒤 처음 생성)"""
+    global _slow_query_log
+    if _slow_query_log is None:
+        _slow_query_log = SlowQueryLog()
+    return _slow_query_log
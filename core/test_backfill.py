@@ -0,0 +1,199 @@
+"""
+시험 주차 정보 / 시험 단어 기간 일괄 생성기 (백필)
+
+--from ~ --to 사이의 모든 토요일에 대해 주차 정보와 시험 단어를 한 번에 만듭니다.
+주차 계산과 단어 선택은 TestWeekCreator / TestWordsCreator와 같은 규칙(같은 시드)을 쓰므로
+한 주씩 생성한 결과와 같고, DB 작업만 묶어서 처리합니다.
+
+- 기존 주차 조회 1회, 기간 전체 word_book 조회 1회
+- 주차 / 시험 단어는 batch_size 주씩 다건 INSERT(executemany) 후 트랜잭션 하나로 commit
+- 이미 있는 주차(START_DATE 또는 NAME 중복)는 건너뜀
+- 이미 시험 단어가 있는 주차는 건너뜀 (overwrite=True면 삭제 후 재생성, 해당 주차 답안도 함께 삭제됨)
+
+배치 하나가 실패하면 그 배치만 rollback되고 이전 배치는 남습니다. 같은 기간으로 다시 실행하면
+이미 만든 주차/단어는 건너뛰므로 이어서 진행됩니다.
+"""
+
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+from core.cache import bump_version
+from core.database import DatabaseManager
+from core.test_week_creator import TestWeekCreator
+from core.test_words_creator import TestWordsCreator
+from core.test_words_snapshot import save_test_week_words_snapshot
+from core.week_index import get_week_index
+from crud import test_weeks as crud_test_weeks
+from crud import vocabulary as crud_vocabulary
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 트랜잭션 하나로 묶는 주차 수
+DEFAULT_BATCH_SIZE = 10
+
+
+def _chunks(items: List[Any], size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class TestBackfill:
+    """기간 단위 주차 정보 / 시험 단어 일괄 생성 클래스"""
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db_manager = DatabaseManager()
+        self.batch_size = max(1, batch_size)
+        self.week_creator = TestWeekCreator()
+        self.words_creator = TestWordsCreator()
+
+    def get_saturdays(self, date_from: datetime, date_to: datetime) -> List[datetime]:
+        """date_from ~ date_to(포함) 사이의 토요일 목록"""
+        saturday = self.week_creator.get_this_saturday(date_from)
+        saturdays = []
+        while saturday.date() <= date_to.date():
+            saturdays.append(saturday)
+            saturday += timedelta(days=7)
+        return saturdays
+
+    def create_weeks(self, saturdays: List[datetime], stats: Dict[str, Any]) -> None:
+        """없는 주차만 batch_size 주씩 다건 INSERT합니다."""
+        with self.db_manager.get_connection() as conn:
+            existing = crud_test_weeks.get_all_weeks(conn)
+        start_dates = {str(week["START_DATE"]) for week in existing}
+        names = {week["NAME"] for week in existing}
+
+        rows: List[Tuple[str, str, str, str, str]] = []
+        for saturday in saturdays:
+            week = self.week_creator.calculate_week_info(saturday)
+            name, start_date = week[0], week[1]
+            if start_date in start_dates or name in names:
+                logger.info(f"이미 존재하는 주차 건너뜀: {name} ({start_date})")
+                stats["weeks_skipped"] += 1
+                continue
+            start_dates.add(start_date)
+            names.add(name)
+            rows.append(week)
+
+        for batch in _chunks(rows, self.batch_size):
+            with self.db_manager.transaction() as conn:
+                crud_test_weeks.insert_weeks(conn, batch)
+                # 주차 범위에 이미 들어온 단어 수 저장
+                crud_test_weeks.refresh_word_counts(conn, batch[0][1], batch[-1][2])
+            stats["weeks_created"] += len(batch)
+            logger.info(f"✓ 주차 {len(batch)}개 저장: {batch[0][0]} ~ {batch[-1][0]}")
+
+        if rows:
+            get_week_index().invalidate()
+
+    def create_words(
+        self, saturdays: List[datetime], word_count: int, overwrite: bool, stats: Dict[str, Any]
+    ) -> None:
+        """기간 전체 단어를 한 번에 읽고 주차별로 선택해 batch_size 주씩 저장합니다."""
+        with self.db_manager.get_connection() as conn:
+            weeks_by_start = {str(week["START_DATE"]): week for week in crud_test_weeks.get_all_weeks(conn)}
+
+            targets = []
+            for saturday in saturdays:
+                start_date = (saturday - timedelta(days=9)).strftime("%Y-%m-%d")
+                week = weeks_by_start.get(start_date)
+                if week is None:
+                    logger.warning(f"토요일 {saturday:%Y-%m-%d}에 해당하는 주차 정보가 없습니다.")
+                    stats["words_skipped"] += 1
+                    continue
+                targets.append((saturday, week))
+            if not targets:
+                return
+
+            existing = crud_test_weeks.get_week_ids_with_words(conn, [week["TWI_ID"] for _, week in targets])
+            rows = crud_vocabulary.get_words_for_dates(
+                conn, start_date=str(targets[0][1]["START_DATE"]), end_date=str(targets[-1][1]["END_DATE"])
+            )
+
+        words_by_date: Dict[str, List[Dict]] = {}
+        for row in rows:
+            date_str = str(row["DATE"])
+            words_by_date.setdefault(date_str, []).append({
+                "wb_id": row["WB_ID"],
+                "date": date_str,
+                "word_english": row["WORD_ENGLISH"],
+                "word_meaning": row["WORD_MEANING"]
+            })
+        stats["word_book_rows"] = len(rows)
+
+        # 주차별 선택: (twi_id, 주차명, 선택된 WB_ID 목록)
+        selections: List[Tuple[int, str, List[int]]] = []
+        for saturday, week in targets:
+            twi_id, name = week["TWI_ID"], week["NAME"]
+            if twi_id in existing and not overwrite:
+                logger.info(f"이미 시험 단어가 있는 주차 건너뜀: {name} (ID: {twi_id})")
+                stats["words_skipped"] += 1
+                continue
+
+            start = week["START_DATE"]
+            days = (week["END_DATE"] - start).days + 1
+            week_words = {}
+            for offset in range(days):
+                date_str = str(start + timedelta(days=offset))
+                if date_str in words_by_date:
+                    week_words[date_str] = words_by_date[date_str]
+            if not week_words:
+                logger.warning(f"출제 범위({start} ~ {week['END_DATE']})에 단어가 없습니다: {name}")
+                stats["words_skipped"] += 1
+                continue
+
+            # 한 주씩 생성할 때와 같은 시드
+            selected = self.words_creator.select_words_evenly(week_words, word_count, int(saturday.timestamp()))
+            selections.append((twi_id, name, [word["wb_id"] for word in selected]))
+
+        for batch in _chunks(selections, self.batch_size):
+            twi_ids = [twi_id for twi_id, _, _ in batch]
+            with self.db_manager.transaction() as conn:
+                crud_test_weeks.delete_test_words(conn, [twi_id for twi_id in twi_ids if twi_id in existing])
+                inserted = crud_test_weeks.insert_test_words(
+                    conn, [(twi_id, wb_id) for twi_id, _, wb_ids in batch for wb_id in wb_ids]
+                )
+                for twi_id in twi_ids:
+                    save_test_week_words_snapshot(conn, twi_id)
+            stats["words_weeks"] += len(batch)
+            stats["words_inserted"] += inserted
+            logger.info(f"✓ 시험 단어 {inserted}개 저장: {batch[0][1]} ~ {batch[-1][1]}")
+
+        if selections:
+            # 같은 프로세스의 읽기 캐시 무효화 (다른 프로세스는 캐시 TTL로 반영)
+            bump_version()
+
+    def run(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        create_weeks: bool = True,
+        create_words: bool = True,
+        word_count: int = 30,
+        overwrite: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        기간 백필 실행
+
+        Returns:
+            통계 dict (saturdays, weeks_created, weeks_skipped, words_weeks, words_inserted,
+            words_skipped, word_book_rows, elapsed)
+        """
+        started = time.perf_counter()
+        stats: Dict[str, Any] = {
+            "saturdays": 0, "weeks_created": 0, "weeks_skipped": 0,
+            "words_weeks": 0, "words_inserted": 0, "words_skipped": 0, "word_book_rows": 0,
+        }
+        saturdays = self.get_saturdays(date_from, date_to)
+        stats["saturdays"] = len(saturdays)
+        logger.info(f"대상 토요일 {len(saturdays)}개 (배치 크기 {self.batch_size}주)")
+
+        if saturdays:
+            if create_weeks:
+                self.create_weeks(saturdays, stats)
+            if create_words:
+                self.create_words(saturdays, word_count, overwrite, stats)
+
+        stats["elapsed"] = time.perf_counter() - started
+        return stats
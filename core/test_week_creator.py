@@ -7,7 +7,9 @@
 from datetime import datetime, timedelta
 import logging
 from typing import Tuple, Optional
+from core.week_index import get_week_index
 from core.database import DatabaseManager
+from crud import test_weeks as crud_test_weeks
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -140,11 +142,17 @@ class TestWeekCreator:
                     VALUES (%s, %s, %s, %s, %s)
                     """
                     cursor.execute(insert_query, (name, start_date, end_date, test_start_datetime, test_end_datetime))
-                    conn.commit()
 
                     # 생성된 ID 조회
                     twi_id = cursor.lastrowid
 
+                    # 주차 범위에 이미 들어온 단어 수 저장 (이후에는 word_book 쓰기 경로에서 갱신)
+                    crud_test_weeks.refresh_word_counts(conn, start_date, end_date)
+                    conn.commit()
+
+                    # 이 프로세스의 주차 인덱스(시험 가능 여부, 주차 찾기) 갱신 (다른 프로세스는 인덱스 TTL 이내에 반영)
+                    get_week_index().invalidate()
+
                     logger.info(f"✓ 주차 정보 생성 완료: {name} (ID: {twi_id})")
 
                     return {
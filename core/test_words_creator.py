@@ -9,6 +9,9 @@ import logging
 import random
 from typing import List, Optional, Dict
 from core.database import DatabaseManager
+from core.cache import bump_version
+from core.week_index import get_week_index
+from core.test_words_snapshot import save_test_week_words_snapshot
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -60,31 +63,22 @@ class TestWordsCreator:
         saturday_str = saturday.strftime("%Y-%m-%d")
 
         try:
-            with self.db_manager.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    # 토요일이 포함된 주차 찾기
-                    # start_date <= saturday - 3 and end_date >= saturday - 3
-                    # 즉, 수요일 날짜로 주차를 찾음
-                    wednesday = (saturday - timedelta(days=3)).strftime("%Y-%m-%d")
-
-                    query = """
-                    SELECT TWI_ID, NAME, START_DATE, END_DATE
-                    FROM test_week_info
-                    WHERE %s BETWEEN START_DATE AND END_DATE
-                    """
-                    cursor.execute(query, (wednesday,))
-                    result = cursor.fetchone()
-
-                    if result:
-                        return {
-                            "twi_id": result["TWI_ID"],
-                            "name": result["NAME"],
-                            "start_date": str(result["START_DATE"]),
-                            "end_date": str(result["END_DATE"])
-                        }
-                    else:
-                        logger.warning(f"토요일 {saturday_str}에 해당하는 주차 정보가 없습니다.")
-                        return None
+            # 토요일이 포함된 주차 찾기
+            # start_date <= saturday - 3 and end_date >= saturday - 3
+            # 즉, 수요일 날짜로 주차를 찾음 (주차 구간 인덱스, 만료된 경우에만 DB 조회)
+            wednesday = saturday - timedelta(days=3)
+            result = get_week_index().get(self.db_manager).containing(wednesday)
+
+            if result:
+                return {
+                    "twi_id": result["TWI_ID"],
+                    "name": result["NAME"],
+                    "start_date": str(result["START_DATE"]),
+                    "end_date": str(result["END_DATE"])
+                }
+            else:
+                logger.warning(f"토요일 {saturday_str}에 해당하는 주차 정보가 없습니다.")
+                return None
 
         except Exception as e:
             logger.error(f"주차 정보 조회 중 오류: {e}", exc_info=True)
@@ -296,7 +290,12 @@ class TestWordsCreator:
                     for word in selected_words:
                         cursor.execute(insert_query, (twi_id, word["wb_id"]))
 
+                    # 응답(JSON + gzip)을 미리 만들어 같은 트랜잭션으로 저장 (GET /test-weeks/{twi_id}/words가 그대로 응답)
+                    save_test_week_words_snapshot(conn, twi_id)
+
                     conn.commit()
+                    # 같은 프로세스의 읽기 캐시 무효화 (다른 프로세스는 캐시 TTL로 반영)
+                    bump_version()
 
                     logger.info(f"✓ {len(selected_words)}개 단어 저장 완료")
 
@@ -0,0 +1,80 @@
+"""
+주차 단어 목록 응답 스냅샷 (test_words_snapshot)
+
+GET /test-weeks/{twi_id}/words 응답(JSON + gzip)을 만드는 규칙을 한 곳에 둡니다.
+TestWeekService(응답/재저장)와 TestWordsCreator / TestBackfill(시험 단어 생성 시 저장)이 함께 사용합니다.
+"""
+
+import gzip
+from typing import Any, Dict, Optional
+
+from pymysql.connections import Connection
+
+from core.http_cache import Validator, make_etag
+from core.serialization import dumps
+from crud import test_weeks as crud_test_weeks
+from schemas.test_weeks import TEST_WEEK_WORD_ROW
+
+
+def words_validator(twi_id: int, row: Dict[str, Any]) -> Validator:
+    """get_test_week_words_validator 행 → (ETag, Last-Modified)"""
+    etag = make_etag(
+        "test_week_words", twi_id,
+        row["WEEK_UPDATED_AT"], row["WORD_COUNT"], row["MAX_TW_ID"],
+        row["WORDS_UPDATED_AT"], row["WORD_BOOK_UPDATED_AT"], row["DAILY_VERSION"],
+    )
+    last_modified = max(
+        value
+        for value in (
+            row["WEEK_UPDATED_AT"], row["WORDS_UPDATED_AT"],
+            row["WORD_BOOK_UPDATED_AT"], row["DAILY_UPDATED_AT"],
+        )
+        if value
+    )
+    return etag, last_modified
+
+
+def compress(body: bytes) -> bytes:
+    # mtime=0: 같은 본문이면 같은 압축본
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def load_test_week_words(conn: Connection, twi_id: int) -> Optional[Dict[str, Any]]:
+    """주차 단어 목록 응답(TestWeekWordsResponse 형태의 dict)을 조회합니다. 주차가 없으면 None"""
+    # 주차 정보 조회
+    week_info = crud_test_weeks.get_test_week_by_id(conn, twi_id)
+    if not week_info:
+        return None
+
+    # 단어 목록 조회
+    db_words = crud_test_weeks.get_test_week_words(conn, twi_id)
+
+    return {
+        "twi_id": week_info['TWI_ID'],
+        "week_name": week_info['NAME'],
+        "start_date": week_info['START_DATE'],
+        "end_date": week_info['END_DATE'],
+        "test_start_datetime": week_info['TEST_START_DATETIME'],
+        "test_end_datetime": week_info['TEST_END_DATETIME'],
+        "words": TEST_WEEK_WORD_ROW.to_dicts(db_words),
+    }
+
+
+def save_test_week_words_snapshot(conn: Connection, twi_id: int) -> Optional[str]:
+    """
+    주차 단어 목록 응답을 직렬화·gzip 압축해 스냅샷으로 저장합니다.
+    시험 단어를 쓴 트랜잭션 안에서 commit 전에 호출합니다. (commit은 호출자 책임)
+
+    Returns:
+        저장한 스냅샷의 ETag (주차가 없으면 None)
+    """
+    row = crud_test_weeks.get_test_week_words_validator(conn, twi_id)
+    if not row:
+        return None
+    etag, _ = words_validator(twi_id, row)
+    words = load_test_week_words(conn, twi_id)
+    if words is None:
+        return None
+    body = dumps(words)
+    crud_test_weeks.save_words_snapshot(conn, twi_id, etag, body, compress(body))
+    return etag
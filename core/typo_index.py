@@ -0,0 +1,175 @@
+"""
+오타 허용 표제어 조회 인덱스 (symmetric delete)
+
+각 표제어에서 글자를 최대 MAX_DISTANCE개까지 지운 변형을 모두 색인해 두고,
+질의어에서도 같은 방식으로 변형을 만들어 겹치는 표제어만 후보로 삼습니다.
+편집 거리가 r 이하인 두 문자열은 각각 r개 이하를 지워 같은 문자열이 되므로 후보 누락이 없으며,
+후보는 비트 병렬 편집 거리로 다시 검증합니다.
+
+BK-tree도 검토했으나 순수 파이썬에서는 거리 2 조회가 노드의 20~40%를 방문해 수 ms가 걸렸고,
+이 방식은 메모리(표제어당 변형 수십 개)를 더 쓰는 대신 조회가 dict 조회 수십 번으로 끝납니다.
+
+변형 수는 길이 n에 대해 O(n²)(거리 2에서 n=255면 약 3만 개)이므로 MAX_INDEXED_LENGTH자 이하
+표제어만 변형을 색인합니다. 더 긴 표제어(주로 구/문장)는 길이별로만 모아 두고, 질의어와 길이 차가
+max_distance 이내인 것만 편집 거리로 직접 비교합니다.
+"""
+
+from typing import Dict, List, Set, Tuple, Union
+
+# 색인하는 최대 편집 거리 (조회 max_distance 상한)
+MAX_DISTANCE = 2
+
+# 삭제 변형을 색인하는 최대 표제어 길이 (더 긴 표제어는 길이별 목록에서 직접 비교)
+MAX_INDEXED_LENGTH = 32
+
+
+def levenshtein(a: str, b: str) -> int:
+    """두 문자열의 편집 거리(삽입/삭제/치환 각 1)를 구합니다."""
+    if len(a) < len(b):
+        a, b = b, a
+    return _distance(_pattern_masks(b), len(b), a)
+
+
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    """패턴의 글자별 위치 비트마스크 (비트 병렬 편집 거리용)"""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _distance(masks: Dict[str, int], m: int, text: str) -> int:
+    """
+    Myers/Hyyrö 비트 병렬 편집 거리. DP 표의 한 열을 정수 비트로 표현해
+    text 글자당 비트 연산 몇 번으로 계산합니다. 같은 질의어로 여러 후보와 비교하므로
+    패턴 마스크는 호출하는 쪽에서 한 번만 만듭니다.
+    """
+    if m == 0:
+        return len(text)
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    positive, negative, score = full, 0, m
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | negative
+        xh = (((eq & positive) + positive) ^ positive) | eq
+        hp = negative | (~(xh | positive) & full)
+        hn = positive & xh
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        positive = hn | (~(xv | hp) & full)
+        negative = hp & xv
+    return score
+
+
+def deletion_variants(term: str, max_deletes: int) -> Set[str]:
+    """term에서 글자를 0~max_deletes개 지운 모든 문자열"""
+    variants = {term}
+    frontier = {term}
+    for _ in range(max_deletes):
+        frontier = {
+            word[:i] + word[i + 1:]
+            for word in frontier
+            for i in range(len(word))
+        }
+        variants |= frontier
+    return variants
+
+
+class TypoIndex:
+    """정규화한 표제어 -> WB_ID 집합을 편집 거리로 조회하는 인덱스"""
+
+    def __init__(self):
+        # 표제어 -> WB_ID 집합
+        self._terms: Dict[str, Set[int]] = {}
+        # 삭제 변형 -> 표제어 (하나면 문자열 그대로, 여럿이면 집합으로 메모리 절약)
+        self._variants: Dict[str, Union[str, Set[str]]] = {}
+        # MAX_INDEXED_LENGTH자보다 긴 표제어: 길이 -> 표제어 집합
+        self._long_terms: Dict[int, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def add(self, term: str, wb_id: int) -> None:
+        """표제어에 WB_ID를 추가합니다. 처음 보는 표제어면 삭제 변형을 색인합니다."""
+        if not term:
+            return
+        ids = self._terms.get(term)
+        if ids is None:
+            ids = self._terms[term] = set()
+            if len(term) > MAX_INDEXED_LENGTH:
+                self._long_terms.setdefault(len(term), set()).add(term)
+                ids.add(wb_id)
+                return
+            for variant in deletion_variants(term, MAX_DISTANCE):
+                owner = self._variants.get(variant)
+                if owner is None:
+                    self._variants[variant] = term
+                elif isinstance(owner, str):
+                    self._variants[variant] = {owner, term}
+                else:
+                    owner.add(term)
+        ids.add(wb_id)
+
+    def discard(self, term: str, wb_id: int) -> None:
+        """표제어에서 WB_ID를 뺍니다. 남은 WB_ID가 없으면 변형 색인도 지웁니다."""
+        ids = self._terms.get(term)
+        if ids is None:
+            return
+        ids.discard(wb_id)
+        if ids:
+            return
+
+        del self._terms[term]
+        if len(term) > MAX_INDEXED_LENGTH:
+            same_length = self._long_terms[len(term)]
+            same_length.discard(term)
+            if not same_length:
+                del self._long_terms[len(term)]
+            return
+        for variant in deletion_variants(term, MAX_DISTANCE):
+            owner = self._variants.get(variant)
+            if owner == term:
+                del self._variants[variant]
+            elif isinstance(owner, set):
+                owner.discard(term)
+                if len(owner) == 1:
+                    self._variants[variant] = next(iter(owner))
+
+    def search(self, term: str, max_distance: int) -> List[Tuple[int, str, Set[int]]]:
+        """
+        질의어와의 편집 거리가 max_distance(최대 MAX_DISTANCE) 이하인 표제어를 찾습니다.
+
+        Returns:
+            (거리, 표제어, WB_ID 집합) 목록, 거리 → 표제어 순
+        """
+        max_distance = min(max_distance, MAX_DISTANCE)
+        length = len(term)
+        candidates: Set[str] = set()
+        # 색인된 표제어와 길이 차가 max_distance를 넘는 긴 질의어는 변형을 만들지 않음
+        if length - max_distance <= MAX_INDEXED_LENGTH:
+            for variant in deletion_variants(term, max_distance):
+                owner = self._variants.get(variant)
+                if owner is None:
+                    continue
+                if isinstance(owner, str):
+                    candidates.add(owner)
+                else:
+                    candidates.update(owner)
+        for other_length in range(max(length - max_distance, MAX_INDEXED_LENGTH + 1), length + max_distance + 1):
+            candidates.update(self._long_terms.get(other_length, ()))
+
+        masks = _pattern_masks(term)
+        results = []
+        for candidate in candidates:
+            if abs(len(candidate) - length) > max_distance:
+                continue
+            distance = _distance(masks, length, candidate)
+            if distance <= max_distance:
+                results.append((distance, candidate, self._terms[candidate]))
+        results.sort(key=lambda match: (match[0], match[1]))
+        return results
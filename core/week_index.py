@@ -0,0 +1,146 @@
+"""
+시험 주차 구간 인덱스 (인프로세스)
+
+test_week_info 전체(주차는 1년에 52개 남짓)를 START_DATE 순으로 메모리에 두고 bisect로
+"날짜 D를 포함하는 주차", "현재 주차(단어가 있는 가장 최근 주차)", "다음 시험"을
+DB 왕복 없이 O(log n)으로 찾습니다. 주차 구간은 서로 겹치지 않으므로(uk_test_week_info_start_date,
+목~수 고정) START_DATE 순서가 END_DATE·시험 시각 순서와 같습니다.
+
+DB는 인덱스가 만료(TTL)되었거나 주차 생성으로 무효화된 경우에만 다시 읽습니다.
+스케줄러처럼 다른 프로세스에서 생성된 주차는 무효화할 수 없으므로 TTL이 반영 지연의 상한입니다.
+
+환경 변수:
+    WEEK_INDEX_TTL   인덱스 유효 시간 (초, 기본 30)
+"""
+
+import logging
+import os
+import threading
+import time
+from bisect import bisect_right
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from core.metrics import REGISTRY
+from crud import test_weeks as crud_test_weeks
+
+WEEK_INDEX_REFRESHES = REGISTRY.counter(
+    "week_index_refreshes_total",
+    "Test week interval index reloads from the database",
+)
+
+Week = Dict[str, Any]
+
+
+def _get_ttl() -> float:
+    try:
+        return float(os.getenv("WEEK_INDEX_TTL", "30"))
+    except ValueError:
+        logging.error("WEEK_INDEX_TTL is not a valid number. Using 30.")
+        return 30.0
+
+
+def _as_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+class _Intervals(NamedTuple):
+    """한 번에 교체되는 인덱스 구조 (읽는 쪽은 락 없이 참조 하나만 잡음)"""
+
+    weeks: List[Week]                 # START_DATE 오름차순
+    starts: List[date]                # weeks[i]["START_DATE"]
+    test_starts: List[datetime]       # weeks[i]["TEST_START_DATETIME"]
+    current: Optional[Week]           # 단어가 있는 가장 최근 주차
+
+
+_EMPTY = _Intervals([], [], [], None)
+
+
+class WeekIndex:
+    """START_DATE로 정렬된 주차 구간 배열과 만료 시각"""
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else _get_ttl()
+        self._lock = threading.Lock()
+        self._intervals = _EMPTY
+        # time.monotonic() 기준 만료 시각 (0이면 아직 읽지 않았거나 무효화됨)
+        self._expires_at = 0.0
+
+    # --- 적재 / 갱신 ---
+
+    def load(self, weeks: Iterable[Week]) -> None:
+        """주차 행들로 인덱스를 새로 만들어 교체합니다."""
+        rows = sorted(weeks, key=lambda week: _as_date(week["START_DATE"]))
+        current = next((week for week in reversed(rows) if week["WORD_COUNT"] > 0), None)
+        self._intervals = _Intervals(
+            rows,
+            [_as_date(week["START_DATE"]) for week in rows],
+            [week["TEST_START_DATETIME"] for week in rows],
+            current,
+        )
+
+    def is_fresh(self) -> bool:
+        return self._expires_at > time.monotonic()
+
+    def expires_in(self) -> float:
+        """만료까지 남은 시간(초)"""
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def refresh(self, db) -> "WeekIndex":
+        """DB에서 주차 전체를 다시 읽습니다. (동시에 만료된 호출은 한 번만 읽음)"""
+        with self._lock:
+            if not self.is_fresh():
+                with db.get_connection() as conn:
+                    self.load(crud_test_weeks.get_all_weeks(conn))
+                self._expires_at = time.monotonic() + self.ttl
+                WEEK_INDEX_REFRESHES.inc()
+        return self
+
+    def get(self, db) -> "WeekIndex":
+        """만료되었으면 다시 읽은 뒤 인덱스를 반환합니다."""
+        return self if self.is_fresh() else self.refresh(db)
+
+    def invalidate(self) -> None:
+        """주차가 생성/변경되었음을 알립니다. 다음 조회 때 DB에서 다시 읽습니다."""
+        self._expires_at = 0.0
+
+    # --- 조회 (O(log n)) ---
+
+    def containing(self, day: Any) -> Optional[Week]:
+        """날짜 day(date / datetime / 'YYYY-MM-DD')가 START_DATE~END_DATE에 포함되는 주차"""
+        intervals = self._intervals
+        day = _as_date(day)
+        i = bisect_right(intervals.starts, day) - 1
+        if i >= 0 and _as_date(intervals.weeks[i]["END_DATE"]) >= day:
+            return intervals.weeks[i]
+        return None
+
+    def current(self) -> Optional[Week]:
+        """현재 주차: 단어가 있는 가장 최근 주차 (get_all_test_weeks(limit=1)과 같은 행)"""
+        return self._intervals.current
+
+    def next_test(self, now: datetime) -> Optional[Week]:
+        """시험 시작 시각이 now 이후인 첫 주차 (단어가 있는 주차만)"""
+        intervals = self._intervals
+        for week in intervals.weeks[bisect_right(intervals.test_starts, now):]:
+            if week["WORD_COUNT"] > 0:
+                return week
+        return None
+
+    def __len__(self) -> int:
+        return len(self._intervals.weeks)
+
+
+_week_index: Optional[WeekIndex] = None
+
+
+def get_week_index() -> WeekIndex:
+    """프로세스 전역 WeekIndex를 반환합니다."""
+    global _week_index
+    if _week_index is None:
+        _week_index = WeekIndex()
+    return _week_index
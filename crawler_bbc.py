@@ -195,39 +195,45 @@ class BBCLearningEnglishCrawler:
     def _save_via_api(self, date, words, source_url):
         """API를 통해 저장"""
 
-        success_count = 0
-        fail_count = 0
-
-        logger.info(f"API를 통해 저장 중...")
-
-        for word in words:
-            try:
-                data = {
-                    "date": date,
-                    "english_word": word["english_word"],
-                    "korean_meaning": word["korean_meaning"],
-                    "source_url": source_url,
-                }
+        if not words:
+            logger.info("저장할 단어가 없습니다.")
+            return
+
+        logger.info(f"API를 통해 저장 중... ({len(words)}개, 일괄 요청)")
+
+        # 단어마다 POST하지 않고 /bulk 한 번으로 다건 UPSERT
+        data = [
+            {
+                "date": date,
+                "english_word": word["english_word"],
+                "korean_meaning": word["korean_meaning"],
+                "source_url": source_url,
+            }
+            for word in words
+        ]
 
-                response = requests.post(
-                    config.API_ENDPOINT, json=data, timeout=config.HTTP_TIMEOUT
-                )
-
-                if response.status_code in [200, 201]:
-                    success_count += 1
-                else:
-                    fail_count += 1
-                    logger.warning(f"  ✗ 저장 실패: {word['english_word']}")
+        try:
+            response = requests.post(
+                config.API_BULK_ENDPOINT, json=data, timeout=config.HTTP_TIMEOUT
+            )
+        except Exception as e:
+            logger.error(f"  ✗ 저장 중 에러: {e}")
+            return
 
-            except Exception as e:
-                fail_count += 1
-                logger.error(f"  ✗ 저장 중 에러: {word['english_word']} - {e}")
+        if response.status_code not in [200, 201]:
+            logger.warning(f"  ✗ 저장 실패: HTTP {response.status_code} - {response.text[:200]}")
+            return
 
-        logger.info(f"저장 완료: 성공 {success_count}개, 실패 {fail_count}개")
+        result = response.json()
+        logger.info(
+            f"저장 완료: 신규 {result['inserted_count']}개, "
+            f"업데이트 {result['updated_count']}개 (총 {result['total']}개)"
+        )
 
     def _save_to_db_directly(self, date, words, source_url):
         """DB에 직접 저장"""
         from core.database import DatabaseManager
+        from crud import word_book_daily
 
         logger.info(f"DB에 직접 저장 중...")
 
@@ -259,6 +265,8 @@ class BBCLearningEnglishCrawler:
                             fail_count += 1
                             logger.error(f"  ✗ 저장 실패: {word['english_word']} - {e}")
 
+                    # 날짜별 digest(word_book_daily)도 같은 트랜잭션에서 갱신
+                    word_book_daily.refresh_dates(conn, [date])
                     conn.commit()
 
             logger.info(f"저장 완료: 성공 {success_count}개, 실패 {fail_count}개")
@@ -1,35 +1,36 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from pymysql.connections import Connection
 
 TABLE_NAME = "test_week_info"
 TEST_WORDS_TABLE = "test_words"
 WORD_BOOK_TABLE = "word_book"
+WORD_BOOK_DAILY_TABLE = "word_book_daily"
+SNAPSHOT_TABLE = "test_words_snapshot"
 
 
 def get_all_test_weeks(
     conn: Connection, limit: int = 10, order: str = "desc"
 ) -> List[Dict[str, Any]]:
-    """시험 주차 목록을 조회합니다."""
+    """
+    시험 주차 목록을 조회합니다. (단어가 있는 주차만)
+    단어 수는 저장된 WORD_COUNT를 읽으므로 uk_test_week_info_start_date 순서 스캔 한 번으로 끝납니다.
+    """
     order_clause = "DESC" if order.lower() == "desc" else "ASC"
 
     sql = f"""
     SELECT
-        twi.TWI_ID,
-        twi.NAME,
-        twi.START_DATE,
-        twi.END_DATE,
-        twi.TEST_START_DATETIME,
-        twi.TEST_END_DATETIME,
-        (
-            SELECT COUNT(*)
-            FROM {WORD_BOOK_TABLE} wb
-            WHERE wb.DATE BETWEEN twi.START_DATE AND twi.END_DATE
-        ) as word_count,
-        twi.CREATED_AT,
-        twi.UPDATED_AT
-    FROM {TABLE_NAME} twi
-    HAVING word_count > 0
-    ORDER BY twi.START_DATE {order_clause}
+        TWI_ID,
+        NAME,
+        START_DATE,
+        END_DATE,
+        TEST_START_DATETIME,
+        TEST_END_DATETIME,
+        WORD_COUNT AS word_count,
+        CREATED_AT,
+        UPDATED_AT
+    FROM {TABLE_NAME}
+    WHERE WORD_COUNT > 0
+    ORDER BY START_DATE {order_clause}
     LIMIT %s;
     """
     with conn.cursor() as cursor:
@@ -37,6 +38,56 @@ def get_all_test_weeks(
         return cursor.fetchall()
 
 
+def get_all_weeks(conn: Connection) -> List[Dict[str, Any]]:
+    """주차 전체를 START_DATE 순으로 조회합니다. (core.week_index 적재용)"""
+    sql = f"""
+    SELECT TWI_ID, NAME, START_DATE, END_DATE, TEST_START_DATETIME, TEST_END_DATETIME,
+           WORD_COUNT, CREATED_AT, UPDATED_AT
+    FROM {TABLE_NAME}
+    ORDER BY START_DATE;
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql)
+        return cursor.fetchall()
+
+
+def refresh_word_counts(
+    conn: Connection, start_date: Optional[Any] = None, end_date: Optional[Any] = None
+) -> int:
+    """
+    주차별 단어 수(WORD_COUNT)를 word_book_daily digest에서 다시 계산합니다.
+    - start_date~end_date와 겹치는 주차만 갱신하며, 둘 다 없으면 전체 주차를 갱신합니다.
+    - digest 갱신 이후 같은 트랜잭션 안에서 호출해야 합니다. (commit은 호출자 책임)
+    - UPDATED_AT은 주차 정의의 수정 일시이므로 바꾸지 않습니다.
+
+    Returns:
+        WORD_COUNT가 바뀐 주차 수
+    """
+    where_clause = []
+    params: List[Any] = []
+    if end_date:
+        where_clause.append("twi.START_DATE <= %s")
+        params.append(str(end_date))
+    if start_date:
+        where_clause.append("twi.END_DATE >= %s")
+        params.append(str(start_date))
+    where = f" WHERE {' AND '.join(where_clause)}" if where_clause else ""
+
+    sql = f"""
+    UPDATE {TABLE_NAME} twi
+    SET
+        twi.WORD_COUNT = (
+            SELECT COALESCE(SUM(d.WORD_COUNT), 0)
+            FROM {WORD_BOOK_DAILY_TABLE} d
+            WHERE d.DATE BETWEEN twi.START_DATE AND twi.END_DATE
+        ),
+        twi.UPDATED_AT = twi.UPDATED_AT{where};
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, tuple(params))
+        return cursor.rowcount
+
+
 def get_test_week_by_id(conn: Connection, twi_id: int) -> Optional[Dict[str, Any]]:
     """특정 시험 주차 정보를 조회합니다."""
     sql = f"""
@@ -66,3 +117,148 @@ def get_test_week_words(conn: Connection, twi_id: int) -> List[Dict[str, Any]]:
     with conn.cursor() as cursor:
         cursor.execute(sql, (twi_id,))
         return cursor.fetchall()
+
+
+def get_test_weeks_validator(conn: Connection) -> Dict[str, Any]:
+    """
+    주차 목록의 조건부 GET용 검증자를 조회합니다.
+    주차 정보와 주차별 단어 수(digest)가 바뀌면 값이 달라집니다.
+    digest의 VERSION 합은 단어가 추가·수정·삭제될 때마다 커지므로 같은 초 안의 변경도 구분합니다.
+    """
+    sql = f"""
+    SELECT
+        (SELECT COUNT(*) FROM {TABLE_NAME}) AS WEEK_COUNT,
+        (SELECT MAX(UPDATED_AT) FROM {TABLE_NAME}) AS WEEK_UPDATED_AT,
+        (SELECT COALESCE(SUM(WORD_COUNT), 0) FROM {WORD_BOOK_DAILY_TABLE}) AS WORD_COUNT,
+        (SELECT MAX(LAST_UPDATED_AT) FROM {WORD_BOOK_DAILY_TABLE}) AS WORDS_UPDATED_AT,
+        (SELECT COALESCE(SUM(VERSION), 0) FROM {WORD_BOOK_DAILY_TABLE}) AS WORDS_VERSION;
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql)
+        return cursor.fetchone()
+
+
+def get_test_week_words_validator(conn: Connection, twi_id: int) -> Optional[Dict[str, Any]]:
+    """
+    특정 주차 단어 목록의 조건부 GET용 검증자를 조회합니다.
+    word_book 삭제로 시험 단어가 함께 지워지면 MAX(UPDATED_AT)는 줄 수 있으므로,
+    주차 기간 digest의 마지막 수정 일시와 VERSION 합(삭제에도 커짐)을 함께 읽습니다.
+    주차가 없으면 None을 반환합니다.
+    """
+    sql = f"""
+    SELECT
+        twi.UPDATED_AT AS WEEK_UPDATED_AT,
+        COUNT(tw.TW_ID) AS WORD_COUNT,
+        MAX(tw.TW_ID) AS MAX_TW_ID,
+        MAX(tw.UPDATED_AT) AS WORDS_UPDATED_AT,
+        MAX(wb.UPDATED_AT) AS WORD_BOOK_UPDATED_AT,
+        (
+            SELECT MAX(d.LAST_UPDATED_AT)
+            FROM {WORD_BOOK_DAILY_TABLE} d
+            WHERE d.DATE BETWEEN twi.START_DATE AND twi.END_DATE
+        ) AS DAILY_UPDATED_AT,
+        (
+            SELECT COALESCE(SUM(d.VERSION), 0)
+            FROM {WORD_BOOK_DAILY_TABLE} d
+            WHERE d.DATE BETWEEN twi.START_DATE AND twi.END_DATE
+        ) AS DAILY_VERSION
+    FROM {TABLE_NAME} twi
+    LEFT JOIN {TEST_WORDS_TABLE} tw ON tw.TWI_ID = twi.TWI_ID
+    LEFT JOIN {WORD_BOOK_TABLE} wb ON wb.WB_ID = tw.WB_ID
+    WHERE twi.TWI_ID = %s
+    GROUP BY twi.TWI_ID, twi.UPDATED_AT, twi.START_DATE, twi.END_DATE;
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, (twi_id,))
+        return cursor.fetchone()
+
+
+def get_words_snapshot(conn: Connection, twi_id: int) -> Optional[Dict[str, Any]]:
+    """주차 단어 목록 응답 스냅샷을 PK로 조회합니다."""
+    sql = f"""
+    SELECT TWI_ID, ETAG, BODY, BODY_GZIP
+    FROM {SNAPSHOT_TABLE}
+    WHERE TWI_ID = %s;
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, (twi_id,))
+        return cursor.fetchone()
+
+
+def save_words_snapshot(conn: Connection, twi_id: int, etag: str, body: bytes, body_gzip: bytes) -> None:
+    """주차 단어 목록 응답 스냅샷을 저장(교체)합니다. (commit은 호출자 책임)"""
+    sql = f"""
+    INSERT INTO {SNAPSHOT_TABLE} (TWI_ID, ETAG, BODY, BODY_GZIP)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        ETAG = VALUES(ETAG),
+        BODY = VALUES(BODY),
+        BODY_GZIP = VALUES(BODY_GZIP);
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, (twi_id, etag, body, body_gzip))
+
+
+def insert_weeks(conn: Connection, weeks: List[Tuple[str, str, str, str, str]]) -> int:
+    """
+    주차 여러 개를 다건 INSERT 한 문장으로 추가합니다. (commit은 호출자 책임)
+
+    Args:
+        weeks: (NAME, START_DATE, END_DATE, TEST_START_DATETIME, TEST_END_DATETIME) 목록
+    """
+    if not weeks:
+        return 0
+    sql = f"""
+    INSERT INTO {TABLE_NAME} (NAME, START_DATE, END_DATE, TEST_START_DATETIME, TEST_END_DATETIME)
+    VALUES (%s, %s, %s, %s, %s);
+    """
+    with conn.cursor() as cursor:
+        # pymysql이 INSERT ... VALUES를 한 문장의 다건 INSERT로 재작성
+        return cursor.executemany(sql, weeks)
+
+
+def get_week_ids_with_words(conn: Connection, twi_ids: List[int]) -> Set[int]:
+    """주어진 주차 중 시험 단어(test_words)가 이미 있는 주차 ID를 조회합니다."""
+    if not twi_ids:
+        return set()
+    placeholders = ", ".join(["%s"] * len(twi_ids))
+    sql = f"""
+    SELECT DISTINCT TWI_ID
+    FROM {TEST_WORDS_TABLE}
+    WHERE TWI_ID IN ({placeholders});
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, tuple(twi_ids))
+        return {row["TWI_ID"] for row in cursor.fetchall()}
+
+
+def delete_test_words(conn: Connection, twi_ids: List[int]) -> int:
+    """
+    주차들의 시험 단어를 삭제합니다. (commit은 호출자 책임)
+    test_answers가 ON DELETE CASCADE로 함께 삭제되므로 재생성할 때만 호출합니다.
+    """
+    if not twi_ids:
+        return 0
+    placeholders = ", ".join(["%s"] * len(twi_ids))
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {TEST_WORDS_TABLE} WHERE TWI_ID IN ({placeholders});", tuple(twi_ids)
+        )
+        return cursor.rowcount
+
+
+def insert_test_words(conn: Connection, rows: List[Tuple[int, int]]) -> int:
+    """
+    시험 단어 여러 개를 다건 INSERT 한 문장으로 추가합니다. (commit은 호출자 책임)
+
+    Args:
+        rows: (TWI_ID, WB_ID) 목록
+    """
+    if not rows:
+        return 0
+    sql = f"""
+    INSERT INTO {TEST_WORDS_TABLE} (TWI_ID, WB_ID)
+    VALUES (%s, %s);
+    """
+    with conn.cursor() as cursor:
+        return cursor.executemany(sql, rows)
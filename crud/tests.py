@@ -1,5 +1,7 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from pymysql.connections import Connection
+from core.database import commit, rollback
+from core.instrumentation import InstrumentedSSDictCursor
 import re
 
 TEST_RESULT_TABLE = "test_result"
@@ -38,10 +40,10 @@ def create_test_result(conn: Connection, u_id: int, twi_id: int) -> int:
     try:
         with conn.cursor() as cursor:
             cursor.execute(sql, (u_id, twi_id))
-            conn.commit()
+            commit(conn)
             return cursor.lastrowid
     except Exception as e:
-        conn.rollback()
+        rollback(conn)
         raise e
 
 
@@ -56,9 +58,9 @@ def reset_test_result(conn: Connection, tr_id: int) -> None:
                 f"UPDATE {TEST_RESULT_TABLE} SET TEST_SCORE = NULL, UPDATED_AT = CURRENT_TIMESTAMP WHERE TR_ID = %s;",
                 (tr_id,)
             )
-            conn.commit()
+            commit(conn)
     except Exception as e:
-        conn.rollback()
+        rollback(conn)
         raise e
 
 
@@ -100,7 +102,7 @@ def save_answer(
     try:
         with conn.cursor() as cursor:
             cursor.execute(sql, (tr_id, tw_id, user_answer, is_correct))
-            conn.commit()
+            commit(conn)
 
             # 저장된 ta_id 조회
             cursor.execute(
@@ -110,7 +112,52 @@ def save_answer(
             result = cursor.fetchone()
             return result['TA_ID'] if result else cursor.lastrowid
     except Exception as e:
-        conn.rollback()
+        rollback(conn)
+        raise e
+
+
+def save_answers_bulk(
+    conn: Connection, tr_id: int, answers: List[Tuple[int, str, bool]]
+) -> Dict[int, int]:
+    """
+    답안 여러 개를 다건 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 저장(UPSERT)합니다.
+    같은 tw_id가 여러 번 있으면 마지막 답안이 남습니다. (한 건씩 저장할 때와 같음)
+
+    Args:
+        answers: (tw_id, user_answer, is_correct) 목록
+
+    Returns:
+        tw_id → ta_id 딕셔너리 (UPSERT 후 한 번의 SELECT로 조회)
+    """
+    if not answers:
+        return {}
+
+    sql = f"""
+    INSERT INTO {TEST_ANSWERS_TABLE} (TR_ID, TW_ID, USER_ANSWER, IS_CORRECT)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        USER_ANSWER = VALUES(USER_ANSWER),
+        IS_CORRECT = VALUES(IS_CORRECT),
+        UPDATED_AT = CURRENT_TIMESTAMP;
+    """
+    tw_ids = list(dict.fromkeys(tw_id for tw_id, _, _ in answers))
+    placeholders = ", ".join(["%s"] * len(tw_ids))
+    try:
+        with conn.cursor() as cursor:
+            # pymysql이 INSERT ... VALUES를 한 문장의 다건 INSERT로 재작성
+            cursor.executemany(
+                sql, [(tr_id, tw_id, user_answer, is_correct) for tw_id, user_answer, is_correct in answers]
+            )
+            commit(conn)
+
+            # 저장된 ta_id 일괄 조회
+            cursor.execute(
+                f"SELECT TW_ID, TA_ID FROM {TEST_ANSWERS_TABLE} WHERE TR_ID = %s AND TW_ID IN ({placeholders});",
+                (tr_id, *tw_ids)
+            )
+            return {row['TW_ID']: row['TA_ID'] for row in cursor.fetchall()}
+    except Exception as e:
+        rollback(conn)
         raise e
 
 
@@ -124,9 +171,9 @@ def update_test_score(conn: Connection, tr_id: int, score: int) -> None:
     try:
         with conn.cursor() as cursor:
             cursor.execute(sql, (score, tr_id))
-            conn.commit()
+            commit(conn)
     except Exception as e:
-        conn.rollback()
+        rollback(conn)
         raise e
 
 
@@ -237,7 +284,93 @@ def delete_test_result(conn: Connection, tr_id: int) -> None:
     try:
         with conn.cursor() as cursor:
             cursor.execute(sql, (tr_id,))
-            conn.commit()
+            commit(conn)
     except Exception as e:
-        conn.rollback()
+        rollback(conn)
         raise e
+
+
+def _result_filters(twi_id: Optional[int], u_id: Optional[int]) -> Tuple[str, Tuple[Any, ...]]:
+    """내보내기용 test_result(tr) 주차/사용자 조건을 만듭니다."""
+    conditions = []
+    params: List[Any] = []
+    if twi_id is not None:
+        conditions.append("tr.TWI_ID = %s")
+        params.append(twi_id)
+    if u_id is not None:
+        conditions.append("tr.U_ID = %s")
+        params.append(u_id)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, tuple(params)
+
+
+# iter_test_results 결과 컬럼 (SELECT 순서, 내보내기 CSV 헤더)
+RESULT_EXPORT_COLUMNS = ("TR_ID", "U_ID", "USERNAME", "TWI_ID", "WEEK_NAME", "TEST_SCORE", "CREATED_AT", "UPDATED_AT")
+
+
+def iter_test_results(
+    conn: Connection, twi_id: Optional[int] = None, u_id: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    내보내기용으로 시험 결과(주차/사용자 필터)를 TR_ID 순으로 스트리밍(비버퍼 커서)합니다.
+    다 읽을 때까지 같은 커넥션으로 다른 쿼리를 실행할 수 없습니다.
+    """
+    where, params = _result_filters(twi_id, u_id)
+    sql = f"""
+    SELECT
+        tr.TR_ID,
+        tr.U_ID,
+        u.USERNAME,
+        tr.TWI_ID,
+        twi.NAME AS WEEK_NAME,
+        tr.TEST_SCORE,
+        tr.CREATED_AT,
+        tr.UPDATED_AT
+    FROM {TEST_RESULT_TABLE} tr
+    JOIN {USERS_TABLE} u ON tr.U_ID = u.U_ID
+    JOIN {TEST_WEEK_INFO_TABLE} twi ON tr.TWI_ID = twi.TWI_ID
+    {where}
+    ORDER BY tr.TR_ID;
+    """
+    with conn.cursor(InstrumentedSSDictCursor) as cursor:
+        cursor.execute(sql, params)
+        yield from cursor
+
+
+# iter_test_answers 결과 컬럼 (SELECT 순서, 내보내기 CSV 헤더)
+ANSWER_EXPORT_COLUMNS = (
+    "TA_ID", "TR_ID", "U_ID", "TWI_ID", "TW_ID",
+    "WORD_ENGLISH", "WORD_MEANING", "USER_ANSWER", "IS_CORRECT", "CREATED_AT",
+)
+
+
+def iter_test_answers(
+    conn: Connection, twi_id: Optional[int] = None, u_id: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    내보내기용으로 문항별 답안(주차/사용자 필터)을 TR_ID, TA_ID 순으로 스트리밍(비버퍼 커서)합니다.
+    다 읽을 때까지 같은 커넥션으로 다른 쿼리를 실행할 수 없습니다.
+    """
+    where, params = _result_filters(twi_id, u_id)
+    sql = f"""
+    SELECT
+        ta.TA_ID,
+        ta.TR_ID,
+        tr.U_ID,
+        tr.TWI_ID,
+        ta.TW_ID,
+        wb.WORD_ENGLISH,
+        wb.WORD_MEANING,
+        ta.USER_ANSWER,
+        ta.IS_CORRECT,
+        ta.CREATED_AT
+    FROM {TEST_RESULT_TABLE} tr
+    JOIN {TEST_ANSWERS_TABLE} ta ON ta.TR_ID = tr.TR_ID
+    JOIN {TEST_WORDS_TABLE} tw ON ta.TW_ID = tw.TW_ID
+    JOIN {WORD_BOOK_TABLE} wb ON tw.WB_ID = wb.WB_ID
+    {where}
+    ORDER BY ta.TR_ID, ta.TA_ID;
+    """
+    with conn.cursor(InstrumentedSSDictCursor) as cursor:
+        cursor.execute(sql, params)
+        yield from cursor
@@ -1,10 +1,45 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Set, Tuple
 from pymysql.connections import Connection
+from core.database import commit, rollback
+from core.instrumentation import InstrumentedSSDictCursor
+from crud import word_book_daily
 from schemas.vocabulary import VocabularyCreate, VocabularyUpdate
 from datetime import date
 
 TABLE_NAME = "word_book"
 
+UPSERT_SQL = f"""
+INSERT INTO {TABLE_NAME} (DATE, WORD_ENGLISH, WORD_MEANING, SOURCE_URL)
+VALUES (%s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    WORD_MEANING = VALUES(WORD_MEANING),
+    SOURCE_URL = VALUES(SOURCE_URL),
+    UPDATED_AT = CURRENT_TIMESTAMP;
+"""
+
+
+def word_key(word_date: Any, english_word: str) -> Tuple[str, str]:
+    """
+    (date, english_word) 고유 키를 비교 가능한 형태로 변환합니다.
+    WORD_ENGLISH는 utf8mb4_unicode_ci(대소문자 무시, 끝 공백 무시) 콜레이션이므로 최대한 맞추지만,
+    악센트/전각 무시("café" = "cafe")까지 같지는 않으므로 빠른 경로로만 쓰고
+    어긋나면 DB에서 다시 찾습니다. (bulk_upsert_words)
+    """
+    return str(word_date), english_word.rstrip().casefold()
+
+
+def _key_in_clause(count: int) -> str:
+    """(DATE, WORD_ENGLISH) IN (...) 조건을 만듭니다. uk_date_word 인덱스로 조회됩니다."""
+    return "(DATE, WORD_ENGLISH) IN (" + ", ".join(["(%s, %s)"] * count) + ")"
+
+
+def _key_params(words: List[VocabularyCreate]) -> List[Any]:
+    """_key_in_clause 파라미터 (요청 내 중복 키는 한 번만)"""
+    keys: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for word in words:
+        keys.setdefault(word_key(word.date, word.english_word), (word.date, word.english_word))
+    return [value for pair in keys.values() for value in pair]
+
 
 def create_or_update_word(
     conn: Connection, word: VocabularyCreate
@@ -13,22 +48,14 @@ def create_or_update_word(
     단어를 UPSERT(Insert or Update)합니다.
     - (date, english_word)가 고유 키로 중복되면 korean_meaning, source_url 및 updated_at을 업데이트합니다.
     """
-    sql = f"""
-    INSERT INTO {TABLE_NAME} (DATE, WORD_ENGLISH, WORD_MEANING, SOURCE_URL)
-    VALUES (%s, %s, %s, %s)
-    ON DUPLICATE KEY UPDATE
-        WORD_MEANING = VALUES(WORD_MEANING),
-        SOURCE_URL = VALUES(SOURCE_URL),
-        UPDATED_AT = CURRENT_TIMESTAMP;
-    """
-
     try:
         with conn.cursor() as cursor:
             cursor.execute(
-                sql,
+                UPSERT_SQL,
                 (word.date, word.english_word, word.korean_meaning, word.source_url),
             )
-            conn.commit()
+            word_book_daily.refresh_dates(conn, [word.date])
+            commit(conn)
 
             # 마지막으로 삽입/업데이트된 행의 ID를 가져옵니다.
             # MySQL의 LAST_INSERT_ID()는 INSERT 시에만 유효하므로,
@@ -43,10 +70,96 @@ def create_or_update_word(
             return cursor.fetchone()
 
     except Exception as e:
-        conn.rollback()
+        rollback(conn)
         raise e
 
 
+def bulk_upsert_words(
+    conn: Connection, words: List[VocabularyCreate], return_rows: bool = True
+) -> Tuple[List[Dict[str, Any]], Set[int]]:
+    """
+    여러 단어를 다건 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 UPSERT합니다.
+
+    Args:
+        return_rows: False면 결과 행을 다시 조회하지 않습니다. (대량 가져오기처럼 저장만 하는 경우)
+
+    Returns:
+        (입력 순서대로의 결과 행 목록, UPSERT 전에 이미 존재하던 WB_ID 집합)
+        결과 행은 UPSERT 후 한 번의 SELECT로 조회합니다. (return_rows=False면 빈 목록)
+        같은 행으로 저장된 입력(요청 내 중복 키)은 같은 행을 가리킵니다.
+    """
+    if not words:
+        return [], set()
+
+    key_params = _key_params(words)
+    key_count = len(key_params) // 2
+
+    select_sql = f"""
+    SELECT WB_ID, DATE, WORD_ENGLISH, WORD_MEANING, SOURCE_URL, CREATED_AT, UPDATED_AT
+    FROM {TABLE_NAME}
+    WHERE {_key_in_clause(key_count)};
+    """
+
+    try:
+        with conn.cursor() as cursor:
+            # 1. 기존에 있던 행 조회 (항목별 inserted/updated 판정용, DB 콜레이션으로 비교)
+            cursor.execute(
+                f"SELECT WB_ID FROM {TABLE_NAME} WHERE {_key_in_clause(key_count)};",
+                key_params,
+            )
+            existing = {row["WB_ID"] for row in cursor.fetchall()}
+
+            # 2. 다건 UPSERT (pymysql이 INSERT ... VALUES를 한 문장의 다건 INSERT로 재작성)
+            cursor.executemany(
+                UPSERT_SQL,
+                [(w.date, w.english_word, w.korean_meaning, w.source_url) for w in words],
+            )
+            word_book_daily.refresh_dates(conn, (w.date for w in words))
+            commit(conn)
+            if not return_rows:
+                return [], existing
+
+            # 3. 결과 행 일괄 조회 후 입력에 맞춤
+            cursor.execute(select_sql, key_params)
+            rows_by_key = {word_key(row["DATE"], row["WORD_ENGLISH"]): row for row in cursor.fetchall()}
+            rows = []
+            for word in words:
+                key = word_key(word.date, word.english_word)
+                row = rows_by_key.get(key)
+                if row is None:
+                    # 파이썬 키와 DB 콜레이션이 다른 경우(악센트/전각 무시 등): UPSERT와 같은 조건으로 DB에서 조회
+                    row = rows_by_key[key] = _get_word_by_key(conn, word.date, word.english_word)
+                rows.append(row)
+            return rows, existing
+
+    except Exception as e:
+        rollback(conn)
+        raise e
+
+
+def count_words_by_keys(conn: Connection, words: List[VocabularyCreate]) -> int:
+    """입력의 (date, english_word) 키에 해당하는 행 수를 셉니다. (DB 콜레이션 기준, uk_date_word 인덱스만 읽음)"""
+    if not words:
+        return 0
+    key_params = _key_params(words)
+    sql = f"SELECT COUNT(*) AS WORD_COUNT FROM {TABLE_NAME} WHERE {_key_in_clause(len(key_params) // 2)};"
+    with conn.cursor() as cursor:
+        cursor.execute(sql, key_params)
+        return cursor.fetchone()["WORD_COUNT"]
+
+
+def _get_word_by_key(conn: Connection, word_date: Any, english_word: str) -> Optional[Dict[str, Any]]:
+    """(date, english_word) 고유 키로 단어를 조회합니다."""
+    sql = f"""
+    SELECT WB_ID, DATE, WORD_ENGLISH, WORD_MEANING, SOURCE_URL, CREATED_AT, UPDATED_AT
+    FROM {TABLE_NAME}
+    WHERE DATE = %s AND WORD_ENGLISH = %s;
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, (word_date, english_word))
+        return cursor.fetchone()
+
+
 def get_word_by_id(conn: Connection, word_id: int) -> Optional[Dict[str, Any]]:
     """ID를 사용하여 단어 정보를 조회합니다."""
     sql = f"""
@@ -59,14 +172,69 @@ def get_word_by_id(conn: Connection, word_id: int) -> Optional[Dict[str, Any]]:
         return cursor.fetchone()
 
 
+def get_words_by_ids(conn: Connection, word_ids: List[int]) -> List[Dict[str, Any]]:
+    """여러 ID의 단어를 PK IN 조회 한 번으로 가져옵니다. (순서는 보장하지 않음)"""
+    if not word_ids:
+        return []
+    placeholders = ", ".join(["%s"] * len(word_ids))
+    sql = f"""
+    SELECT WB_ID, DATE, WORD_ENGLISH, WORD_MEANING, SOURCE_URL, CREATED_AT, UPDATED_AT
+    FROM {TABLE_NAME}
+    WHERE WB_ID IN ({placeholders});
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, tuple(word_ids))
+        return cursor.fetchall()
+
+
+def get_words_for_dates(
+    conn: Connection,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    dates: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    기간(start_date~end_date) 또는 날짜 목록(dates)의 단어 전체를 DATE, WB_ID 순으로 조회합니다.
+    idx_word_book_date 범위 스캔(IN 목록은 날짜별 범위 여러 개) 한 번으로 읽습니다.
+    """
+    params: List[Any] = []
+    where_clause = []
+    if dates:
+        where_clause.append(f"DATE IN ({', '.join(['%s'] * len(dates))})")
+        params.extend(dates)
+    if start_date:
+        where_clause.append("DATE >= %s")
+        params.append(start_date)
+    if end_date:
+        where_clause.append("DATE <= %s")
+        params.append(end_date)
+
+    sql = f"""
+    SELECT WB_ID, DATE, WORD_ENGLISH, WORD_MEANING, SOURCE_URL, CREATED_AT, UPDATED_AT
+    FROM {TABLE_NAME}
+    WHERE {' AND '.join(where_clause)}
+    ORDER BY DATE, WB_ID;
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, tuple(params))
+        return cursor.fetchall()
+
+
 def get_words(
     conn: Connection,
     limit: int = 100,
     offset: int = 0,
     target_date: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    after: Optional[Tuple[str, int]] = None,
 ) -> List[Dict[str, Any]]:
     """
-    단어 목록을 조회합니다. 날짜 필터링 및 페이징을 지원합니다.
+    단어 목록을 조회합니다. 날짜/기간 필터링 및 페이징을 지원합니다.
+
+    정렬은 DATE DESC, WB_ID ASC이며 idx_word_book_date(DATE DESC, 암묵적 PK WB_ID ASC) 순서와 같습니다.
+    after=(DATE, WB_ID)가 주어지면 그 행 다음부터 읽는 키셋 페이지네이션으로 동작하여
+    OFFSET 없이 인덱스 범위 스캔만으로 페이지를 가져옵니다. (offset은 호환용)
     """
     sql = f"""
     SELECT WB_ID, DATE, WORD_ENGLISH, WORD_MEANING, SOURCE_URL, CREATED_AT, UPDATED_AT
@@ -79,18 +247,75 @@ def get_words(
         # 날짜 포맷 검증은 Service/Router에서 수행되었다고 가정
         where_clause.append("DATE = %s")
         params.append(target_date)
+    if start_date:
+        where_clause.append("DATE >= %s")
+        params.append(start_date)
+    if end_date:
+        where_clause.append("DATE <= %s")
+        params.append(end_date)
+
+    if after:
+        # 마지막으로 읽은 (DATE, WB_ID) 다음 행부터
+        where_clause.append("(DATE < %s OR (DATE = %s AND WB_ID > %s))")
+        params.extend([after[0], after[0], after[1]])
 
     if where_clause:
         sql += " WHERE " + " AND ".join(where_clause)
 
-    sql += " ORDER BY DATE DESC, WB_ID ASC LIMIT %s OFFSET %s;"
-    params.extend([limit, offset])
+    sql += " ORDER BY DATE DESC, WB_ID ASC LIMIT %s"
+    params.append(limit)
+    if offset:
+        sql += " OFFSET %s"
+        params.append(offset)
 
     with conn.cursor() as cursor:
-        cursor.execute(sql, tuple(params))
+        cursor.execute(sql + ";", tuple(params))
         return cursor.fetchall()
 
 
+def iter_all_words(conn: Connection) -> Iterator[Dict[str, Any]]:
+    """
+    검색 인덱스 빌드용으로 word_book 전체를 스트리밍(비버퍼 커서)으로 읽습니다.
+    결과 전체를 메모리에 올리지 않으며, 다 읽을 때까지 같은 커넥션으로 다른 쿼리를 실행할 수 없습니다.
+    """
+    sql = f"SELECT WB_ID, DATE, WORD_ENGLISH, WORD_MEANING FROM {TABLE_NAME};"
+    with conn.cursor(InstrumentedSSDictCursor) as cursor:
+        cursor.execute(sql)
+        yield from cursor
+
+
+# iter_words 결과 컬럼 (SELECT 순서, 내보내기 CSV 헤더)
+EXPORT_COLUMNS = ("WB_ID", "DATE", "WORD_ENGLISH", "WORD_MEANING", "SOURCE_URL", "CREATED_AT", "UPDATED_AT")
+
+
+def iter_words(
+    conn: Connection, start_date: Optional[date] = None, end_date: Optional[date] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    내보내기용으로 word_book을 (날짜 범위) DATE, WB_ID 순으로 스트리밍(비버퍼 커서)합니다.
+    idx_word_book_date 인덱스 범위 스캔이며, 다 읽을 때까지 같은 커넥션으로 다른 쿼리를 실행할 수 없습니다.
+    """
+    conditions = []
+    params: List[Any] = []
+    if start_date is not None:
+        conditions.append("DATE >= %s")
+        params.append(start_date)
+    if end_date is not None:
+        conditions.append("DATE <= %s")
+        params.append(end_date)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    sql = f"""
+    SELECT WB_ID, DATE, WORD_ENGLISH, WORD_MEANING, SOURCE_URL, CREATED_AT, UPDATED_AT
+    FROM {TABLE_NAME}
+    {where}
+    ORDER BY DATE, WB_ID;
+    """
+    with conn.cursor(InstrumentedSSDictCursor) as cursor:
+        cursor.execute(sql, tuple(params))
+        yield from cursor
+
+
 def get_representative_source_url(conn: Connection, target_date: str) -> Optional[str]:
     """
     특정 날짜의 단어들 중 source_url이 null이 아닌 값 하나를 반환합니다.
@@ -129,15 +354,19 @@ def update_word(
             cursor.execute(
                 sql, (word_data.english_word, word_data.korean_meaning, word_id)
             )
-            conn.commit()
             if cursor.rowcount == 0:
+                commit(conn)
                 return None
 
             # 업데이트된 데이터 조회 (DictCursor 덕분에 딕셔너리로 반환됨)
-            return get_word_by_id(conn, word_id)
+            db_word = get_word_by_id(conn, word_id)
+            if db_word:
+                word_book_daily.refresh_dates(conn, [db_word["DATE"]])
+            commit(conn)
+            return db_word
 
     except Exception as e:
-        conn.rollback()
+        rollback(conn)
         raise e
 
 
@@ -146,11 +375,20 @@ def delete_word(conn: Connection, word_id: int) -> bool:
     sql = f"DELETE FROM {TABLE_NAME} WHERE WB_ID = %s;"
     try:
         with conn.cursor() as cursor:
+            # digest 갱신을 위해 삭제 전에 날짜 확인
+            cursor.execute(f"SELECT DATE FROM {TABLE_NAME} WHERE WB_ID = %s FOR UPDATE;", (word_id,))
+            row = cursor.fetchone()
+            if not row:
+                commit(conn)
+                return False
+
             cursor.execute(sql, (word_id,))
-            conn.commit()
-            return cursor.rowcount > 0  # 삭제 성공 여부 반환
+            deleted = cursor.rowcount > 0  # 삭제 성공 여부 반환
+            word_book_daily.refresh_dates(conn, [row["DATE"]])
+            commit(conn)
+            return deleted
     except Exception as e:
-        conn.rollback()
+        rollback(conn)
         raise e
 
 
@@ -160,10 +398,12 @@ def get_distinct_dates(conn, limit: int = 5):
     """
     cursor = conn.cursor()
 
+    # word_book 전체를 DISTINCT 스캔하지 않고 날짜별 digest의 PK를 역순으로 읽음
     query = f"""
-        SELECT DISTINCT DATE 
-        FROM {TABLE_NAME}
-        ORDER BY DATE DESC 
+        SELECT DATE
+        FROM {word_book_daily.TABLE_NAME}
+        WHERE WORD_COUNT > 0
+        ORDER BY DATE DESC
         LIMIT %s
     """
 
@@ -0,0 +1,205 @@
+from typing import List, Optional, Dict, Any, Iterable, Tuple
+from pymysql.connections import Connection
+from crud import test_weeks
+
+TABLE_NAME = "word_book_daily"
+SOURCE_TABLE_NAME = "word_book"
+
+# 날짜별 집계: 단어 수, 대표 source_url(null이 아닌 값 중 하나), 출처, 마지막 수정 일시
+# 출처는 대표 source_url의 도메인으로 판단합니다.
+# 마지막 수정 일시는 집계 시점 이상으로 기록합니다. (단어 삭제는 MAX(UPDATED_AT)를 앞으로 보내지 않음)
+AGGREGATE_SELECT = f"""
+SELECT
+    DATE,
+    COUNT(*) AS WORD_COUNT,
+    MIN(SOURCE_URL) AS SOURCE_URL,
+    CASE
+        WHEN MIN(SOURCE_URL) LIKE '%%ebs.co.kr%%' THEN 'EBS'
+        WHEN MIN(SOURCE_URL) LIKE '%%bbc.co%%' THEN 'BBC'
+        ELSE NULL
+    END AS SOURCE,
+    GREATEST(MAX(UPDATED_AT), NOW()) AS LAST_UPDATED_AT
+FROM {SOURCE_TABLE_NAME}
+"""
+
+
+def _reaggregate(conn: Connection, where: str, params: List[Any]) -> None:
+    """
+    where에 해당하는 날짜의 digest 행을 word_book에서 다시 집계합니다.
+    행을 지우지 않고 먼저 WORD_COUNT = 0, VERSION + 1로 표시한 뒤 단어가 남은 날짜만 다시 채우므로,
+    단어가 모두 삭제된 날짜도 WORD_COUNT = 0인 행으로 남아 검증자(VERSION 합, 마지막 수정 일시)가 줄지 않습니다.
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {TABLE_NAME} SET WORD_COUNT = 0, LAST_UPDATED_AT = NOW(), VERSION = VERSION + 1{where};",
+            params,
+        )
+        cursor.execute(
+            f"""
+            INSERT INTO {TABLE_NAME} (DATE, WORD_COUNT, SOURCE_URL, SOURCE, LAST_UPDATED_AT)
+            {AGGREGATE_SELECT}{where}
+            GROUP BY DATE
+            ON DUPLICATE KEY UPDATE
+                WORD_COUNT = VALUES(WORD_COUNT),
+                SOURCE_URL = VALUES(SOURCE_URL),
+                SOURCE = VALUES(SOURCE),
+                LAST_UPDATED_AT = VALUES(LAST_UPDATED_AT);
+            """,
+            params,
+        )
+
+
+def refresh_dates(conn: Connection, dates: Iterable[Any]) -> int:
+    """
+    주어진 날짜들의 digest 행을 word_book에서 다시 집계합니다.
+    - word_book 쓰기와 같은 트랜잭션 안에서 commit 전에 호출해야 합니다. (commit은 호출자 책임)
+    - 단어가 모두 삭제된 날짜는 WORD_COUNT = 0인 행으로 남습니다. (조회에서는 제외)
+    - 해당 날짜를 포함하는 주차의 단어 수(test_week_info.WORD_COUNT)도 함께 갱신합니다.
+
+    Returns:
+        다시 집계한 날짜 수
+    """
+    date_list = sorted({str(d) for d in dates})
+    if not date_list:
+        return 0
+
+    placeholders = ", ".join(["%s"] * len(date_list))
+    _reaggregate(conn, f" WHERE DATE IN ({placeholders})", date_list)
+
+    test_weeks.refresh_word_counts(conn, date_list[0], date_list[-1])
+    return len(date_list)
+
+
+def rebuild_all(conn: Connection) -> int:
+    """
+    digest 테이블 전체를 word_book에서 다시 만들고 주차별 단어 수도 다시 계산합니다. (commit은 호출자 책임)
+
+    Returns:
+        단어가 있는 날짜 수
+    """
+    # 파라미터가 없어도 %% 이스케이프가 풀리도록 빈 목록 전달
+    _reaggregate(conn, "", [])
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) AS DATE_COUNT FROM {TABLE_NAME} WHERE WORD_COUNT > 0;")
+        rebuilt = cursor.fetchone()["DATE_COUNT"]
+
+    test_weeks.refresh_word_counts(conn)
+    return rebuilt
+
+
+def get_digest(conn: Connection, target_date: str) -> Optional[Dict[str, Any]]:
+    """특정 날짜의 digest 행을 PK로 조회합니다. (단어가 없는 날짜는 None)"""
+    sql = f"""
+    SELECT DATE, WORD_COUNT, SOURCE_URL, SOURCE, LAST_UPDATED_AT
+    FROM {TABLE_NAME}
+    WHERE DATE = %s AND WORD_COUNT > 0;
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, (target_date,))
+        return cursor.fetchone()
+
+
+def _date_filters(
+    target_date: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    source: Optional[str] = None,
+    dates: Optional[List[str]] = None,
+    live_only: bool = True,
+) -> Tuple[str, List[Any]]:
+    """digest 조회용 WHERE 절과 파라미터를 만듭니다. (live_only면 단어가 모두 삭제된 날짜 제외)"""
+    params: List[Any] = []
+    where_clause = ["WORD_COUNT > 0"] if live_only else []
+
+    if target_date:
+        where_clause.append("DATE = %s")
+        params.append(target_date)
+    if dates:
+        where_clause.append(f"DATE IN ({', '.join(['%s'] * len(dates))})")
+        params.extend(dates)
+    if start_date:
+        where_clause.append("DATE >= %s")
+        params.append(start_date)
+    if end_date:
+        where_clause.append("DATE <= %s")
+        params.append(end_date)
+    if source:
+        where_clause.append("SOURCE = %s")
+        params.append(source)
+
+    return (" WHERE " + " AND ".join(where_clause)) if where_clause else "", params
+
+
+def get_digests(
+    conn: Connection,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    dates: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """기간 또는 날짜 목록의 digest 행(단어 수, 대표 source_url)을 날짜순으로 PK 범위 조회합니다."""
+    where, params = _date_filters(start_date=start_date, end_date=end_date, dates=dates)
+    sql = f"""
+    SELECT DATE, WORD_COUNT, SOURCE_URL, SOURCE, LAST_UPDATED_AT
+    FROM {TABLE_NAME}{where}
+    ORDER BY DATE;
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, tuple(params))
+        return cursor.fetchall()
+
+
+def get_dates(
+    conn: Connection,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    source: Optional[str] = None,
+    before: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[str]:
+    """
+    단어가 있는 날짜 목록을 최신순으로 반환합니다.
+    PK(DATE) 또는 idx_word_book_daily_source_date(SOURCE, DATE)만 읽는 인덱스 전용 역순 스캔입니다.
+    before가 주어지면 그 날짜보다 이전 날짜부터 반환합니다. (키셋 페이지네이션)
+    """
+    where, params = _date_filters(start_date=start_date, end_date=end_date, source=source)
+    if before:
+        where += (" AND " if where else " WHERE ") + "DATE < %s"
+        params.append(before)
+
+    sql = f"SELECT DATE FROM {TABLE_NAME}{where} ORDER BY DATE DESC"
+    if limit is not None:
+        sql += " LIMIT %s"
+        params.append(limit)
+
+    with conn.cursor() as cursor:
+        cursor.execute(sql + ";", tuple(params))
+        return [str(row["DATE"]) for row in cursor.fetchall()]
+
+
+def get_validator(
+    conn: Connection,
+    target_date: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    source: Optional[str] = None,
+    dates: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    조건부 GET용 검증자를 digest에서 집계합니다. (word_book 전체를 읽지 않음)
+    날짜 수, 단어 수, 첫/마지막 날짜, 마지막 수정 일시, 변경 버전 합을 반환합니다.
+    단어가 모두 삭제된 날짜도 포함해 집계하므로 삭제에도 마지막 수정 일시와 버전 합이 앞으로 갑니다.
+    """
+    where, params = _date_filters(target_date, start_date, end_date, source, dates, live_only=False)
+    sql = f"""
+    SELECT
+        COUNT(NULLIF(WORD_COUNT, 0)) AS DATE_COUNT,
+        COALESCE(SUM(WORD_COUNT), 0) AS WORD_COUNT,
+        MIN(CASE WHEN WORD_COUNT > 0 THEN DATE END) AS MIN_DATE,
+        MAX(CASE WHEN WORD_COUNT > 0 THEN DATE END) AS MAX_DATE,
+        MAX(LAST_UPDATED_AT) AS LAST_UPDATED_AT,
+        COALESCE(SUM(VERSION), 0) AS VERSION
+    FROM {TABLE_NAME}{where};
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(sql, tuple(params))
+        return cursor.fetchone()
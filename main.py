@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -8,12 +9,32 @@ from api.routers.tts import router as tts_router
 from api.routers.users import router as users_router
 from api.routers.test_weeks import router as test_weeks_router
 from api.routers.tests import router as tests_router
+from api.routers.metrics import router as metrics_router
+from api.routers.export import router as export_router
+from core.database import DatabaseManager
+from core.serialization import ORJSONResponse
+from core.search_index import get_search_index
+from services.availability_stream import get_availability_broadcaster
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 시작 시 단어 검색 인덱스 빌드 (시작을 막지 않도록 백그라운드, 실패하면 첫 검색 때 재시도)
+    get_search_index().rebuild_in_background(DatabaseManager())
+    yield
+    # 종료 시 시험 가능 여부 SSE 타이머를 멈추고 커넥션 풀의 유휴 커넥션 정리
+    await get_availability_broadcaster().stop()
+    DatabaseManager.dispose_instance()
+
 
 # FastAPI 애플리케이션 초기화
 app = FastAPI(
     title="Vocabulary API",
     description="일일 영단어 및 구문 관리 시스템 API",
     version="1.0.0",
+    lifespan=lifespan,
+    # response_model 검증 후 본문은 orjson으로 직렬화
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 설정 추가 (라우터보다 먼저!)
@@ -32,6 +53,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 브라우저에서 페이지네이션 커서 헤더를 읽을 수 있도록 노출
+    expose_headers=["X-Next-Cursor"],
 )
 
 # 2. 라우터 객체를 메인 애플리케이션에 등록합니다.
@@ -41,6 +64,10 @@ app.include_router(tts_router, prefix="/api/v1")
 app.include_router(users_router, prefix="/api/v1")
 app.include_router(test_weeks_router, prefix="/api/v1")
 app.include_router(tests_router, prefix="/api/v1")
+app.include_router(export_router, prefix="/api/v1")
+
+# 모니터링 엔드포인트는 Prometheus 기본 경로(/metrics)에 그대로 노출합니다.
+app.include_router(metrics_router)
 
 # 3. Static 파일 서빙 설정 (오디오 캐시 파일 제공)
 from pathlib import Path
@@ -2,13 +2,17 @@
 시험 관리 도구
 
 주차 정보 및 시험 단어 목록을 수동으로 생성할 수 있는 CLI 도구
+(--from / --to를 지정하면 기간 안의 모든 주차를 일괄 생성)
 """
 
 import argparse
 import logging
 from datetime import datetime
+from core.test_backfill import DEFAULT_BATCH_SIZE, TestBackfill
 from core.test_week_creator import TestWeekCreator
 from core.test_words_creator import TestWordsCreator
+from core.database import DatabaseManager
+from crud import test_weeks, word_book_daily
 
 logging.basicConfig(
     level=logging.INFO,
@@ -99,6 +103,104 @@ def create_test_words(date_str: str = None, count: int = 30):
         logger.info("=" * 80)
 
 
+def backfill(
+    from_str: str,
+    to_str: str,
+    create_weeks: bool,
+    create_words: bool,
+    count: int = 30,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    overwrite: bool = False,
+):
+    """
+    기간(--from ~ --to)의 test_week_info / test_words 일괄 생성
+
+    Args:
+        from_str: 시작 날짜 (YYYY-MM-DD)
+        to_str: 종료 날짜 (YYYY-MM-DD, 포함)
+        create_weeks: 주차 정보 생성 여부
+        create_words: 시험 단어 생성 여부
+        count: 주차별 선택할 단어 개수
+        batch_size: 트랜잭션 하나로 묶는 주차 수
+        overwrite: 이미 시험 단어가 있는 주차도 재생성 (해당 주차 답안도 삭제됨)
+    """
+    logger.info("=" * 80)
+    logger.info("시험 주차 정보 / 시험 단어 기간 일괄 생성")
+    logger.info("=" * 80)
+
+    try:
+        date_from = datetime.strptime(from_str, "%Y-%m-%d")
+        date_to = datetime.strptime(to_str, "%Y-%m-%d")
+    except ValueError:
+        logger.error(f"잘못된 날짜 형식: {from_str} ~ {to_str} (YYYY-MM-DD 형식이어야 합니다)")
+        return
+    if date_from > date_to:
+        logger.error(f"시작 날짜가 종료 날짜보다 늦습니다: {from_str} ~ {to_str}")
+        return
+    logger.info(f"기간: {from_str} ~ {to_str}")
+
+    try:
+        stats = TestBackfill(batch_size).run(
+            date_from, date_to, create_weeks, create_words, count, overwrite
+        )
+    except Exception as e:
+        logger.error(f"❌ 일괄 생성 실패: {e}")
+        return
+
+    elapsed = stats["elapsed"]
+    logger.info("=" * 80)
+    logger.info(f"✅ 일괄 생성 완료! ({elapsed:.2f}s, 토요일 {stats['saturdays']}개)")
+    if create_weeks:
+        logger.info(f"주차 정보: {stats['weeks_created']}개 생성, {stats['weeks_skipped']}개 건너뜀")
+    if create_words:
+        logger.info(
+            f"시험 단어: {stats['words_weeks']}주 / {stats['words_inserted']}개 생성, "
+            f"{stats['words_skipped']}주 건너뜀 (word_book {stats['word_book_rows']}행 조회)"
+        )
+    if elapsed > 0:
+        weeks = stats["weeks_created"] + stats["words_weeks"]
+        logger.info(
+            f"처리량: {weeks / elapsed:.1f}주/s, 시험 단어 {stats['words_inserted'] / elapsed:.0f}개/s"
+        )
+    logger.info("=" * 80)
+
+
+def rebuild_daily_digest():
+    """word_book_daily(날짜별 단어장 요약)를 word_book에서 전체 재생성"""
+    logger.info("=" * 80)
+    logger.info("날짜별 단어장 요약(word_book_daily) 재생성")
+    logger.info("=" * 80)
+
+    try:
+        with DatabaseManager().transaction() as conn:
+            count = word_book_daily.rebuild_all(conn)
+    except Exception as e:
+        logger.error(f"❌ 재생성 실패: {e}")
+        return
+
+    logger.info("=" * 80)
+    logger.info(f"✅ 재생성 완료! (날짜 {count}개)")
+    logger.info("=" * 80)
+
+
+def recompute_week_word_counts():
+    """test_week_info.WORD_COUNT(주차별 단어 수)를 word_book_daily에서 전체 재계산"""
+    logger.info("=" * 80)
+    logger.info("주차별 단어 수(test_week_info.WORD_COUNT) 재계산")
+    logger.info("=" * 80)
+
+    try:
+        with DatabaseManager().transaction() as conn:
+            count = test_weeks.refresh_word_counts(conn)
+    except Exception as e:
+        logger.error(f"❌ 재계산 실패: {e}")
+        return
+
+    logger.info("=" * 80)
+    logger.info(f"✅ 재계산 완료! (값이 바뀐 주차 {count}개)")
+    logger.info("=" * 80)
+
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(
@@ -117,12 +219,51 @@ def main():
         help="test_words 생성 (30개 단어 선택)"
     )
 
+    parser.add_argument(
+        "--rebuild-daily-digest",
+        action="store_true",
+        help="word_book_daily(날짜별 단어장 요약) 전체 재생성"
+    )
+
+    parser.add_argument(
+        "--recompute-week-word-counts",
+        action="store_true",
+        help="test_week_info.WORD_COUNT(주차별 단어 수) 전체 재계산"
+    )
+
     parser.add_argument(
         "--date",
         type=str,
         help="기준 날짜 (YYYY-MM-DD). create-week-info: 해당 주의 정보 생성, create-test-words: 토요일 날짜"
     )
 
+    parser.add_argument(
+        "--from",
+        dest="date_from",
+        type=str,
+        help="기간 일괄 생성 시작 날짜 (YYYY-MM-DD). --to와 함께 사용"
+    )
+
+    parser.add_argument(
+        "--to",
+        dest="date_to",
+        type=str,
+        help="기간 일괄 생성 종료 날짜 (YYYY-MM-DD, 포함). 사이의 모든 토요일 주차를 생성"
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"기간 일괄 생성 시 트랜잭션 하나로 묶는 주차 수 (기본: {DEFAULT_BATCH_SIZE})"
+    )
+
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="기간 일괄 생성 시 이미 시험 단어가 있는 주차도 재생성 (해당 주차 답안도 삭제됨)"
+    )
+
     parser.add_argument(
         "--count",
         type=int,
@@ -132,10 +273,28 @@ def main():
 
     args = parser.parse_args()
 
-    if args.create_week_info:
+    if args.date_from or args.date_to:
+        if not (args.date_from and args.date_to):
+            parser.error("--from과 --to는 함께 지정해야 합니다.")
+        # 생성 대상을 지정하지 않으면 주차 정보와 시험 단어를 모두 생성
+        both = not (args.create_week_info or args.create_test_words)
+        backfill(
+            args.date_from,
+            args.date_to,
+            args.create_week_info or both,
+            args.create_test_words or both,
+            args.count,
+            args.batch_size,
+            args.overwrite,
+        )
+    elif args.create_week_info:
         create_week_info(args.date)
     elif args.create_test_words:
         create_test_words(args.date, args.count)
+    elif args.rebuild_daily_digest:
+        rebuild_daily_digest()
+    elif args.recompute_week_word_counts:
+        recompute_week_word_counts()
     else:
         parser.print_help()
         print("\n사용 예시:")
@@ -144,6 +303,11 @@ def main():
         print("  python manage_test.py --create-test-words")
         print("  python manage_test.py --create-test-words --date 2025-10-11")
         print("  python manage_test.py --create-test-words --date 2025-10-11 --count 20")
+        print("  python manage_test.py --from 2025-01-01 --to 2025-06-30")
+        print("  python manage_test.py --create-week-info --from 2025-01-01 --to 2025-06-30")
+        print("  python manage_test.py --create-test-words --from 2025-01-01 --to 2025-06-30 --batch-size 20")
+        print("  python manage_test.py --rebuild-daily-digest")
+        print("  python manage_test.py --recompute-week-word-counts")
 
 
 if __name__ == "__main__":
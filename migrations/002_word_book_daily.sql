@@ -0,0 +1,31 @@
+-- ============================================
+-- 날짜별 단어장 요약(digest) 테이블
+-- ============================================
+
+-- sb.word_book_daily definition
+-- word_book의 날짜별 집계를 미리 저장 (word_book 쓰기 경로에서 같은 트랜잭션으로 갱신)
+-- 최적화: 날짜 목록 조회는 PK 역순 스캔, 날짜별 헤더(source_url 등)는 PK 단건 조회
+
+CREATE TABLE `word_book_daily` (
+  `DATE` date NOT NULL COMMENT 'PK: 단어 추출 날짜',
+  `WORD_COUNT` int NOT NULL DEFAULT 0 COMMENT '해당 날짜의 단어 수',
+  `SOURCE_URL` varchar(1024) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci DEFAULT NULL COMMENT '대표 출처 URL',
+  `SOURCE` enum('EBS','BBC') CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci DEFAULT NULL COMMENT '출처 (EBS / BBC)',
+  `LAST_UPDATED_AT` datetime NOT NULL COMMENT '해당 날짜 단어의 마지막 수정 일시',
+  PRIMARY KEY (`DATE`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='날짜별 단어장 요약 테이블';
+
+-- 기존 데이터로 초기 digest 생성 (이후에는 python manage_test.py --rebuild-daily-digest로 재생성 가능)
+INSERT INTO `word_book_daily` (`DATE`, `WORD_COUNT`, `SOURCE_URL`, `SOURCE`, `LAST_UPDATED_AT`)
+SELECT
+  `DATE`,
+  COUNT(*),
+  MIN(`SOURCE_URL`),
+  CASE
+    WHEN MIN(`SOURCE_URL`) LIKE '%ebs.co.kr%' THEN 'EBS'
+    WHEN MIN(`SOURCE_URL`) LIKE '%bbc.co%' THEN 'BBC'
+    ELSE NULL
+  END,
+  MAX(`UPDATED_AT`)
+FROM `word_book`
+GROUP BY `DATE`;
@@ -0,0 +1,7 @@
+-- ============================================
+-- word_book_daily 출처별 날짜 목록 인덱스
+-- ============================================
+
+-- /vocabulary/dates?source=EBS|BBC 조회를 (SOURCE, DATE) 인덱스 전용 역순 스캔으로 처리
+ALTER TABLE `word_book_daily`
+  ADD KEY `idx_word_book_daily_source_date` (`SOURCE`, `DATE` DESC) COMMENT '출처별 날짜 목록 조회 최적화';
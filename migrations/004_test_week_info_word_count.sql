@@ -0,0 +1,21 @@
+-- ============================================
+-- test_week_info 주차별 단어 수 컬럼
+-- ============================================
+
+-- 주차 목록(/test-weeks/, /tests/current-availability)이 주차마다 word_book을 COUNT(*)하던
+-- 상관 서브쿼리를 없애기 위해 주차 범위(START_DATE~END_DATE)의 단어 수를 미리 저장
+-- word_book 쓰기 경로(word_book_daily 갱신과 같은 트랜잭션)와 주차 생성 시 갱신
+-- 어긋난 경우 python manage_test.py --recompute-week-word-counts로 재계산 가능
+
+ALTER TABLE `test_week_info`
+  ADD COLUMN `WORD_COUNT` int NOT NULL DEFAULT 0 COMMENT '주차 범위(START_DATE~END_DATE)의 단어 수' AFTER `TEST_END_DATETIME`;
+
+-- 기존 주차 초기값 (UPDATED_AT은 주차 정의 수정 일시이므로 유지)
+UPDATE `test_week_info` twi
+SET
+  twi.`WORD_COUNT` = (
+    SELECT COALESCE(SUM(d.`WORD_COUNT`), 0)
+    FROM `word_book_daily` d
+    WHERE d.`DATE` BETWEEN twi.`START_DATE` AND twi.`END_DATE`
+  ),
+  twi.`UPDATED_AT` = twi.`UPDATED_AT`;
@@ -0,0 +1,19 @@
+-- ============================================
+-- 주차별 시험 단어 응답 스냅샷 테이블
+-- ============================================
+
+-- sb.test_words_snapshot definition
+-- GET /test-weeks/{twi_id}/words 응답(JSON)과 gzip 압축본을 시험 단어 생성 시점에 미리 저장
+-- ETAG는 저장 당시의 검증자(crud.test_weeks.get_test_week_words_validator)로 만든 값이며,
+-- 요청 시 검증자 ETag와 같을 때만 저장된 bytes를 그대로 응답 (다르면 실시간 조회 후 다시 저장)
+
+CREATE TABLE `test_words_snapshot` (
+  `TWI_ID` int NOT NULL COMMENT 'PK, FK: 시험 주차 ID (test_week_info.TWI_ID)',
+  `ETAG` varchar(64) CHARACTER SET ascii COLLATE ascii_bin NOT NULL COMMENT '저장 당시 검증자 ETag',
+  `BODY` mediumblob NOT NULL COMMENT '응답 JSON (UTF-8)',
+  `BODY_GZIP` mediumblob NOT NULL COMMENT '응답 JSON gzip 압축본',
+  `CREATED_AT` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일시',
+  `UPDATED_AT` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일시',
+  PRIMARY KEY (`TWI_ID`),
+  CONSTRAINT `fk_test_words_snapshot_twi_id` FOREIGN KEY (`TWI_ID`) REFERENCES `test_week_info` (`TWI_ID`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='주차별 시험 단어 응답 스냅샷';
@@ -0,0 +1,17 @@
+-- ============================================
+-- word_book_daily 변경 버전 / 삭제 날짜 유지
+-- ============================================
+
+-- 조건부 GET 검증자(ETag / Last-Modified)가 단어 삭제에도 앞으로 가도록 digest를 바꿈
+-- - VERSION: 날짜의 단어가 바뀔 때마다(추가/수정/삭제) 1씩 증가. 같은 초 안의 연속 수정도 ETag에 반영
+-- - 단어가 모두 삭제된 날짜는 행을 지우지 않고 WORD_COUNT = 0으로 남김 (기간의 VERSION 합, 마지막 수정 일시가 줄지 않도록)
+--   날짜 목록 / 날짜별 헤더 조회는 WORD_COUNT > 0인 행만 읽음
+-- - LAST_UPDATED_AT은 집계 시점(NOW()) 이상으로 기록 (삭제 시에도 앞으로 감)
+
+ALTER TABLE `word_book_daily`
+  ADD COLUMN `VERSION` bigint NOT NULL DEFAULT 1 COMMENT '해당 날짜 단어의 변경 버전 (변경마다 증가)' AFTER `LAST_UPDATED_AT`;
+
+-- 출처별 날짜 목록에서 삭제된 날짜(WORD_COUNT = 0)를 거르면서도 인덱스 전용 스캔을 유지
+ALTER TABLE `word_book_daily`
+  DROP KEY `idx_word_book_daily_source_date`,
+  ADD KEY `idx_word_book_daily_source_date` (`SOURCE`, `DATE` DESC, `WORD_COUNT`) COMMENT '출처별 날짜 목록 조회 최적화';
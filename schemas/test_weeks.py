@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from datetime import date, datetime
+from core.serialization import RowMapper
 
 # 주차 정보 응답 모델
 class TestWeekResponse(BaseModel):
@@ -20,17 +21,25 @@ class TestWeekResponse(BaseModel):
     @classmethod
     def from_db_dict(cls, db_dict: dict):
         """데이터베이스 딕셔너리를 TestWeekResponse 객체로 변환"""
-        return cls(
-            twi_id=db_dict.get("TWI_ID"),
-            name=db_dict.get("NAME"),
-            start_date=db_dict.get("START_DATE"),
-            end_date=db_dict.get("END_DATE"),
-            test_start_datetime=db_dict.get("TEST_START_DATETIME"),
-            test_end_datetime=db_dict.get("TEST_END_DATETIME"),
-            word_count=db_dict.get("word_count") or db_dict.get("WORD_COUNT") or 0,  # COUNT 결과는 소문자 또는 대문자일 수 있음
-            created_at=db_dict.get("CREATED_AT"),
-            updated_at=db_dict.get("UPDATED_AT"),
-        )
+        return TEST_WEEK_ROW.to_model(db_dict)
+
+
+# DB 행 → TestWeekResponse 필드 (응답 직렬화 fast path, core.serialization)
+TEST_WEEK_ROW = RowMapper(
+    TestWeekResponse,
+    {
+        "twi_id": "TWI_ID",
+        "name": "NAME",
+        "start_date": "START_DATE",
+        "end_date": "END_DATE",
+        "test_start_datetime": "TEST_START_DATETIME",
+        "test_end_datetime": "TEST_END_DATETIME",
+        # COUNT 결과는 소문자 또는 대문자일 수 있음
+        "word_count": lambda row: row.get("word_count") or row.get("WORD_COUNT") or 0,
+        "created_at": "CREATED_AT",
+        "updated_at": "UPDATED_AT",
+    },
+)
 
 # 주차 목록 응답 모델
 class TestWeekListResponse(BaseModel):
@@ -51,13 +60,20 @@ class TestWeekWordResponse(BaseModel):
     @classmethod
     def from_db_dict(cls, db_dict: dict):
         """데이터베이스 딕셔너리를 TestWeekWordResponse 객체로 변환"""
-        return cls(
-            tw_id=db_dict.get("TW_ID"),
-            wb_id=db_dict.get("WB_ID"),
-            word_english=db_dict.get("WORD_ENGLISH"),
-            word_meaning=db_dict.get("WORD_MEANING"),
-            date=db_dict.get("DATE"),
-        )
+        return TEST_WEEK_WORD_ROW.to_model(db_dict)
+
+
+# DB 행 → TestWeekWordResponse 필드
+TEST_WEEK_WORD_ROW = RowMapper(
+    TestWeekWordResponse,
+    {
+        "tw_id": "TW_ID",
+        "wb_id": "WB_ID",
+        "word_english": "WORD_ENGLISH",
+        "word_meaning": "WORD_MEANING",
+        "date": "DATE",
+    },
+)
 
 # 주차별 단어 목록 응답 모델
 class TestWeekWordsResponse(BaseModel):
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, field_validator
 from datetime import datetime, date
 from typing import Optional, List
+from core.serialization import RowMapper
 
 # 시험 시작 요청
 class TestStartRequest(BaseModel):
@@ -116,6 +117,27 @@ class TestHistoryItem(BaseModel):
         from_attributes = True
 
 
+# DB 행(crud.tests.get_test_history) → TestHistoryItem 필드 (응답 직렬화 fast path)
+TEST_HISTORY_ROW = RowMapper(
+    TestHistoryItem,
+    {
+        "tr_id": "TR_ID",
+        "u_id": "U_ID",
+        "twi_id": "TWI_ID",
+        "test_score": "TEST_SCORE",
+        "created_at": "CREATED_AT",
+        "updated_at": "UPDATED_AT",
+        "week_name": "week_name",
+        "start_date": "START_DATE",
+        "end_date": "END_DATE",
+        "test_date": "test_date",
+        "total_questions": "total_questions",
+        # SUM 결과는 Decimal (답안이 없으면 NULL)
+        "correct_count": lambda row: int(row.get("correct_count") or 0),
+    },
+)
+
+
 # 시험 기록 히스토리 응답
 class TestHistoryResponse(BaseModel):
     user_id: int
@@ -136,6 +158,20 @@ class TestAnswerDetail(BaseModel):
         from_attributes = True
 
 
+# DB 행(crud.tests.get_test_detail의 answers) → TestAnswerDetail 필드
+TEST_ANSWER_ROW = RowMapper(
+    TestAnswerDetail,
+    {
+        "ta_id": "TA_ID",
+        "tw_id": "TW_ID",
+        "word_english": "WORD_ENGLISH",
+        "word_meaning": "WORD_MEANING",
+        "user_answer": "USER_ANSWER",
+        "is_correct": lambda row: bool(row.get("IS_CORRECT")),  # TINYINT(1)
+    },
+)
+
+
 # 시험 상세 결과 응답
 class TestDetailResponse(BaseModel):
     tr_id: int
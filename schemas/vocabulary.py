@@ -1,6 +1,7 @@
 from pydantic import BaseModel, field_validator, Field
 from datetime import datetime, date
 from typing import Optional, List
+from core.serialization import RowMapper
 
 
 # 유틸리티: YYYY-MM-DD 형식 검증
@@ -86,21 +87,120 @@ class VocabularyResponse(VocabularyBase):
     @classmethod
     def from_db_dict(cls, db_dict: dict):
         """데이터베이스 딕셔너리를 VocabularyResponse 객체로 변환"""
-        return cls(
-            wb_id=db_dict.get("WB_ID"),
-            english_word=db_dict.get("WORD_ENGLISH"),
-            korean_meaning=db_dict.get("WORD_MEANING"),
-            source_url=db_dict.get("SOURCE_URL"),
-            date=db_dict.get("DATE"),
-            created_at=db_dict.get("CREATED_AT"),
-            updated_at=db_dict.get("UPDATED_AT"),
-        )
+        return VOCABULARY_ROW.to_model(db_dict)
+
+
+# DB 행 → VocabularyResponse 필드 (응답 직렬화 fast path, core.serialization)
+VOCABULARY_ROW = RowMapper(
+    VocabularyResponse,
+    {
+        "english_word": "WORD_ENGLISH",
+        "korean_meaning": "WORD_MEANING",
+        "source_url": "SOURCE_URL",
+        "wb_id": "WB_ID",
+        "date": "DATE",
+        "created_at": "CREATED_AT",
+        "updated_at": "UPDATED_AT",
+    },
+)
 
 
 # 4. 날짜별 단어 목록 응답 모델 (날짜 + source_url + 단어 목록)
 class VocabularyListResponse(BaseModel):
-    date: str  # YYYY-MM-DD
+    date: Optional[str] = None  # YYYY-MM-DD (target_date로 조회한 경우에만)
     source_url: Optional[str] = (
         None  # 해당 날짜의 대표 source_url (null이 아닌 값 중 하나)
     )
     words: List[VocabularyResponse]  # 단어 목록
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 null)
+
+
+# 5. 다건 UPSERT 결과 항목 (POST /bulk)
+class VocabularyBulkItem(BaseModel):
+    index: int  # 요청 목록에서의 위치 (0부터)
+    status: str  # "inserted" or "updated"
+    word: VocabularyResponse
+
+
+# 6. 다건 UPSERT 응답 모델
+class VocabularyBulkResponse(BaseModel):
+    total: int
+    inserted_count: int
+    updated_count: int
+    items: List[VocabularyBulkItem]
+
+
+# 7. 검색 결과 항목 (GET /search)
+class VocabularySearchItem(BaseModel):
+    wb_id: int
+    date: date
+    english_word: str
+    korean_meaning: str
+    match: str  # "english" (표제어 접두어) or "korean" (뜻 n-gram)
+    score: int  # 작을수록 정확한 일치 (0: 완전 일치)
+
+
+# 8. 검색 응답 모델
+class VocabularySearchResponse(BaseModel):
+    query: str
+    count: int
+    items: List[VocabularySearchItem]
+
+
+# 9. 오타 허용 조회 결과 항목 (GET /lookup)
+class VocabularyLookupItem(BaseModel):
+    wb_id: int
+    date: date
+    english_word: str
+    korean_meaning: str
+    distance: int  # 정규화한 표제어와의 편집 거리 (0: 정답 처리되는 표기)
+
+
+# 10. 오타 허용 조회 응답 모델
+class VocabularyLookupResponse(BaseModel):
+    query: str
+    normalized_query: str  # 채점과 같은 규칙으로 정규화한 질의어
+    max_distance: int
+    items: List[VocabularyLookupItem]
+
+
+# 11. 가져오기 거부 항목 (POST /import)
+class VocabularyImportRejectedItem(BaseModel):
+    line: int  # 파일에서의 줄 번호 (1부터, CSV는 헤더 포함)
+    reason: str
+
+
+# 12. 가져오기 결과 요약
+class VocabularyImportResponse(BaseModel):
+    total_rows: int  # 읽은 데이터 행 수 (거부 포함)
+    inserted_count: int
+    updated_count: int
+    rejected_count: int
+    chunks: int  # 커밋한 청크(트랜잭션) 수
+    rejected: List[VocabularyImportRejectedItem]  # 거부 사유 (앞에서부터 최대 MAX_REJECTED_DETAILS개)
+
+
+# 13. ID 목록 일괄 조회 요청 (POST /batch)
+class VocabularyBatchRequest(BaseModel):
+    ids: List[int] = Field(..., description="조회할 단어 ID 목록 (요청 순서대로 반환)")
+
+
+# 14. ID 목록 일괄 조회 응답
+class VocabularyBatchResponse(BaseModel):
+    words: List[VocabularyResponse]  # 요청한 ID 순서 (중복 ID는 한 번만)
+    missing_ids: List[int]  # 존재하지 않는 ID
+
+
+# 15. 날짜별 단어 묶음 (GET /range)
+class VocabularyDateGroup(BaseModel):
+    date: str  # YYYY-MM-DD
+    source_url: Optional[str] = None  # 해당 날짜의 대표 source_url
+    words: List[VocabularyResponse]
+
+
+# 16. 기간/여러 날짜 단어 응답 모델
+class VocabularyRangeResponse(BaseModel):
+    start_date: str
+    end_date: str
+    word_count: int
+    dates: List[VocabularyDateGroup]  # 날짜순
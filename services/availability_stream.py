@@ -0,0 +1,199 @@
+"""
+시험 가능 여부 Server-Sent Events 브로드캐스트
+
+프로세스에 타이머 태스크 하나만 두고 다음 전환 시점(시험 시작/종료, 시험 중 분 단위 카운트다운)에
+깨어나 현재 상태를 계산한 뒤, 바뀌었으면 연결된 모든 클라이언트에 같은 메시지를 보냅니다.
+클라이언트 수와 관계없이 DB는 주차 구간 인덱스(core.week_index)가 만료될 때만 읽습니다.
+
+이벤트 (data는 TestAvailabilityResponse JSON):
+    status  연결 직후 현재 상태, 또는 시험 시간 밖에서 주차 정보가 바뀐 경우
+    open    시험 시간이 시작됨
+    close   시험 시간이 끝남
+    tick    시험 중 remaining_minutes가 바뀜
+연결 유지를 위해 KEEPALIVE_SECONDS 동안 이벤트가 없으면 주석 줄(": keepalive")을 보냅니다.
+
+각 클라이언트는 최신 메시지 하나만 기다리므로, 느린 클라이언트는 중간 메시지를 건너뛰고
+가장 최근 상태를 받습니다. (클라이언트당 대기 Future 하나 외에 버퍼 없음)
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from core.availability import get_availability_snapshot
+from core.database import DatabaseManager
+from core.metrics import REGISTRY
+from services.tests import TestService
+
+# 이벤트가 없을 때 연결 유지 주석을 보내는 간격 (초, 프록시 유휴 타임아웃보다 짧게)
+KEEPALIVE_SECONDS = 15.0
+# 전환 시각 직후에 깨어나도록 더하는 여유 (초)
+_WAKE_MARGIN = 0.05
+# 연결이 끊겼을 때 EventSource가 재연결을 기다리는 시간 (밀리초)
+RETRY_MILLISECONDS = 5000
+
+_KEEPALIVE = b": keepalive\n\n"
+
+
+def format_event(event: str, seq: int, data: bytes) -> bytes:
+    return b"event: %s\nid: %d\ndata: %s\n\n" % (event.encode("ascii"), seq, data)
+
+
+class AvailabilityBroadcaster:
+    """타이머 태스크 하나가 모든 SSE 구독자에게 같은 메시지를 보내는 브로드캐스터"""
+
+    def __init__(self, db: DatabaseManager):
+        self.db = db
+        self.subscribers = 0
+        self._task: Optional[asyncio.Task] = None
+        # 최신 메시지와 일련번호. publish할 때마다 _changed를 set하고 새 Event로 교체합니다.
+        self._seq = 0
+        self._message = b""
+        self._changed: Optional[asyncio.Event] = None
+        # 마지막 상태 이벤트(keepalive 제외)와 그 번호: 중간 메시지를 놓친 클라이언트에 다시 보냄
+        self._event_seq = 0
+        self._event_message = b""
+        # 마지막으로 보낸 상태 (시험 가능 여부, data JSON)
+        self._available: Optional[bool] = None
+        self._data = b""
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # --- 상태 계산 / 발행 ---
+
+    async def _current(self) -> Tuple[bool, bytes, datetime]:
+        snapshot = get_availability_snapshot()
+        if not snapshot.is_fresh():
+            await self.db.run_sync(snapshot.refresh, self.db)
+        now = datetime.now()
+        # 갱신된 인덱스를 넘겨 이벤트 루프에서 DB를 조회하지 않도록 함
+        availability = TestService(self.db).get_current_availability(now, snapshot.index)
+        return availability.is_available, availability.model_dump_json().encode("utf-8"), now
+
+    def _publish(self, message: bytes, is_event: bool = True) -> None:
+        self._seq += 1
+        self._message = message
+        if is_event:
+            self._event_seq, self._event_message = self._seq, message
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def _update(self) -> datetime:
+        """현재 상태를 계산해 바뀌었으면 이벤트를 보냅니다. 계산 시각을 반환합니다."""
+        available, data, now = await self._current()
+        if data != self._data:
+            if self._available is not None and available != self._available:
+                event = "open" if available else "close"
+            else:
+                event = "tick" if available else "status"
+            self._available, self._data = available, data
+            self._publish(format_event(event, self._seq + 1, data))
+        return now
+
+    async def _run(self, delay: float) -> None:
+        """다음 전환 시점마다 깨어나는 타이머. 구독자가 모두 떠나면 종료합니다."""
+        loop = asyncio.get_running_loop()
+        last_sent = loop.time()
+        while True:
+            await asyncio.sleep(delay)
+            if self.subscribers == 0:
+                return
+
+            seq = self._seq
+            try:
+                now = await self._update()
+                delay = get_availability_snapshot().seconds_until_change(now) + _WAKE_MARGIN
+            except Exception as e:
+                logging.error(f"Availability broadcast failed: {e}")
+                delay = KEEPALIVE_SECONDS
+
+            current = loop.time()
+            if self._seq != seq:
+                last_sent = current
+            elif current - last_sent >= KEEPALIVE_SECONDS:
+                self._publish(_KEEPALIVE, is_event=False)
+                last_sent = current
+            delay = min(delay, last_sent + KEEPALIVE_SECONDS - current)
+
+    async def start(self) -> None:
+        """
+        타이머가 돌고 있지 않으면 현재 상태를 계산하고 타이머를 시작합니다.
+        상태 계산(주차 조회)에 실패하면 스트림을 시작하기 전에 500을 반환합니다.
+        """
+        if self.running:
+            return
+        # 이전 타이머의 Event는 다른 이벤트 루프에 묶였을 수 있으므로 새로 만들고, 남은 대기자는 깨움
+        previous, self._changed = self._changed, asyncio.Event()
+        if previous is not None:
+            previous.set()
+        self._available, self._data = None, b""
+        try:
+            now = await self._update()
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to check test availability: {e}",
+            )
+        if not self.running:
+            delay = get_availability_snapshot().seconds_until_change(now) + _WAKE_MARGIN
+            self._task = asyncio.create_task(self._run(min(delay, KEEPALIVE_SECONDS)))
+
+    async def stop(self) -> None:
+        """타이머 태스크를 멈춥니다. (애플리케이션 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+    # --- 구독 ---
+
+    async def events(self) -> AsyncIterator[bytes]:
+        """
+        SSE 응답 본문 (start() 이후에 사용). 클라이언트 연결이 끊기면
+        StreamingResponse가 제너레이터를 취소합니다.
+        """
+        self.subscribers += 1
+        try:
+            if not self.running:
+                # 마지막 구독자가 떠나 타이머가 멈춘 직후에 연결된 경우
+                await self.start()
+            seq, event_seq = self._seq, self._event_seq
+            yield b"retry: %d\n" % RETRY_MILLISECONDS + format_event("status", event_seq, self._data)
+            while True:
+                changed = self._changed
+                if self._seq == seq:
+                    await changed.wait()
+                seq = self._seq
+                if self._event_seq != event_seq:
+                    event_seq = self._event_seq
+                    yield self._event_message
+                else:
+                    yield _KEEPALIVE
+        finally:
+            self.subscribers -= 1
+
+
+_broadcaster: Optional[AvailabilityBroadcaster] = None
+
+
+def get_availability_broadcaster() -> AvailabilityBroadcaster:
+    """프로세스 전역 AvailabilityBroadcaster를 반환합니다."""
+    global _broadcaster
+    if _broadcaster is None:
+        _broadcaster = AvailabilityBroadcaster(DatabaseManager())
+    return _broadcaster
+
+
+REGISTRY.gauge_callback(
+    "availability_stream_clients",
+    "Connected /tests/availability/stream clients",
+    lambda: [({}, _broadcaster.subscribers if _broadcaster is not None else 0)],
+)
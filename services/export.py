@@ -0,0 +1,252 @@
+"""
+데이터 내보내기 서비스 (NDJSON / CSV 스트리밍, 선택적 gzip)
+
+비버퍼 커서(SSDictCursor)로 읽은 행을 EXPORT_BATCH_SIZE개씩 인코딩해 바로 흘려보내므로
+내보내는 행 수와 관계없이 메모리 사용량이 일정합니다.
+커넥션은 스트림이 끝날 때까지 풀에서 하나를 점유하며, 각 배치 읽기는 db.run_sync로 실행되어
+다른 DB 작업과 같은 동시 실행 제한을 받습니다.
+
+커넥션 대여와 첫 배치 조회는 응답을 시작하기 전에 끝내므로, 풀 대기 초과(503)나 SQL 오류(500)는
+200 응답이 잘린 채 끝나는 대신 HTTP 오류 상태로 전달됩니다.
+"""
+
+import csv
+import io
+import json
+import logging
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence
+
+import anyio
+from fastapi import HTTPException, status
+from pymysql.connections import Connection
+
+from core.database import DatabaseManager, PoolTimeoutError
+from crud import tests as crud_tests
+from crud import vocabulary as crud_voca
+
+# 한 번에 읽어 인코딩하는 행 수 (스트림 청크 크기)
+EXPORT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+RowSource = Callable[[Connection], Iterator[Dict[str, Any]]]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return str(value)
+
+
+class _NdjsonEncoder:
+    """행 → 한 줄짜리 JSON"""
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: List[Dict[str, Any]]) -> bytes:
+        return "".join(
+            json.dumps(row, ensure_ascii=False, default=_json_default) + "\n" for row in rows
+        ).encode("utf-8")
+
+
+class _CsvEncoder:
+    """행 → CSV. 스트림 맨 앞에 컬럼명(SELECT 순서) 헤더를 씁니다. (행이 없어도 헤더는 씀)"""
+
+    def __init__(self, columns: Sequence[str]):
+        self._columns = list(columns)
+
+    def header(self) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(self._columns)
+        return buffer.getvalue().encode("utf-8")
+
+    def encode(self, rows: List[Dict[str, Any]]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(
+                value.isoformat() if isinstance(value, (date, datetime)) else value
+                for value in (row[column] for column in self._columns)
+            )
+        return buffer.getvalue().encode("utf-8")
+
+
+class _Stream:
+    """커넥션 하나와 행 이터레이터, 인코더/압축기를 묶은 내보내기 스트림 상태"""
+
+    def __init__(
+        self, db: DatabaseManager, source: RowSource, columns: Sequence[str], fmt: str, compress: bool
+    ):
+        self.db = db
+        self.source = source
+        self.encoder = _CsvEncoder(columns) if fmt == "csv" else _NdjsonEncoder()
+        # 첫 청크 앞에 붙일 헤더
+        self.pending = self.encoder.header()
+        # wbits=31: gzip 헤더/트레일러 포함
+        self.compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+        self.conn: Optional[Connection] = None
+        self.rows: Optional[Iterator[Dict[str, Any]]] = None
+
+    def open(self) -> None:
+        self.conn = self.db.pool.acquire()
+        self.rows = self.source(self.conn)
+
+    def next_chunk(self) -> Optional[bytes]:
+        """다음 배치를 인코딩(압축)한 bytes를 반환합니다. 끝나면 None."""
+        batch = list(islice(self.rows, EXPORT_BATCH_SIZE))
+        chunk, self.pending = self.pending + (self.encoder.encode(batch) if batch else b""), b""
+        if not batch:
+            if self.compressor is not None:
+                tail, self.compressor = self.compressor.compress(chunk) + self.compressor.flush(), None
+                return tail
+            return chunk or None
+        if self.compressor is not None:
+            chunk = self.compressor.compress(chunk)
+        return chunk
+
+    def close(self, finished: bool) -> None:
+        """
+        커넥션을 풀에 반환합니다. 중간에 끊긴 경우(클라이언트 연결 종료, 오류)에는
+        남은 결과를 끝까지 읽어 버리지 않도록 커넥션을 닫고 버립니다.
+        """
+        if self.conn is None:
+            return
+        conn, self.conn = self.conn, None
+        if finished:
+            self.rows.close()
+            self.db.pool.release(conn)
+            return
+
+        self.db.pool.release(conn, discard=True)
+        try:
+            self.rows.close()
+        except Exception:
+            pass
+
+
+class ExportStream:
+    """
+    첫 청크까지 읽어 둔 내보내기 스트림 (StreamingResponse 본문)
+
+    응답이 본문을 읽기 시작하기 전에 끝나도(클라이언트 연결 종료) 커넥션이 남지 않도록
+    정리는 aclose()에 두고, 응답 쪽에서 항상 호출합니다.
+    """
+
+    def __init__(self, db: DatabaseManager, stream: _Stream, first: Optional[bytes]):
+        self.db = db
+        self._stream = stream
+        self._first = first
+        self._finished = False
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            chunk, self._first = self._first, None
+            while chunk is not None:
+                if chunk:
+                    yield chunk
+                chunk = await self.db.run_sync(self._stream.next_chunk)
+            self._finished = True
+        except Exception as e:
+            logging.error(f"Export stream failed: {e}")
+            raise
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """커넥션을 정리합니다. (여러 번 호출해도 한 번만 실행)"""
+        if self._closed:
+            return
+        self._closed = True
+        # 클라이언트 연결 종료로 취소된 경우에도 커넥션은 반드시 정리
+        with anyio.CancelScope(shield=True):
+            await self.db.run_sync(self._stream.close, self._finished)
+
+
+class ExportService:
+    """word_book / 시험 결과 내보내기 서비스"""
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db = db_manager
+
+    async def _open(
+        self, source: RowSource, columns: Sequence[str], fmt: str, compress: bool
+    ) -> ExportStream:
+        """커넥션을 대여하고 첫 배치까지 읽은 스트림을 반환합니다. 실패하면 커넥션을 버리고 HTTP 오류로 알립니다."""
+        stream = _Stream(self.db, source, columns, fmt, compress)
+        opened = False
+        try:
+            await self.db.run_sync(stream.open)
+            first = await self.db.run_sync(stream.next_chunk)
+            opened = True
+        except PoolTimeoutError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Export is busy, try again later: {e}",
+            )
+        except Exception as e:
+            logging.error(f"Export stream failed: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to export: {e}",
+            )
+        finally:
+            if not opened:
+                with anyio.CancelScope(shield=True):
+                    await self.db.run_sync(stream.close, False)
+        return ExportStream(self.db, stream, first)
+
+    async def export_words(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        fmt: str = "ndjson",
+        compress: bool = False,
+    ) -> ExportStream:
+        """word_book을 (날짜 범위) DATE 순으로 내보냅니다."""
+        if start_date and end_date and start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date must not be after end_date.",
+            )
+        source = partial(crud_voca.iter_words, start_date=start_date, end_date=end_date)
+        return await self._open(source, crud_voca.EXPORT_COLUMNS, fmt, compress)
+
+    async def export_test_results(
+        self,
+        twi_id: Optional[int],
+        u_id: Optional[int],
+        fmt: str = "ndjson",
+        compress: bool = False,
+    ) -> ExportStream:
+        """시험 결과(test_result)를 주차/사용자별로 내보냅니다."""
+        source = partial(crud_tests.iter_test_results, twi_id=twi_id, u_id=u_id)
+        return await self._open(source, crud_tests.RESULT_EXPORT_COLUMNS, fmt, compress)
+
+    async def export_test_answers(
+        self,
+        twi_id: Optional[int],
+        u_id: Optional[int],
+        fmt: str = "ndjson",
+        compress: bool = False,
+    ) -> ExportStream:
+        """문항별 답안(test_answers)을 주차/사용자별로 내보냅니다."""
+        source = partial(crud_tests.iter_test_answers, twi_id=twi_id, u_id=u_id)
+        return await self._open(source, crud_tests.ANSWER_EXPORT_COLUMNS, fmt, compress)
+
+
+def export_filename(name: str, fmt: str, compress: bool, *parts: Any) -> str:
+    """Content-Disposition용 파일명 (예: word_book_2025-01-01_2025-01-31.ndjson.gz)"""
+    stem = "_".join([name] + [str(part) for part in parts if part is not None])
+    return f"{stem}.{fmt}" + (".gz" if compress else "")
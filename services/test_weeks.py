@@ -1,54 +1,133 @@
+import logging
 from fastapi import HTTPException, status
 from core.database import DatabaseManager
-from schemas.test_weeks import (
-    TestWeekResponse,
-    TestWeekListResponse,
-    TestWeekWordsResponse,
-    TestWeekWordResponse,
-)
+from typing import Any, Dict, Optional
+from core.cache import VersionedLRUCache
+from core.http_cache import Rendered, Validator, make_etag
+from core.metrics import REGISTRY
+from core.serialization import dumps
+from core.test_words_snapshot import compress as compress_body, load_test_week_words, words_validator
+from schemas.test_weeks import TEST_WEEK_ROW
 from crud import test_weeks as crud_test_weeks
 
+SNAPSHOT_REQUESTS = REGISTRY.counter(
+    "test_words_snapshot_requests_total",
+    "Test week words responses by snapshot result (hit / stale / missing)",
+    labelnames=("result",),
+)
+
 
 class TestWeekService:
     """시험 주차 관련 비즈니스 로직을 처리하는 서비스 클래스"""
 
+    # 직렬화된 조회 응답 캐시 (요청마다 서비스가 새로 만들어지므로 클래스 속성으로 공유)
+    cache = VersionedLRUCache("test_weeks")
+
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
 
-    def get_all_test_weeks(self, limit: int = 10, order: str = "desc") -> TestWeekListResponse:
-        """시험 주차 목록 조회"""
+    def get_all_test_weeks(self, limit: int = 10, order: str = "desc") -> Dict[str, Any]:
+        """시험 주차 목록 조회 (TestWeekListResponse 형태의 dict)"""
         try:
             with self.db.get_connection() as conn:
                 db_weeks = crud_test_weeks.get_all_test_weeks(conn, limit, order)
-                weeks = [TestWeekResponse.from_db_dict(week) for week in db_weeks]
-                return TestWeekListResponse(weeks=weeks)
+                return {"weeks": TEST_WEEK_ROW.to_dicts(db_weeks)}
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to fetch test weeks: {e}",
             )
 
-    def get_test_week_words(self, twi_id: int) -> TestWeekWordsResponse:
-        """특정 주차의 단어 목록 조회"""
+    def get_test_week_words(self, twi_id: int) -> Dict[str, Any]:
+        """특정 주차의 단어 목록 조회 (TestWeekWordsResponse 형태의 dict)"""
         with self.db.get_connection() as conn:
-            # 주차 정보 조회
-            week_info = crud_test_weeks.get_test_week_by_id(conn, twi_id)
-            if not week_info:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Test week with ID {twi_id} not found.",
-                )
-
-            # 단어 목록 조회
-            db_words = crud_test_weeks.get_test_week_words(conn, twi_id)
-            words = [TestWeekWordResponse.from_db_dict(word) for word in db_words]
-
-            return TestWeekWordsResponse(
-                twi_id=week_info['TWI_ID'],
-                week_name=week_info['NAME'],
-                start_date=week_info['START_DATE'],
-                end_date=week_info['END_DATE'],
-                test_start_datetime=week_info['TEST_START_DATETIME'],
-                test_end_datetime=week_info['TEST_END_DATETIME'],
-                words=words,
+            words = load_test_week_words(conn, twi_id)
+        if words is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Test week with ID {twi_id} not found.",
             )
+        return words
+
+    def get_all_test_weeks_validator(self, limit: int = 10, order: str = "desc") -> Validator:
+        """주차 목록의 ETag / Last-Modified를 계산합니다."""
+        with self.db.get_connection() as conn:
+            row = crud_test_weeks.get_test_weeks_validator(conn)
+
+        etag = make_etag(
+            "test_weeks", limit, order,
+            row["WEEK_COUNT"], row["WEEK_UPDATED_AT"], row["WORD_COUNT"], row["WORDS_UPDATED_AT"],
+            row["WORDS_VERSION"],
+        )
+        last_modified = max(
+            (value for value in (row["WEEK_UPDATED_AT"], row["WORDS_UPDATED_AT"]) if value),
+            default=None,
+        )
+        return etag, last_modified
+
+    def get_all_test_weeks_json(
+        self, limit: int = 10, order: str = "desc", etag: Optional[str] = None
+    ) -> bytes:
+        """get_all_test_weeks 결과를 JSON bytes로 반환합니다. (읽기 캐시 사용)"""
+        return self.cache.get_or_set(
+            ("test_weeks", limit, order, etag),
+            lambda: dumps(self.get_all_test_weeks(limit, order)),
+        )
+
+    def get_test_week_words_validator(self, twi_id: int) -> Optional[Validator]:
+        """
+        주차 단어 목록의 ETag / Last-Modified를 계산합니다.
+        주차가 없으면 None을 반환하여 본 조회에서 404를 내도록 합니다.
+        """
+        with self.db.get_connection() as conn:
+            row = crud_test_weeks.get_test_week_words_validator(conn, twi_id)
+
+        if not row:
+            return None
+        return words_validator(twi_id, row)
+
+    def get_test_week_words_json(
+        self, twi_id: int, etag: Optional[str] = None, compress: bool = False
+    ) -> Rendered:
+        """
+        get_test_week_words 응답 본문을 반환합니다. (읽기 캐시 사용)
+        compress=True이면 gzip 압축본과 Content-Encoding 헤더를 반환합니다.
+        """
+        return self.cache.get_or_set(
+            ("test_week_words", twi_id, etag, compress),
+            lambda: self._render_test_week_words(twi_id, etag, compress),
+        )
+
+    def _render_test_week_words(self, twi_id: int, etag: Optional[str], compress: bool) -> Rendered:
+        """
+        저장된 스냅샷의 ETag가 현재 검증자 ETag와 같으면 저장된 bytes를 그대로 쓰고,
+        없거나 낡았으면 실시간 조회로 만든 뒤 스냅샷을 다시 저장합니다.
+        """
+        snapshot = None
+        if etag is not None:
+            with self.db.get_connection() as conn:
+                snapshot = crud_test_weeks.get_words_snapshot(conn, twi_id)
+            result = "missing" if snapshot is None else "hit" if snapshot["ETAG"] == etag else "stale"
+            SNAPSHOT_REQUESTS.inc(result=result)
+            if result != "hit":
+                snapshot = None
+
+        if snapshot is not None:
+            body, body_gzip = snapshot["BODY"], snapshot["BODY_GZIP"]
+        else:
+            body = dumps(self.get_test_week_words(twi_id))
+            body_gzip = compress_body(body) if compress or etag is not None else b""
+            if etag is not None:
+                self._store_snapshot(twi_id, etag, body, body_gzip)
+
+        if compress:
+            return body_gzip, {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        return body, {"Vary": "Accept-Encoding"}
+
+    def _store_snapshot(self, twi_id: int, etag: str, body: bytes, body_gzip: bytes) -> None:
+        """실시간 조회 결과로 스냅샷을 다시 저장합니다. 실패해도 응답에는 영향을 주지 않습니다."""
+        try:
+            with self.db.transaction() as conn:
+                crud_test_weeks.save_words_snapshot(conn, twi_id, etag, body, body_gzip)
+        except Exception as e:
+            logging.warning(f"Failed to store test words snapshot (TWI_ID={twi_id}): {e}")
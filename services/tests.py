@@ -1,5 +1,7 @@
 from fastapi import HTTPException, status
 from datetime import datetime
+from typing import Any, Dict, Optional
+from core.week_index import WeekIndex, get_week_index
 from core.database import DatabaseManager
 from schemas.tests import (
     TestStartRequest,
@@ -9,13 +11,10 @@ from schemas.tests import (
     AnswerResultItem,
     TestAvailabilityResponse,
     TestAvailabilityWeekInfo,
-    TestHistoryResponse,
-    TestHistoryItem,
-    TestDetailResponse,
-    TestAnswerDetail,
+    TEST_HISTORY_ROW,
+    TEST_ANSWER_ROW,
 )
 from crud import tests as crud_tests
-from crud import test_weeks as crud_test_weeks
 from crud import users as crud_users
 
 
@@ -28,7 +27,8 @@ class TestService:
     def start_test(self, request: TestStartRequest) -> TestStartResponse:
         """시험 시작 (신규 생성 또는 재시험)"""
         try:
-            with self.db.get_connection() as conn:
+            # 초기화/생성과 재조회를 하나의 트랜잭션으로 묶어 한 번만 commit
+            with self.db.transaction() as conn:
                 # 기존 시험 결과 확인
                 existing = crud_tests.get_existing_test_result(conn, request.u_id, request.twi_id)
 
@@ -73,7 +73,9 @@ class TestService:
     def submit_test(self, tr_id: int, request: TestSubmitRequest) -> TestSubmitResponse:
         """답안 제출 및 자동 채점"""
         try:
-            with self.db.get_connection() as conn:
+            # 답안 저장과 점수 업데이트를 하나의 트랜잭션으로 묶어 한 번만 commit
+            # (잘못된 tw_id 등으로 중단되면 저장된 답안까지 모두 rollback)
+            with self.db.transaction() as conn:
                 # 정답 조회
                 correct_answers = crud_tests.get_correct_answers_for_test(conn, tr_id)
 
@@ -83,8 +85,8 @@ class TestService:
                         detail=f"Test with ID {tr_id} not found or has no questions.",
                     )
 
-                # 각 답안 채점 및 저장
-                results = []
+                # 각 답안 채점 (메모리)
+                graded = []
                 for answer in request.answers:
                     tw_id = answer.tw_id
                     user_ans = answer.user_answer
@@ -104,19 +106,22 @@ class TestService:
                         == crud_tests.normalize_answer(correct['word_english'])
                     )
 
-                    # 답안 저장
-                    ta_id = crud_tests.save_answer(conn, tr_id, tw_id, user_ans, is_correct)
-
-                    results.append(
-                        AnswerResultItem(
-                            ta_id=ta_id,
-                            tw_id=tw_id,
-                            word_english=correct['word_english'],
-                            word_meaning=correct['word_meaning'],
-                            user_answer=user_ans,
-                            is_correct=is_correct,
-                        )
+                    graded.append((tw_id, user_ans, is_correct))
+
+                # 답안 일괄 저장 (다건 UPSERT 1문 + TA_ID 조회 1문)
+                ta_ids = crud_tests.save_answers_bulk(conn, tr_id, graded)
+
+                results = [
+                    AnswerResultItem(
+                        ta_id=ta_ids[tw_id],
+                        tw_id=tw_id,
+                        word_english=correct_answers[tw_id]['word_english'],
+                        word_meaning=correct_answers[tw_id]['word_meaning'],
+                        user_answer=user_ans,
+                        is_correct=is_correct,
                     )
+                    for tw_id, user_ans, is_correct in graded
+                ]
 
                 # 점수 계산
                 correct_count = sum(1 for r in results if r.is_correct)
@@ -142,57 +147,65 @@ class TestService:
                 detail=f"Failed to submit test: {e}",
             )
 
-    def get_current_availability(self) -> TestAvailabilityResponse:
-        """현재 시험 가능 여부 확인"""
-        try:
-            with self.db.get_connection() as conn:
-                # 현재 시간
-                now = datetime.now()
-
-                # 가장 최근 주차 정보 조회
-                weeks = crud_test_weeks.get_all_test_weeks(conn, limit=1, order="desc")
+    def get_current_availability(
+        self, now: Optional[datetime] = None, index: Optional[WeekIndex] = None
+    ) -> TestAvailabilityResponse:
+        """
+        현재 시험 가능 여부 확인 (주차 정보는 메모리의 주차 구간 인덱스)
 
-                if not weeks:
-                    # 주차 정보가 없으면 시험 불가
-                    return TestAvailabilityResponse(
-                        is_available=False,
-                        next_test_datetime=None
-                    )
+        index를 넘기면 DB를 조회하지 않고 그 인덱스로만 계산합니다. 이벤트 루프에서 호출하는 쪽은
+        run_sync 안에서 갱신한 인덱스를 넘겨야 합니다. 없으면 만료된 경우 DB에서 다시 읽습니다.
+        """
+        try:
+            # 현재 시간
+            now = now or datetime.now()
+
+            # 현재 주차
+            if index is None:
+                index = get_week_index().get(self.db)
+            week = index.current()
+
+            if week is None:
+                # 주차 정보가 없으면 시험 불가
+                return TestAvailabilityResponse(
+                    is_available=False,
+                    next_test_datetime=None
+                )
 
-                week = weeks[0]
-                test_start = week['TEST_START_DATETIME']
-                test_end = week['TEST_END_DATETIME']
-
-                # 현재 시간이 시험 시간 범위 내인지 확인
-                if test_start <= now <= test_end:
-                    # 시험 가능
-                    remaining_seconds = (test_end - now).total_seconds()
-                    remaining_minutes = int(remaining_seconds / 60)
-
-                    return TestAvailabilityResponse(
-                        is_available=True,
-                        test_week=TestAvailabilityWeekInfo(
-                            twi_id=week['TWI_ID'],
-                            name=week['NAME'],
-                            start_date=week['START_DATE'],
-                            end_date=week['END_DATE'],
-                            test_start_datetime=test_start,
-                            test_end_datetime=test_end
-                        ),
-                        remaining_minutes=remaining_minutes,
-                        next_test_datetime=None
-                    )
-                else:
-                    # 시험 불가
-                    # 다음 시험 시간 계산 (현재 주차의 시험 시간 또는 다음 주차)
-                    next_test = test_start if now < test_start else None
-
-                    return TestAvailabilityResponse(
-                        is_available=False,
-                        test_week=None,
-                        remaining_minutes=None,
-                        next_test_datetime=next_test
-                    )
+            test_start = week['TEST_START_DATETIME']
+            test_end = week['TEST_END_DATETIME']
+
+            # 현재 시간이 시험 시간 범위 내인지 확인
+            if test_start <= now <= test_end:
+                # 시험 가능
+                remaining_seconds = (test_end - now).total_seconds()
+                remaining_minutes = int(remaining_seconds / 60)
+
+                return TestAvailabilityResponse(
+                    is_available=True,
+                    test_week=TestAvailabilityWeekInfo(
+                        twi_id=week['TWI_ID'],
+                        name=week['NAME'],
+                        start_date=week['START_DATE'],
+                        end_date=week['END_DATE'],
+                        test_start_datetime=test_start,
+                        test_end_datetime=test_end
+                    ),
+                    remaining_minutes=remaining_minutes,
+                    next_test_datetime=None
+                )
+            else:
+                # 시험 불가
+                # 다음 시험 시간 계산 (현재 주차의 시험 시간 또는 다음 주차)
+                next_week = index.next_test(now)
+                next_test = next_week['TEST_START_DATETIME'] if next_week else None
+
+                return TestAvailabilityResponse(
+                    is_available=False,
+                    test_week=None,
+                    remaining_minutes=None,
+                    next_test_datetime=next_test
+                )
 
         except Exception as e:
             raise HTTPException(
@@ -200,8 +213,8 @@ class TestService:
                 detail=f"Failed to check test availability: {e}",
             )
 
-    def get_test_history(self, u_id: int) -> TestHistoryResponse:
-        """사용자의 시험 기록 히스토리 조회"""
+    def get_test_history(self, u_id: int) -> Dict[str, Any]:
+        """사용자의 시험 기록 히스토리 조회 (TestHistoryResponse 형태의 dict)"""
         try:
             with self.db.get_connection() as conn:
                 # 사용자 정보 조회
@@ -215,14 +228,12 @@ class TestService:
                 # 시험 기록 조회
                 history = crud_tests.get_test_history(conn, u_id)
 
-                # Pydantic 모델로 변환
-                history_items = [TestHistoryItem(**item) for item in history]
-
-                return TestHistoryResponse(
-                    user_id=u_id,
-                    username=user['username'],
-                    test_history=history_items
-                )
+                # DB 행은 검증 없이 응답 필드 dict로 변환
+                return {
+                    "user_id": u_id,
+                    "username": user['username'],
+                    "test_history": TEST_HISTORY_ROW.to_dicts(history),
+                }
 
         except HTTPException:
             raise
@@ -232,8 +243,8 @@ class TestService:
                 detail=f"Failed to get test history: {e}",
             )
 
-    def get_test_detail(self, tr_id: int) -> TestDetailResponse:
-        """특정 시험의 상세 결과 조회"""
+    def get_test_detail(self, tr_id: int) -> Dict[str, Any]:
+        """특정 시험의 상세 결과 조회 (TestDetailResponse 형태의 dict)"""
         try:
             with self.db.get_connection() as conn:
                 # 시험 상세 정보 조회
@@ -245,21 +256,19 @@ class TestService:
                         detail=f"Test result with ID {tr_id} not found",
                     )
 
-                # 답안 목록을 Pydantic 모델로 변환
-                answer_details = [TestAnswerDetail(**answer) for answer in detail['answers']]
-
-                return TestDetailResponse(
-                    tr_id=detail['TR_ID'],
-                    u_id=detail['U_ID'],
-                    username=detail['USERNAME'],
-                    twi_id=detail['TWI_ID'],
-                    week_name=detail['week_name'],
-                    test_score=detail['TEST_SCORE'],
-                    test_date=detail['test_date'],
-                    total_questions=detail['total_questions'],
-                    correct_count=detail['correct_count'],
-                    answers=answer_details
-                )
+                # DB 행은 검증 없이 응답 필드 dict로 변환
+                return {
+                    "tr_id": detail['TR_ID'],
+                    "u_id": detail['U_ID'],
+                    "username": detail['USERNAME'],
+                    "twi_id": detail['TWI_ID'],
+                    "week_name": detail['week_name'],
+                    "test_score": detail['TEST_SCORE'],
+                    "test_date": detail['test_date'],
+                    "total_questions": detail['total_questions'],
+                    "correct_count": int(detail['correct_count'] or 0),
+                    "answers": TEST_ANSWER_ROW.to_dicts(detail['answers']),
+                }
 
         except HTTPException:
             raise
@@ -8,6 +8,7 @@ import hashlib
 import edge_tts
 from pathlib import Path
 from typing import Optional
+from core.metrics import REGISTRY
 
 
 class TTSService:
@@ -181,3 +182,13 @@ class TTSService:
             print(f"[TTS Cleanup] Error during cleanup: {str(e)}")
 
         return count
+
+
+def _collect_audio_cache_files():
+    """/metrics 스크랩 시 디스크에 캐시된 오디오 파일 수를 셉니다."""
+    return [({}, sum(1 for _ in TTSService.AUDIO_DIR.glob("*.mp3")))]
+
+
+REGISTRY.gauge_callback(
+    "tts_audio_cache_files", "Cached TTS audio files on disk", _collect_audio_cache_files
+)
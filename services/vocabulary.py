@@ -1,14 +1,52 @@
-from typing import List, Optional, Dict
+import calendar
+from datetime import date
+from typing import Any, List, Optional, Dict, Tuple
 from fastapi import HTTPException, status
 from core.database import DatabaseManager
-from schemas.vocabulary import VocabularyCreate, VocabularyUpdate, VocabularyResponse, VocabularyListResponse
+from core.cache import VersionedLRUCache, bump_version
+from core.http_cache import Validator, make_etag
+from core.serialization import dumps
+from core.search_index import get_search_index, get_rebuild_interval, normalize_headword
+from schemas.vocabulary import (
+    VocabularyCreate,
+    VocabularyUpdate,
+    VocabularyResponse,
+    VocabularyBulkItem,
+    VocabularyBulkResponse,
+    VocabularySearchItem,
+    VocabularySearchResponse,
+    VocabularyLookupItem,
+    VocabularyLookupResponse,
+    VOCABULARY_ROW,
+)
 from crud import vocabulary as crud_voca
+from crud import word_book_daily as crud_daily
+from crud import test_weeks as crud_test_weeks
+from core.pagination import encode_cursor, decode_cursor
 from schemas.vocabulary import validate_date_format
 
+# POST /bulk 한 번에 받을 수 있는 최대 단어 수 (다건 INSERT 한 문장의 크기 제한)
+MAX_BULK_ITEMS = 1000
+
+# GET/POST /batch 한 번에 조회할 수 있는 최대 ID 수
+MAX_BATCH_IDS = 500
+
+# GET /range 한 번에 조회할 수 있는 최대 날짜 수 (기간 일수 또는 dates 개수)
+MAX_RANGE_DAYS = 31
+
+# 날짜 목록(List[str]) 응답의 다음 페이지 커서를 담는 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# 검색 인덱스 첫 빌드를 기다리는 최대 시간 (초)
+SEARCH_INDEX_WAIT_SECONDS = 30
+
 
 class VocabularyService:
     """단어 관련 비즈니스 로직을 처리하는 서비스 클래스입니다."""
 
+    # 직렬화된 조회 응답 캐시 (요청마다 서비스가 새로 만들어지므로 클래스 속성으로 공유)
+    cache = VersionedLRUCache("vocabulary")
+
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
 
@@ -24,6 +62,8 @@ class VocabularyService:
                         detail="Failed to create or update vocabulary item.",
                     )
 
+                bump_version()
+                get_search_index().upsert(db_word)
                 return VocabularyResponse.from_db_dict(db_word)
         except Exception as e:
             # DB 연결/쿼리 오류 발생 시 500 에러로 변환
@@ -32,6 +72,144 @@ class VocabularyService:
                 detail=f"Database operation failed: {e}",
             )
 
+    def bulk_create_or_update_words(
+        self, words: List[VocabularyCreate]
+    ) -> VocabularyBulkResponse:
+        """
+        여러 단어를 한 번에 저장하거나, 중복 시 업데이트합니다.
+        다건 UPSERT 한 문장 + 결과 SELECT 한 번으로 처리하고 항목별 상태를 반환합니다.
+        같은 요청 안에서 중복된 (date, english_word)는 뒤의 항목이 "updated"로 집계됩니다.
+        """
+        if not words:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="At least one vocabulary item is required.",
+            )
+        if len(words) > MAX_BULK_ITEMS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Too many vocabulary items: {len(words)} (max {MAX_BULK_ITEMS}).",
+            )
+
+        try:
+            with self.db.transaction() as conn:
+                db_words, existing = crud_voca.bulk_upsert_words(conn, words)
+            bump_version()
+            index = get_search_index()
+            for row in db_words:
+                if row is not None:
+                    index.upsert(row)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database operation failed: {e}",
+            )
+
+        items: List[VocabularyBulkItem] = []
+        # 같은 행(WB_ID)으로 저장된 뒤의 항목은 "updated"
+        seen = set(existing)
+        for index, row in enumerate(db_words):
+            if row is None:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to create or update vocabulary item at index {index}.",
+                )
+            items.append(
+                VocabularyBulkItem(
+                    index=index,
+                    status="updated" if row["WB_ID"] in seen else "inserted",
+                    word=VocabularyResponse.from_db_dict(row),
+                )
+            )
+            seen.add(row["WB_ID"])
+
+        inserted_count = sum(1 for item in items if item.status == "inserted")
+        return VocabularyBulkResponse(
+            total=len(items),
+            inserted_count=inserted_count,
+            updated_count=len(items) - inserted_count,
+            items=items,
+        )
+
+    def _get_ready_search_index(self):
+        """
+        검색 인덱스를 반환합니다. 아직 만들어지지 않았으면 지금 만들고,
+        재생성 주기가 지났으면 기존 인덱스로 응답하면서 백그라운드에서 다시 만듭니다.
+        """
+        index = get_search_index()
+        if not index.ready:
+            try:
+                # 시작 시 백그라운드 빌드가 진행 중이면 끝나기를 기다리고, 아니면 직접 빌드
+                if not (index.building and index.wait_ready(SEARCH_INDEX_WAIT_SECONDS)):
+                    index.rebuild_from_db(self.db)
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=f"Search index is not available: {e}",
+                )
+        elif index.needs_rebuild(get_rebuild_interval()):
+            index.rebuild_in_background(self.db)
+        return index
+
+    def search_words(self, query: str, limit: int = 20) -> VocabularySearchResponse:
+        """
+        인메모리 검색 인덱스로 단어를 검색합니다. (DB 조회 없음)
+        한글이 있으면 뜻에서 부분 일치, 없으면 영어 표제어/구의 단어 접두어로 찾고 정확도 순으로 정렬합니다.
+        """
+        query = query.strip()
+        if not query:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Search query must not be empty.",
+            )
+
+        results = self._get_ready_search_index().search(query, limit)
+        items = [
+            VocabularySearchItem(
+                wb_id=doc[0],
+                date=doc[1],
+                english_word=doc[2],
+                korean_meaning=doc[3],
+                match=kind,
+                score=score,
+            )
+            for doc, kind, score in results
+        ]
+        return VocabularySearchResponse(query=query, count=len(items), items=items)
+
+    def suggest_words(self, prefix: str, limit: int = 10) -> List[str]:
+        """영어 표제어 자동완성 후보를 반환합니다. (DB 조회 없음)"""
+        return self._get_ready_search_index().suggest(prefix, limit)
+
+    def lookup_words(
+        self, query: str, max_distance: int = 2, limit: int = 10
+    ) -> VocabularyLookupResponse:
+        """
+        오타를 허용하여 표제어를 찾습니다. (symmetric delete 색인 + 비트 병렬 편집 거리, DB 조회 없음)
+        채점과 같은 정규화(crud.tests.normalize_answer)를 거친 표제어와의 편집 거리로 비교합니다.
+        """
+        normalized = normalize_headword(query)
+        if not normalized:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Lookup query must contain letters or digits.",
+            )
+
+        results = self._get_ready_search_index().lookup(normalized, max_distance, limit)
+        items = [
+            VocabularyLookupItem(
+                wb_id=doc[0],
+                date=doc[1],
+                english_word=doc[2],
+                korean_meaning=doc[3],
+                distance=distance,
+            )
+            for doc, distance in results
+        ]
+        return VocabularyLookupResponse(
+            query=query, normalized_query=normalized, max_distance=max_distance, items=items
+        )
+
     def get_word(self, word_id: int) -> VocabularyResponse:
         """특정 ID의 단어를 조회합니다."""
         with self.db.get_connection() as conn:
@@ -42,37 +220,253 @@ class VocabularyService:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Vocabulary item with ID {word_id} not found.",
                 )
-            return VocabularyResponse.model_validate(db_word)
+            return VocabularyResponse.from_db_dict(db_word)
+
+    def get_words_by_ids(self, word_ids: List[int]) -> Dict[str, Any]:
+        """
+        여러 ID의 단어를 WB_ID IN 조회 한 번으로 가져옵니다.
+        요청 순서를 유지하고(중복 ID는 처음 한 번만), 없는 ID는 missing_ids로 알려 줍니다.
+
+        Returns:
+            VocabularyBatchResponse 형태의 dict (검증 없이 직렬화하는 fast path)
+        """
+        ids = list(dict.fromkeys(word_ids))
+        if not ids:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="At least one vocabulary ID is required.",
+            )
+        if len(ids) > MAX_BATCH_IDS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Too many vocabulary IDs: {len(ids)} (max {MAX_BATCH_IDS}).",
+            )
+
+        with self.db.get_connection() as conn:
+            db_words = crud_voca.get_words_by_ids(conn, ids)
+
+        rows_by_id = {row["WB_ID"]: row for row in db_words}
+        return {
+            "words": [VOCABULARY_ROW.to_dict(rows_by_id[i]) for i in ids if i in rows_by_id],
+            "missing_ids": [i for i in ids if i not in rows_by_id],
+        }
 
     def get_word_list(
-        self, target_date: str, limit: int = 100, offset: int = 0
-    ) -> VocabularyListResponse:
+        self,
+        target_date: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
-        단어 목록을 조회합니다. target_date가 필수입니다.
-        날짜, 대표 source_url, 단어 목록을 포함한 구조화된 응답을 반환합니다.
+        단어 목록을 조회합니다. VocabularyListResponse 형태의 dict를 반환합니다.
+        - target_date: 특정 날짜의 단어 (응답에 날짜와 대표 source_url 포함)
+        - start_date/end_date: target_date 없이 기간(또는 전체) 조회
+        - cursor: 이전 응답의 next_cursor를 넘기면 키셋 방식으로 다음 페이지를 조회
+        - offset: 호환용 (cursor와 함께 쓸 수 없음)
         """
 
         # 날짜 포맷 유효성 검사
         try:
-            validate_date_format(target_date)
+            for value in (target_date, start_date, end_date):
+                if value is not None:
+                    validate_date_format(value)
+            after = None
+            if cursor:
+                last_date, last_id = decode_cursor(cursor, str, int)
+                validate_date_format(last_date)
+                after = (last_date, last_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        if target_date and (start_date or end_date):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="target_date cannot be combined with start_date/end_date.",
+            )
+        if cursor and offset:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="cursor cannot be combined with offset.",
+            )
+
+        with self.db.get_connection() as conn:
+            # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+            db_words = crud_voca.get_words(
+                conn, limit + 1, offset, target_date, start_date, end_date, after
+            )
+            has_more = len(db_words) > limit
+            db_words = db_words[:limit]
+
+            next_cursor = None
+            if has_more:
+                last = db_words[-1]
+                next_cursor = encode_cursor(last["DATE"], last["WB_ID"])
+
+            # 대표 source_url 조회 (날짜별 digest에서 PK 단건 조회)
+            source_url = None
+            if target_date:
+                digest = crud_daily.get_digest(conn, target_date)
+                source_url = digest["SOURCE_URL"] if digest else None
+
+            # 새로운 응답 구조로 반환 (DB 행은 검증 없이 필드 dict로 변환)
+            return {
+                "date": target_date,
+                "source_url": source_url,
+                "words": VOCABULARY_ROW.to_dicts(db_words),
+                "next_cursor": next_cursor,
+            }
+
+    def get_word_list_validator(
+        self,
+        target_date: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Optional[Validator]:
+        """
+        단어 목록의 ETag / Last-Modified를 digest 집계 한 번으로 계산합니다.
+        파라미터가 잘못된 경우 None을 반환하여 본 조회에서 400을 내도록 합니다.
+        """
+        try:
+            for value in (target_date, start_date, end_date):
+                if value is not None:
+                    validate_date_format(value)
+        except ValueError:
+            return None
+
+        with self.db.get_connection() as conn:
+            row = crud_daily.get_validator(conn, target_date, start_date, end_date)
+
+        etag = make_etag(
+            "word_list", target_date, start_date, end_date, limit, offset, cursor,
+            row["DATE_COUNT"], row["WORD_COUNT"], row["LAST_UPDATED_AT"], row["VERSION"],
+        )
+        return etag, row["LAST_UPDATED_AT"]
+
+    def get_word_list_json(
+        self,
+        target_date: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        etag: Optional[str] = None,
+    ) -> bytes:
+        """
+        get_word_list 결과를 JSON bytes로 반환합니다. (읽기 캐시 사용)
+        etag를 키에 포함하면 다른 프로세스의 쓰기도 TTL을 기다리지 않고 반영됩니다.
+        """
+        key = ("word_list", target_date, limit, offset, cursor, start_date, end_date, etag)
+        return self.cache.get_or_set(
+            key,
+            lambda: dumps(
+                self.get_word_list(target_date, limit, offset, cursor, start_date, end_date)
+            ),
+        )
+
+    @staticmethod
+    def _parse_range(
+        start_date: Optional[str], end_date: Optional[str], dates: Optional[str]
+    ) -> Tuple[Optional[str], Optional[str], Optional[List[str]]]:
+        """GET /range 파라미터를 검증하고 (start_date, end_date, 날짜 목록)으로 정리합니다."""
+        try:
+            if dates is not None:
+                if start_date or end_date:
+                    raise ValueError("dates cannot be combined with start_date/end_date.")
+                date_list = sorted({validate_date_format(d.strip()) for d in dates.split(",") if d.strip()})
+                if not date_list:
+                    raise ValueError("dates must contain at least one date.")
+                if len(date_list) > MAX_RANGE_DAYS:
+                    raise ValueError(f"Too many dates: {len(date_list)} (max {MAX_RANGE_DAYS}).")
+                return None, None, date_list
+
+            if not start_date or not end_date:
+                raise ValueError("Either start_date and end_date, or dates is required.")
+            start = date.fromisoformat(validate_date_format(start_date))
+            end = date.fromisoformat(validate_date_format(end_date))
+            if start > end:
+                raise ValueError("start_date must not be after end_date.")
+            if (end - start).days + 1 > MAX_RANGE_DAYS:
+                raise ValueError(f"Date range is too long (max {MAX_RANGE_DAYS} days).")
+            return start_date, end_date, None
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+    def get_word_range(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        dates: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        기간 또는 여러 날짜의 단어를 날짜별로 묶어 반환합니다. (VocabularyRangeResponse 형태의 dict)
+        단어 조회(idx_word_book_date 범위 스캔) 한 번 + digest 조회(PK 범위) 한 번으로 처리합니다.
+        dates로 요청한 날짜는 단어가 없어도 빈 목록으로 포함하고, 기간 조회는 단어가 있는 날짜만 포함합니다.
+        """
+        start_date, end_date, date_list = self._parse_range(start_date, end_date, dates)
+
         with self.db.get_connection() as conn:
-            # 단어 목록 조회
-            db_words = crud_voca.get_words(conn, limit, offset, target_date)
-            words = [VocabularyResponse.from_db_dict(word) for word in db_words]
+            db_words = crud_voca.get_words_for_dates(conn, start_date, end_date, date_list)
+            digests = crud_daily.get_digests(conn, start_date, end_date, date_list)
 
-            # 대표 source_url 조회 (null이 아닌 값 중 하나)
-            source_url = crud_voca.get_representative_source_url(conn, target_date)
+        source_urls = {str(row["DATE"]): row["SOURCE_URL"] for row in digests}
+        groups: Dict[str, List[Dict[str, Any]]] = {d: [] for d in date_list or sorted(source_urls)}
+        for row in db_words:
+            groups.setdefault(str(row["DATE"]), []).append(VOCABULARY_ROW.to_dict(row))
+
+        return {
+            "start_date": start_date or date_list[0],
+            "end_date": end_date or date_list[-1],
+            "word_count": len(db_words),
+            "dates": [
+                {"date": d, "source_url": source_urls.get(d), "words": words}
+                for d, words in sorted(groups.items())
+            ],
+        }
+
+    def get_word_range_validator(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        dates: Optional[str] = None,
+    ) -> Optional[Validator]:
+        """기간/날짜 목록 단어의 ETag / Last-Modified를 digest 집계 한 번으로 계산합니다."""
+        try:
+            start_date, end_date, date_list = self._parse_range(start_date, end_date, dates)
+        except HTTPException:
+            return None
 
-            # 새로운 응답 구조로 반환
-            return VocabularyListResponse(
-                date=target_date,
-                source_url=source_url,
-                words=words
+        with self.db.get_connection() as conn:
+            row = crud_daily.get_validator(
+                conn, start_date=start_date, end_date=end_date, dates=date_list
             )
 
+        etag = make_etag(
+            "word_range", start_date, end_date, date_list,
+            row["DATE_COUNT"], row["WORD_COUNT"], row["LAST_UPDATED_AT"], row["VERSION"],
+        )
+        return etag, row["LAST_UPDATED_AT"]
+
+    def get_word_range_json(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        dates: Optional[str] = None,
+        etag: Optional[str] = None,
+    ) -> bytes:
+        """get_word_range 결과를 JSON bytes로 반환합니다. (읽기 캐시 사용)"""
+        key = ("word_range", start_date, end_date, dates, etag)
+        return self.cache.get_or_set(
+            key,
+            lambda: dumps(self.get_word_range(start_date, end_date, dates)),
+        )
+
     def update_word(
         self, word_id: int, word_data: VocabularyUpdate
     ) -> VocabularyResponse:
@@ -86,6 +480,8 @@ class VocabularyService:
                         status_code=status.HTTP_404_NOT_FOUND,
                         detail=f"Vocabulary item with ID {word_id} not found for update.",
                     )
+                bump_version()
+                get_search_index().upsert(db_word)
                 return VocabularyResponse.from_db_dict(db_word)
         except Exception as e:
             raise HTTPException(
@@ -104,6 +500,8 @@ class VocabularyService:
                         status_code=status.HTTP_404_NOT_FOUND,
                         detail=f"Vocabulary item with ID {word_id} not found for deletion.",
                     )
+                bump_version()
+                get_search_index().remove(word_id)
                 return {"message": "Vocabulary item successfully deleted."}
         except Exception as e:
             raise HTTPException(
@@ -111,36 +509,133 @@ class VocabularyService:
                 detail=f"Database deletion failed: {e}",
             )
 
-    def get_distinct_dates(self, limit: int = 5) -> List[str]:
+    def _resolve_date_range(
+        self, conn, twi_id: Optional[int] = None, month: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        날짜 목록 필터(시험 주차 / 월)를 (start_date, end_date) 범위로 바꿉니다.
+        둘 다 주어지면 교집합을 사용합니다.
         """
-        이번주 토요일 시험 범위의 날짜 목록을 반환합니다.
-        test_week_info의 가장 최근 주차의 start_date ~ end_date 범위 내 날짜만 반환합니다.
+        start_date: Optional[str] = None
+        end_date: Optional[str] = None
+
+        if twi_id is not None:
+            week_info = crud_test_weeks.get_test_week_by_id(conn, twi_id)
+            if not week_info:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Test week with ID {twi_id} not found.",
+                )
+            start_date, end_date = str(week_info["START_DATE"]), str(week_info["END_DATE"])
+
+        if month is not None:
+            try:
+                first = date.fromisoformat(f"{month}-01")
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Month must be in YYYY-MM format.",
+                )
+            last = date(first.year, first.month, calendar.monthrange(first.year, first.month)[1])
+            start_date = max(start_date, str(first)) if start_date else str(first)
+            end_date = min(end_date, str(last)) if end_date else str(last)
+
+        return start_date, end_date
+
+    def get_distinct_dates(
+        self,
+        twi_id: Optional[int] = None,
+        month: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        단어가 있는 날짜 목록(카탈로그)을 최신순으로 반환합니다.
+        word_book_daily digest의 인덱스만 읽으며, 새 날짜는 쓰기 경로에서 digest에 바로 반영됩니다.
 
         Args:
-            limit: 반환할 최대 날짜 개수 (기본값: 5, 사용되지 않음)
+            twi_id: 시험 주차 ID (해당 주차의 start_date ~ end_date 범위만)
+            month: YYYY-MM (해당 월만)
+            source: EBS / BBC (해당 출처만)
+            limit: 반환할 최대 날짜 개수 (None이면 전체, 호환용)
+            cursor: 이전 응답의 다음 페이지 커서
 
         Returns:
-            날짜 문자열 리스트 (YYYY-MM-DD 형식, 최신순)
+            (날짜 문자열 리스트 (YYYY-MM-DD 형식, 최신순), 다음 페이지 커서 또는 None)
         """
+        before = None
+        if cursor:
+            try:
+                (before,) = decode_cursor(cursor, str)
+                validate_date_format(before)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
         try:
             with self.db.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    # 모든 등록된 단어의 날짜를 조회 (최신순)
-                    date_query = """
-                    SELECT DISTINCT DATE
-                    FROM word_book
-                    ORDER BY DATE DESC
-                    """
-                    cursor.execute(date_query)
-                    rows = cursor.fetchall()
-
-                    # 날짜 문자열 리스트로 변환
-                    dates = [str(row["DATE"]) for row in rows]
-
-                    return dates
-
+                start_date, end_date = self._resolve_date_range(conn, twi_id, month)
+                # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+                dates = crud_daily.get_dates(
+                    conn, start_date, end_date, source, before,
+                    limit + 1 if limit is not None else None,
+                )
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to fetch test week dates: {e}",
+                detail=f"Failed to fetch vocabulary dates: {e}",
             )
+
+        next_cursor = None
+        if limit is not None and len(dates) > limit:
+            dates = dates[:limit]
+            next_cursor = encode_cursor(dates[-1])
+        return dates, next_cursor
+
+    def get_distinct_dates_validator(
+        self,
+        twi_id: Optional[int] = None,
+        month: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Optional[Validator]:
+        """
+        날짜 목록의 ETag / Last-Modified를 digest 집계 한 번으로 계산합니다.
+        필터가 잘못되었거나 주차가 없으면 None을 반환하여 본 조회에서 400/404를 내도록 합니다.
+        """
+        with self.db.get_connection() as conn:
+            try:
+                start_date, end_date = self._resolve_date_range(conn, twi_id, month)
+            except HTTPException:
+                return None
+            row = crud_daily.get_validator(conn, None, start_date, end_date, source)
+
+        etag = make_etag(
+            "dates", start_date, end_date, source, limit, cursor,
+            row["DATE_COUNT"], row["MIN_DATE"], row["MAX_DATE"], row["LAST_UPDATED_AT"], row["VERSION"],
+        )
+        return etag, row["LAST_UPDATED_AT"]
+
+    def get_distinct_dates_json(
+        self,
+        twi_id: Optional[int] = None,
+        month: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        etag: Optional[str] = None,
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """
+        get_distinct_dates 결과를 JSON bytes와 응답 헤더(X-Next-Cursor)로 반환합니다. (읽기 캐시 사용)
+        본문은 기존과 같은 날짜 문자열 배열입니다.
+        """
+
+        def render() -> Tuple[bytes, Dict[str, str]]:
+            dates, next_cursor = self.get_distinct_dates(twi_id, month, source, limit, cursor)
+            headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+            return dumps(dates), headers
+
+        return self.cache.get_or_set(("dates", twi_id, month, source, limit, cursor, etag), render)
@@ -0,0 +1,268 @@
+"""
+단어 CSV / NDJSON 가져오기 (POST /vocabulary/import)
+
+요청 본문을 받는 대로 줄 단위로 파싱·검증(VocabularyCreate)하고, chunk_size개마다
+하나의 트랜잭션에서 다건 UPSERT(crud.vocabulary.bulk_upsert_words)로 저장합니다.
+파일 전체를 메모리에 올리지 않으므로 수십만 행도 청크 하나 크기의 메모리로 처리됩니다.
+
+- CSV: 첫 줄은 헤더. date, english_word, korean_meaning, source_url(선택) 컬럼을 사용합니다.
+- NDJSON: 한 줄에 JSON 객체 하나.
+- 두 형식 모두 내보내기(GET /export/vocabulary)의 DB 컬럼명(DATE, WORD_ENGLISH, ...)도 받으며,
+  그 밖의 컬럼(WB_ID, CREATED_AT 등)은 무시합니다.
+- Content-Encoding: gzip 본문은 받으면서 풀어서 처리합니다.
+
+파싱은 워커 스레드에서 동기 코드로 실행하고, 본문 청크는 이벤트 루프에서 받아 넘깁니다.
+DB 쓰기만 db.run_sync로 실행하므로 업로드가 느려도 DB 동시 실행 슬롯을 점유하지 않습니다.
+청크가 여러 개인 대량 가져오기는 끝난 뒤(중간에 실패해도) 검색 인덱스를 한 번 재생성합니다.
+"""
+
+import codecs
+import csv
+import json
+import logging
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import anyio
+import anyio.from_thread
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+
+from core.cache import bump_version
+from core.database import DatabaseManager
+from core.search_index import get_search_index
+from crud import vocabulary as crud_voca
+from schemas.vocabulary import (
+    VocabularyCreate,
+    VocabularyImportRejectedItem,
+    VocabularyImportResponse,
+)
+
+# 청크(트랜잭션) 하나의 기본 행 수
+DEFAULT_IMPORT_CHUNK_SIZE = 1000
+
+# 응답에 담는 거부 사유 최대 개수 (개수는 모두 집계)
+MAX_REJECTED_DETAILS = 100
+
+# 입력 컬럼명 → VocabularyCreate 필드명 (내보내기 파일의 DB 컬럼명 포함)
+FIELD_ALIASES = {
+    "date": "date",
+    "english_word": "english_word",
+    "korean_meaning": "korean_meaning",
+    "source_url": "source_url",
+    "DATE": "date",
+    "WORD_ENGLISH": "english_word",
+    "WORD_MEANING": "korean_meaning",
+    "SOURCE_URL": "source_url",
+}
+
+REQUIRED_FIELDS = {"date", "english_word", "korean_meaning"}
+
+
+def detect_format(content_type: Optional[str]) -> Optional[str]:
+    """Content-Type으로 형식(csv / ndjson)을 추정합니다."""
+    content_type = (content_type or "").lower()
+    if "csv" in content_type:
+        return "csv"
+    if "ndjson" in content_type or "jsonl" in content_type or "json" in content_type:
+        return "ndjson"
+    return None
+
+
+def _validation_reason(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
+
+
+def _to_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    fields = {}
+    for key, value in record.items():
+        field = FIELD_ALIASES.get(key.strip()) if isinstance(key, str) else None
+        if field is None:
+            continue
+        if field == "source_url" and value == "":
+            value = None
+        fields[field] = value
+    return fields
+
+
+class VocabularyImporter:
+    """업로드 하나의 파싱/검증/청크 저장 상태"""
+
+    def __init__(self, db_manager: DatabaseManager, fmt: str, chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE):
+        self.db = db_manager
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.total_rows = 0
+        self.inserted_count = 0
+        self.updated_count = 0
+        self.rejected_count = 0
+        self.chunks = 0
+        self.rejected: List[VocabularyImportRejectedItem] = []
+
+    # --- 본문 → 줄 ---
+
+    @staticmethod
+    def _lines(body: Iterator[bytes], gzipped: bool) -> Iterator[str]:
+        """
+        bytes 청크를 줄(줄바꿈 포함) 단위 문자열로 바꿉니다. (UTF-8, BOM 허용)
+        LF에서만 나눕니다. str.splitlines는 U+2028 등도 줄바꿈으로 보므로, 내보내기 NDJSON이
+        값에 그대로 담는 이 문자들에서 레코드가 잘리게 됩니다. (CRLF의 CR은 줄 끝에 남고 CSV/JSON 파서가 처리)
+        """
+        decompressor = zlib.decompressobj(31) if gzipped else None
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        pending = ""
+        for data in body:
+            if decompressor is not None:
+                data = decompressor.decompress(data)
+            pending += decoder.decode(data)
+            # 마지막 줄이 줄바꿈으로 끝나지 않았으면 다음 청크와 이어 붙임
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line + "\n"
+        if decompressor is not None:
+            pending += decoder.decode(decompressor.flush())
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+    def _records(self, lines: Iterator[str]) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+        """(줄 번호, 레코드, 파싱 오류) 목록"""
+        if self.fmt == "csv":
+            reader = csv.DictReader(lines)
+            if reader.fieldnames is None:
+                return  # 빈 파일
+            columns = {FIELD_ALIASES.get(name.strip()) for name in reader.fieldnames if name}
+            missing = REQUIRED_FIELDS - columns
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"CSV header is missing required columns: {', '.join(sorted(missing))}.",
+                )
+            for record in reader:
+                yield reader.line_num, record, None
+            return
+
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, None, f"invalid JSON: {e.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield line_number, None, "each line must be a JSON object"
+                continue
+            yield line_number, record, None
+
+    # --- 검증 / 저장 ---
+
+    def _reject(self, line: int, reason: str) -> None:
+        self.rejected_count += 1
+        if len(self.rejected) < MAX_REJECTED_DETAILS:
+            self.rejected.append(VocabularyImportRejectedItem(line=line, reason=reason))
+
+    def _write_chunk(self, words: List[VocabularyCreate]) -> None:
+        """청크 하나를 하나의 트랜잭션으로 저장합니다. (db.run_sync로 실행)"""
+        # 첫 청크는 바로 검색 인덱스에 반영하고, 그 이후(대량 가져오기)는 행마다 갱신하는 대신
+        # 가져오기가 끝난 뒤 한 번 백그라운드로 재생성합니다. (결과 행 재조회도 첫 청크만)
+        first_chunk = self.chunks == 0
+        with self.db.transaction() as conn:
+            db_words, existing = crud_voca.bulk_upsert_words(conn, words, return_rows=first_chunk)
+            # 새로 생긴 행 수 = UPSERT 후 키에 해당하는 행 수 - 이전에 있던 행 수 (DB 콜레이션 기준)
+            if first_chunk:
+                stored = len({row["WB_ID"] for row in db_words if row is not None})
+            else:
+                stored = crud_voca.count_words_by_keys(conn, words)
+        bump_version()
+
+        if first_chunk:
+            index = get_search_index()
+            for row in db_words:
+                if row is not None:
+                    index.upsert(row)
+
+        inserted = stored - len(existing)
+        self.inserted_count += inserted
+        self.updated_count += len(words) - inserted
+        self.chunks += 1
+
+    def _flush(self, words: List[VocabularyCreate], first_line: int) -> None:
+        try:
+            anyio.from_thread.run(self.db.run_sync, self._write_chunk, words)
+        except Exception as e:
+            logging.error(f"Vocabulary import failed at chunk {self.chunks + 1}: {e}")
+            # 이전 청크는 이미 커밋됨: 어디까지 반영됐는지 함께 알려 이어서 가져올 수 있게 함
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail={
+                    "message": f"Database operation failed: {e}",
+                    "failed_chunk_first_line": first_line,
+                    "committed_chunks": self.chunks,
+                    "inserted_count": self.inserted_count,
+                    "updated_count": self.updated_count,
+                },
+            )
+
+    def run(self, body: Iterator[bytes], gzipped: bool = False) -> VocabularyImportResponse:
+        """본문을 끝까지 읽어 가져오고 요약을 반환합니다. (워커 스레드에서 실행)"""
+        try:
+            self._import(body, gzipped)
+        finally:
+            # 첫 청크 이후는 검색 인덱스에 반영하지 않았으므로, 중간에 실패해도 커밋된 청크를 반영
+            if self.chunks > 1:
+                get_search_index().rebuild_in_background(self.db)
+
+        return VocabularyImportResponse(
+            total_rows=self.total_rows,
+            inserted_count=self.inserted_count,
+            updated_count=self.updated_count,
+            rejected_count=self.rejected_count,
+            chunks=self.chunks,
+            rejected=self.rejected,
+        )
+
+    def _import(self, body: Iterator[bytes], gzipped: bool) -> None:
+        words: List[VocabularyCreate] = []
+        first_line = 0
+        try:
+            for line, record, error in self._records(self._lines(body, gzipped)):
+                self.total_rows += 1
+                if error is not None:
+                    self._reject(line, error)
+                    continue
+                try:
+                    word = VocabularyCreate(**_to_fields(record))
+                except ValidationError as e:
+                    self._reject(line, _validation_reason(e))
+                    continue
+
+                if not words:
+                    first_line = line
+                words.append(word)
+                if len(words) >= self.chunk_size:
+                    self._flush(words, first_line)
+                    words = []
+        except (UnicodeDecodeError, zlib.error, csv.Error) as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Could not read upload after {self.total_rows} rows: {e}",
+            )
+
+        if words:
+            self._flush(words, first_line)
+
+    async def import_stream(self, body: AsyncIterator[bytes], gzipped: bool = False) -> VocabularyImportResponse:
+        """비동기 요청 본문을 워커 스레드의 동기 파서로 넘겨 가져옵니다."""
+        iterator = body.__aiter__()
+
+        def chunks() -> Iterator[bytes]:
+            while True:
+                try:
+                    yield anyio.from_thread.run(iterator.__anext__)
+                except StopAsyncIteration:
+                    return
+
+        return await anyio.to_thread.run_sync(self.run, chunks(), gzipped)
@@ -0,0 +1,41 @@
+"""
+키셋 커서: 정상 커서는 그대로 풀리고, 값 개수/타입이 틀린 커서는 400으로 거절되는지 확인합니다.
+"""
+
+import base64
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from core.pagination import decode_cursor, encode_cursor
+from services.vocabulary import VocabularyService
+
+
+def raw_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def test_round_trip():
+    assert decode_cursor(encode_cursor("2025-01-06", 42), str, int) == ["2025-01-06", 42]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [["2025-01-06"], [20250106, 42], ["2025-01-06", "42"], ["2025-01-06", True], [["2025-01-06"], 42], {"a": 1}],
+)
+def test_wrong_shape_or_type_is_value_error(values):
+    with pytest.raises(ValueError):
+        decode_cursor(raw_cursor(values), str, int)
+
+
+@pytest.mark.parametrize(
+    "method, values",
+    [("get_word_list", [20250106, 42]), ("get_word_list", [None, 42]), ("get_distinct_dates", [20250106])],
+)
+def test_service_rejects_bad_cursor_with_400(method, values):
+    # 커서 검증은 DB에 접근하기 전에 끝나야 함
+    service = VocabularyService(db_manager=None)
+    with pytest.raises(HTTPException) as exc:
+        getattr(service, method)(cursor=raw_cursor(values))
+    assert exc.value.status_code == 400
@@ -0,0 +1,87 @@
+"""
+검색 인덱스 재생성: DB를 읽는 동안 들어온 점진 갱신이 새 인덱스에 남는지,
+재생성 중에 들어온 재생성 요청이 버려지지 않는지 확인합니다.
+"""
+
+import threading
+from contextlib import contextmanager
+
+from core import search_index as search_index_module
+from core.search_index import SearchIndex
+
+
+def word(wb_id, english, meaning="뜻", day="2025-01-06"):
+    return {"WB_ID": wb_id, "DATE": day, "WORD_ENGLISH": english, "WORD_MEANING": meaning}
+
+
+def english_ids(index, query):
+    return [doc[0] for doc, _, _ in index.search(query)]
+
+
+def test_writes_during_build_are_replayed_after_swap():
+    index = SearchIndex()
+    index.build([word(1, "apple"), word(2, "banana")])
+
+    def snapshot():
+        # 재생성이 행을 읽는 도중 서비스 쓰기가 들어옴
+        yield word(1, "apple")
+        index.upsert(word(3, "cherry"))
+        index.upsert(word(1, "apricot"))
+        index.remove(2)
+        yield word(2, "banana")
+
+    index.build(snapshot())
+
+    assert english_ids(index, "cherry") == [3]
+    assert english_ids(index, "apricot") == [1]
+    assert english_ids(index, "apple") == []
+    assert english_ids(index, "banana") == []
+    assert [doc[0] for doc, _ in index.lookup("chery")] == [3]
+    assert len(index) == 2
+
+
+def test_writes_after_build_are_not_recorded():
+    index = SearchIndex()
+    index.build([word(1, "apple")])
+    index.upsert(word(2, "banana"))
+
+    index.build([word(1, "apple")])
+
+    # 빌드가 끝난 뒤의 쓰기는 다음 빌드에 다시 적용하지 않음 (DB 스냅샷이 기준)
+    assert english_ids(index, "banana") == []
+
+
+def test_rebuild_requested_while_building_runs_again(monkeypatch):
+    index = SearchIndex()
+    started = threading.Event()
+    release = threading.Event()
+    builds = []
+
+    def iter_all_words(conn):
+        builds.append(len(builds) + 1)
+        if len(builds) == 1:
+            started.set()
+            release.wait(5)
+        yield word(len(builds), f"word{len(builds)}")
+
+    class FakeDB:
+        @contextmanager
+        def get_connection(self):
+            yield object()
+
+    monkeypatch.setattr(search_index_module.crud_voca, "iter_all_words", iter_all_words)
+
+    index.rebuild_in_background(FakeDB())
+    assert started.wait(5)
+    index.rebuild_in_background(FakeDB())
+    index.rebuild_in_background(FakeDB())
+    release.set()
+
+    for _ in range(500):
+        if not index.building:
+            break
+        threading.Event().wait(0.01)
+    assert not index.building
+    # 진행 중에 들어온 요청 두 번은 한 번의 후속 재생성으로 합쳐짐
+    assert builds == [1, 2]
+    assert english_ids(index, "word2") == [2]
@@ -0,0 +1,141 @@
+"""
+슬로우 쿼리 로그: 계측 커서로 실행된 문장이 EXPLAIN과 함께 올바르게 기록되는지 확인합니다.
+
+MySQL 없이 실행할 수 있도록 pymysql 커서가 쓰는 커넥션 메서드(literal/escape/encoding)와
+EXPLAIN용 커서만 흉내 내고, 실제 전송(_query)은 커서에서 가로챕니다.
+"""
+
+import json
+
+import pymysql.converters
+import pymysql.cursors
+import pytest
+
+import core.slow_query as slow_query
+from core.instrumentation import InstrumentedDictCursor
+
+UPSERT_SQL = """
+INSERT INTO test_answers (TR_ID, TW_ID, USER_ANSWER, IS_CORRECT)
+VALUES (%s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    USER_ANSWER = VALUES(USER_ANSWER),
+    IS_CORRECT = VALUES(IS_CORRECT);
+"""
+
+
+class FakeExplainCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, args=None):
+        self.connection.explained.append(query)
+
+    def fetchone(self):
+        return ('{"query_block": {"select_id": 1}}',)
+
+
+class FakeConnection:
+    # pymysql Connection.encoding은 파이썬 코덱 이름 (utf8mb4 → utf8)
+    encoding = "utf8"
+
+    def __init__(self):
+        self.sent = []
+        self.explained = []
+
+    def literal(self, obj):
+        return pymysql.converters.escape_item(obj, "utf8mb4")
+
+    def escape(self, obj, mapping=None):
+        return self.literal(obj)
+
+    def cursor(self, cursor_class=None):
+        assert cursor_class is pymysql.cursors.Cursor
+        return FakeExplainCursor(self)
+
+
+class RecordingCursor(InstrumentedDictCursor):
+    """서버로 보내는 대신 문장을 기록하는 계측 커서"""
+
+    def _query(self, q):
+        self.connection.sent.append(q)
+        self.rowcount = 1
+        return 1
+
+
+@pytest.fixture
+def slow_log(tmp_path, monkeypatch):
+    path = tmp_path / "slow_query.log"
+    monkeypatch.setenv("DB_SLOW_QUERY_MS", "0.000001")
+    monkeypatch.setenv("DB_SLOW_QUERY_LOG", str(path))
+    monkeypatch.setattr(slow_query, "_slow_query_log", None)
+
+    def entries():
+        return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    yield entries
+    log = slow_query.get_slow_query_log()
+    if log._logger is not None:
+        for handler in list(log._logger.handlers):
+            handler.close()
+            log._logger.removeHandler(handler)
+
+
+def test_executemany_upsert_is_logged_as_text_without_explain(slow_log):
+    conn = FakeConnection()
+    cursor = RecordingCursor(conn)
+
+    cursor.executemany(UPSERT_SQL, [(1, 1, "café", True), (1, 2, "word", False)])
+
+    # pymysql이 다건 INSERT 한 문장(bytearray)으로 재작성해 execute(bytes, None)를 호출
+    assert len(conn.sent) == 1 and isinstance(conn.sent[0], (bytes, bytearray))
+    [entry] = slow_log()
+    assert entry["function"].endswith("test_executemany_upsert_is_logged_as_text_without_explain")
+    assert entry["statement"] == "INSERT"
+    assert entry["sql"].startswith("INSERT INTO test_answers")
+    assert "'café'" in entry["sql"]
+    assert "b'" not in entry["sql"]
+    assert entry["params"] is None
+    assert entry["explain"] == {"skipped": "multi-row VALUES"}
+    assert conn.explained == []
+
+
+def test_single_row_upsert_is_explained_with_bound_values(slow_log):
+    conn = FakeConnection()
+    cursor = RecordingCursor(conn)
+
+    cursor.execute(UPSERT_SQL, (1, 1, "word", True))
+
+    [entry] = slow_log()
+    assert entry["params"] == [1, 1, "word", True]
+    assert entry["explain"] == {"query_block": {"select_id": 1}}
+    [explained] = conn.explained
+    assert explained.startswith("EXPLAIN FORMAT=JSON \nINSERT INTO test_answers")
+    assert "'word'" in explained and "b'" not in explained
+
+
+def test_executemany_bytes_query_is_explained_without_mogrify(slow_log):
+    conn = FakeConnection()
+    cursor = RecordingCursor(conn)
+
+    # 값이 채워진 bytes 문장은 mogrify 없이 문자열로 바꿔 EXPLAIN
+    cursor.execute(b"SELECT 1", None)
+
+    [entry] = slow_log()
+    assert entry["sql"] == "SELECT 1"
+    assert conn.explained == ["EXPLAIN FORMAT=JSON SELECT 1"]
+
+
+def test_invalid_rotation_settings_fall_back_to_defaults(monkeypatch):
+    monkeypatch.setenv("DB_SLOW_QUERY_LOG_MAX_BYTES", "10MB")
+    monkeypatch.setenv("DB_SLOW_QUERY_LOG_BACKUPS", "five")
+
+    log = slow_query.SlowQueryLog()
+
+    assert log.max_bytes == 10 * 1024 * 1024
+    assert log.backups == 5
@@ -0,0 +1,132 @@
+"""
+주차 단어 목록 응답: 저장된 스냅샷이 맞으면(hit) 그대로 쓰고, 낡았거나(stale) 없으면(missing)
+실시간 조회로 만든 뒤 다시 저장하는지 확인합니다.
+
+MySQL 없이 실행할 수 있도록 crud 함수를 바꿔 끼우고, 서비스에는 커넥션만 흉내 내는 DB를 넘깁니다.
+"""
+
+import gzip
+import json
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import pytest
+
+from core.test_words_snapshot import words_validator
+from crud import test_weeks as crud_test_weeks
+from services import test_weeks as test_week_service
+
+WEEK = {
+    "TWI_ID": 1,
+    "NAME": "1주차",
+    "START_DATE": date(2025, 1, 6),
+    "END_DATE": date(2025, 1, 10),
+    "TEST_START_DATETIME": datetime(2025, 1, 11, 10, 0),
+    "TEST_END_DATETIME": datetime(2025, 1, 11, 10, 25),
+}
+WORDS = [{"TW_ID": 10, "WB_ID": 100, "WORD_ENGLISH": "apple", "WORD_MEANING": "사과", "DATE": date(2025, 1, 6)}]
+
+
+class FakeDB:
+    @contextmanager
+    def get_connection(self):
+        yield object()
+
+    transaction = get_connection
+
+
+@pytest.fixture
+def db(monkeypatch):
+    state = {"snapshot": None, "saved": [], "live_queries": 0}
+
+    def get_test_week_words(conn, twi_id):
+        state["live_queries"] += 1
+        return WORDS
+
+    monkeypatch.setattr(crud_test_weeks, "get_test_week_by_id", lambda conn, twi_id: WEEK if twi_id == 1 else None)
+    monkeypatch.setattr(crud_test_weeks, "get_test_week_words", get_test_week_words)
+    monkeypatch.setattr(crud_test_weeks, "get_words_snapshot", lambda conn, twi_id: state["snapshot"])
+    monkeypatch.setattr(
+        crud_test_weeks, "save_words_snapshot",
+        lambda conn, twi_id, etag, body, body_gzip: state["saved"].append((twi_id, etag, body, body_gzip)),
+    )
+    test_week_service.TestWeekService.cache.clear()
+    yield state
+    test_week_service.TestWeekService.cache.clear()
+
+
+def snapshot_count(result):
+    return test_week_service.SNAPSHOT_REQUESTS.value(result=result)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_missing_snapshot_falls_back_to_live_query_and_stores_it(db, compress):
+    missing = snapshot_count("missing")
+
+    body, headers = test_week_service.TestWeekService(FakeDB()).get_test_week_words_json(1, 'W/"v1"', compress=compress)
+
+    if compress:
+        assert headers["Content-Encoding"] == "gzip"
+        body = gzip.decompress(body)
+    payload = json.loads(body)
+    assert payload["week_name"] == "1주차"
+    assert [word["word_english"] for word in payload["words"]] == ["apple"]
+    assert db["live_queries"] == 1
+    [(twi_id, etag, stored, stored_gzip)] = db["saved"]
+    assert (twi_id, etag) == (1, 'W/"v1"')
+    assert gzip.decompress(stored_gzip) == stored
+    assert json.loads(stored) == payload
+    assert snapshot_count("missing") == missing + 1
+
+
+def test_stale_snapshot_is_replaced(db):
+    db["snapshot"] = {"TWI_ID": 1, "ETAG": 'W/"old"', "BODY": b"old", "BODY_GZIP": gzip.compress(b"old")}
+    stale = snapshot_count("stale")
+
+    body, _ = test_week_service.TestWeekService(FakeDB()).get_test_week_words_json(1, 'W/"v2"')
+
+    assert json.loads(body)["twi_id"] == 1
+    assert db["live_queries"] == 1
+    assert [etag for _, etag, _, _ in db["saved"]] == ['W/"v2"']
+    assert snapshot_count("stale") == stale + 1
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_matching_snapshot_is_served_without_live_query(db, compress):
+    db["snapshot"] = {"TWI_ID": 1, "ETAG": 'W/"v3"', "BODY": b"stored", "BODY_GZIP": b"stored-gzip"}
+    hit = snapshot_count("hit")
+
+    body, headers = test_week_service.TestWeekService(FakeDB()).get_test_week_words_json(1, 'W/"v3"', compress=compress)
+
+    assert body == (b"stored-gzip" if compress else b"stored")
+    assert ("Content-Encoding" in headers) is compress
+    assert db["live_queries"] == 0 and db["saved"] == []
+    assert snapshot_count("hit") == hit + 1
+
+
+def test_without_validator_renders_live_without_storing(db):
+    body, _ = test_week_service.TestWeekService(FakeDB()).get_test_week_words_json(1, None, compress=True)
+
+    assert json.loads(gzip.decompress(body))["words"][0]["tw_id"] == 10
+    assert db["saved"] == []
+
+
+def test_validator_advances_when_a_word_in_the_week_is_deleted():
+    # 삭제 후: 시험 단어가 함께 지워져 MAX(UPDATED_AT)는 줄지만 digest의 VERSION 합과 수정 일시는 커짐
+    before = {
+        "WEEK_UPDATED_AT": datetime(2025, 1, 1), "WORD_COUNT": 2, "MAX_TW_ID": 11,
+        "WORDS_UPDATED_AT": datetime(2025, 1, 5), "WORD_BOOK_UPDATED_AT": datetime(2025, 1, 5),
+        "DAILY_UPDATED_AT": datetime(2025, 1, 5), "DAILY_VERSION": 5,
+    }
+    after = dict(
+        before, WORD_COUNT=1, MAX_TW_ID=10, WORDS_UPDATED_AT=datetime(2025, 1, 2),
+        WORD_BOOK_UPDATED_AT=datetime(2025, 1, 2), DAILY_UPDATED_AT=datetime(2025, 1, 9), DAILY_VERSION=6,
+    )
+    same_second = dict(before, DAILY_VERSION=6)
+
+    etag_before, modified_before = words_validator(1, before)
+    etag_after, modified_after = words_validator(1, after)
+
+    assert etag_after != etag_before
+    assert modified_after > modified_before
+    assert words_validator(1, same_second)[0] != etag_before
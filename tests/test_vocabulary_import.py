@@ -0,0 +1,84 @@
+"""
+단어 가져오기: 내보내기 NDJSON이 그대로 다시 들어오는지, 중간 청크가 실패해도
+커밋된 청크를 검색 인덱스에 반영하도록 재생성을 요청하는지 확인합니다.
+"""
+
+from datetime import date, datetime
+
+import pytest
+from fastapi import HTTPException
+
+from services import vocabulary_import
+from services.export import _CsvEncoder, _NdjsonEncoder
+from services.vocabulary_import import VocabularyImporter
+
+ROW = {
+    "WB_ID": 1,
+    "DATE": date(2025, 1, 6),
+    "WORD_ENGLISH": "line separator para\x85next\x0bvt\x0cff\x1cfs",
+    "WORD_MEANING": "줄 바꿈",
+    "SOURCE_URL": None,
+    "CREATED_AT": datetime(2025, 1, 6, 9, 0),
+    "UPDATED_AT": datetime(2025, 1, 6, 9, 0),
+}
+
+
+def read_records(importer, body):
+    return list(importer._records(importer._lines(iter(body), gzipped=False)))
+
+
+@pytest.mark.parametrize("split_at", [1, 7, 40])
+def test_ndjson_export_round_trips_unicode_line_separators(split_at):
+    exported = _NdjsonEncoder().encode([ROW, dict(ROW, WB_ID=2)])
+    chunks = [exported[i:i + split_at] for i in range(0, len(exported), split_at)]
+
+    records = read_records(VocabularyImporter(None, "ndjson"), chunks)
+
+    assert [(line, error) for line, _, error in records] == [(1, None), (2, None)]
+    assert records[0][1]["WORD_ENGLISH"] == ROW["WORD_ENGLISH"]
+    assert records[1][1]["WORD_MEANING"] == ROW["WORD_MEANING"]
+
+
+def test_csv_export_round_trips_unicode_line_separators():
+    encoder = _CsvEncoder(list(ROW))
+    exported = encoder.header() + encoder.encode([ROW])
+
+    [(line, record, error)] = read_records(VocabularyImporter(None, "csv"), [exported])
+
+    assert error is None
+    assert record["WORD_ENGLISH"] == ROW["WORD_ENGLISH"]
+    assert record["WORD_MEANING"] == ROW["WORD_MEANING"]
+
+
+class RecordingIndex:
+    def __init__(self):
+        self.rebuilds = 0
+
+    def rebuild_in_background(self, db):
+        self.rebuilds += 1
+
+
+@pytest.mark.parametrize("fail_at, rebuilds", [(None, 1), (3, 1), (2, 0), (1, 0)])
+def test_bulk_import_rebuilds_search_index_even_after_a_failed_chunk(monkeypatch, fail_at, rebuilds):
+    index = RecordingIndex()
+    monkeypatch.setattr(vocabulary_import, "get_search_index", lambda: index)
+    importer = VocabularyImporter(None, "csv", chunk_size=1)
+
+    def flush(words, first_line):
+        if importer.chunks + 1 == fail_at:
+            raise HTTPException(status_code=500, detail="chunk failed")
+        importer.chunks += 1
+
+    monkeypatch.setattr(importer, "_flush", flush)
+    body = b"date,english_word,korean_meaning\n" + b"".join(
+        f"2025-01-06,word{i},meaning\n".encode() for i in range(3)
+    )
+
+    if fail_at is None:
+        assert importer.run(iter([body])).chunks == 3
+    else:
+        with pytest.raises(HTTPException):
+            importer.run(iter([body]))
+
+    # 두 번째 청크부터는 인덱스에 바로 반영하지 않으므로, 커밋된 청크가 둘 이상이면 재생성
+    assert index.rebuilds == rebuilds